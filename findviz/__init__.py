@@ -3,9 +3,11 @@ FIND Viewer: FMRI Interactive Navigation and Discovery Viewer
 
 This package provides tools for visualizing and discovering patterns in fMRI data.
 """
+import threading
 
 from flask import Flask
 from findviz.logger_config import setup_logger
+from findviz.routes.json_provider import NumpyJSONProvider
 from findviz.viz.io.cache import Cache
 
 # Import core findviz module
@@ -18,6 +20,8 @@ logger = setup_logger(__name__)
 def create_app(clear_cache=False, testing=False):
     """Application factory function."""
     app = Flask(__name__)
+    # serialize numpy arrays returned by routes without .tolist()
+    app.json = NumpyJSONProvider(app)
 
     # Clean up any existing cache on startup
     if clear_cache:
@@ -55,6 +59,14 @@ def create_app(clear_cache=False, testing=False):
     app.register_blueprint(preprocess_bp)
     app.register_blueprint(logs_bp)
 
+    # build static viewer data in the background, so that it is ready
+    # before the viewer's first request
+    if not testing:
+        from findviz.routes.viewer.color import get_colormap_data
+        threading.Thread(
+            target=get_colormap_data, name='findviz-warmup', daemon=True
+        ).start()
+
     return app
 
 # Version information
@@ -247,8 +247,9 @@ def main():
     port = args.port if args.port else find_free_port()
     # open browser (wait 1 second to ensure server is running)
     Timer(1, open_browser, args=(port,)).start()
-    # run app
-    app.run(debug=False, port=port)
+    # run app. Viewer state lives in this process (see routes.shared), so
+    # the server must stay single-process; requests are served on threads
+    app.run(debug=False, port=port, threaded=True)
 
 
 def find_free_port():
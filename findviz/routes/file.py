@@ -5,6 +5,7 @@ from findviz.logger_config import setup_logger
 from flask import Blueprint, request, make_response, jsonify
 from findviz.routes.shared import data_manager
 from findviz.routes.utils import convert_value, Routes
+from findviz.routes.viewer.gifti import get_gifti_data_matrix
 from findviz.viz import exception
 from findviz.viz.io.cache import Cache
 from findviz.viz.io.nifti import NiftiFiles
@@ -162,6 +163,14 @@ def upload():
             right_mesh=uploads['gifti'][GiftiFiles.RIGHT_MESH.value]
         )
         logger.info("Gifti data manager state created successfully")
+        # stack the functional data matrices now, rather than on the first
+        # timepoint request of the viewer
+        for func_img in (
+            uploads['gifti'][GiftiFiles.LEFT_FUNC.value],
+            uploads['gifti'][GiftiFiles.RIGHT_FUNC.value]
+        ):
+            if func_img is not None:
+                get_gifti_data_matrix(func_img)
     # initialize data manager with or without time series data
     data_manager.ctx.add_timeseries(uploads['ts'])
     if file_upload.ts_status:
@@ -0,0 +1,80 @@
+"""JSON provider for route responses
+
+Serializes numpy arrays and scalars returned by route handlers directly,
+without converting them to nested Python lists first. orjson (a declared
+dependency) is used, as its numpy path iterates the array buffer in C, also
+for parsing request bodies. If it cannot be imported, the stdlib json
+module is used with a numpy-aware default.
+"""
+from typing import Any
+
+import numpy as np
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def numpy_default(obj: Any) -> Any:
+    """
+    Convert numpy objects that the JSON encoder cannot handle natively.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to convert
+
+    Returns
+    -------
+    Any
+        JSON-serializable representation of obj. NaN values in float
+        arrays are replaced by None.
+    """
+    if isinstance(obj, np.ndarray):
+        if np.issubdtype(obj.dtype, np.floating):
+            nan_mask = np.isnan(obj)
+            # no object array needed if there are no NaN values
+            if nan_mask.any():
+                return np.where(nan_mask, None, obj).tolist()
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return DefaultJSONProvider.default(obj)
+
+
+class NumpyJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider with native numpy array serialization"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None:
+            kwargs.setdefault('default', numpy_default)
+            return super().dumps(obj, **kwargs)
+        return self._orjson_dumps(obj).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # defer to the stdlib for non-standard input (e.g. NaN literals)
+            # and its error messages
+            return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._orjson_dumps(obj), mimetype=self.mimetype
+        )
+
+    def _orjson_dumps(self, obj: Any) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=numpy_default, option=option)
+
@@ -0,0 +1,155 @@
+"""
+Typed request schemas for route parameters
+
+Each schema is a frozen dataclass whose field annotations determine how the
+raw request value is converted (see findviz.routes.utils.parse_request).
+Values may arrive as form/query strings or, for application/json bodies,
+as already-typed JSON values.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Literal, Optional
+
+
+@dataclass(frozen=True)
+class FmriDataRangeRequest:
+    """GET_FMRI_DATA_RANGE parameters"""
+    start: int
+    end: int
+    warm_only: bool = False
+
+
+@dataclass(frozen=True)
+class UpdateLocationRequest:
+    """UPDATE_LOCATION parameters"""
+    click_coords: Dict[str, Any]
+    slice_name: str
+
+
+@dataclass(frozen=True)
+class UpdateMontageSliceDirRequest:
+    """UPDATE_MONTAGE_SLICE_DIR parameters"""
+    montage_slice_dir: Literal['x', 'y', 'z']
+
+
+@dataclass(frozen=True)
+class UpdateMontageSliceIdxRequest:
+    """UPDATE_MONTAGE_SLICE_IDX parameters"""
+    slice_name: str
+    slice_idx: int
+
+
+@dataclass(frozen=True)
+class UpdateTimepointRequest:
+    """UPDATE_TIMEPOINT parameters"""
+    time_point: int
+
+
+@dataclass(frozen=True)
+class UpdateTrRequest:
+    """UPDATE_TR parameters"""
+    tr: Optional[float]
+
+
+@dataclass(frozen=True)
+class AddAnnotationMarkerRequest:
+    """ADD_ANNOTATION_MARKER parameters"""
+    marker: int
+
+
+@dataclass(frozen=True)
+class ChangeTaskConvolutionRequest:
+    """CHANGE_TASK_CONVOLUTION parameters"""
+    convolution: bool
+
+
+@dataclass(frozen=True)
+class CheckTsPreprocessedRequest:
+    """CHECK_TS_PREPROCESSED parameters"""
+    label: str
+    ts_type: Literal['timecourse', 'task']
+
+
+@dataclass(frozen=True)
+class PlotOptionsLabelRequest:
+    """GET_TASK_DESIGN_PLOT_OPTIONS and GET_TIMECOURSE_PLOT_OPTIONS parameters"""
+    label: Optional[str]
+
+
+@dataclass(frozen=True)
+class TimecourseShiftHistoryRequest:
+    """GET_TIMECOURSE_SHIFT_HISTORY parameters"""
+    label: str
+    source: Literal['timecourse', 'task']
+
+
+@dataclass(frozen=True)
+class MoveAnnotationSelectionRequest:
+    """MOVE_ANNOTATION_SELECTION parameters"""
+    direction: Literal['left', 'right']
+
+
+@dataclass(frozen=True)
+class ResetTimecourseShiftRequest:
+    """RESET_TIMECOURSE_SHIFT parameters"""
+    label: str
+    change_type: Literal['constant', 'scale']
+    source: Literal['timecourse', 'task']
+
+
+@dataclass(frozen=True)
+class UpdateTimecourseShiftRequest:
+    """UPDATE_TIMECOURSE_SHIFT parameters"""
+    label: str
+    source: Literal['timecourse', 'task']
+    change_type: Literal['constant', 'scale']
+    change_direction: Literal['increase', 'decrease']
+
+
+@dataclass(frozen=True)
+class UpdateDistancePlotOptionsRequest:
+    """UPDATE_DISTANCE_PLOT_OPTIONS parameters"""
+    distance_plot_options: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UpdateFmriPlotOptionsRequest:
+    """UPDATE_FMRI_PLOT_OPTIONS parameters"""
+    fmri_plot_options: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UpdateAnnotationMarkerPlotOptionsRequest:
+    """UPDATE_ANNOTATION_MARKER_PLOT_OPTIONS parameters"""
+    annotation_marker_plot_options: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UpdateNiftiViewStateRequest:
+    """UPDATE_NIFTI_VIEW_STATE parameters"""
+    view_state: Literal['ortho', 'montage']
+
+
+@dataclass(frozen=True)
+class UpdateTaskDesignPlotOptionsRequest:
+    """UPDATE_TASK_DESIGN_PLOT_OPTIONS parameters"""
+    label: str
+    task_design_plot_options: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UpdateTimecourseGlobalPlotOptionsRequest:
+    """UPDATE_TIMECOURSE_GLOBAL_PLOT_OPTIONS parameters"""
+    timecourse_global_plot_options: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UpdateTimecoursePlotOptionsRequest:
+    """UPDATE_TIMECOURSE_PLOT_OPTIONS parameters"""
+    label: str
+    timecourse_plot_options: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class UpdateTimemarkerPlotOptionsRequest:
+    """UPDATE_TIMEMARKER_PLOT_OPTIONS parameters"""
+    timemarker_plot_options: Dict[str, Any]
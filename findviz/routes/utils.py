@@ -1,13 +1,28 @@
 """Utility Modules for route input handling"""
+import gzip
+import hashlib
+import json
+import struct
+import threading
+import types
+import weakref
+import zlib
+
+from collections import OrderedDict
+from dataclasses import MISSING, fields
 from enum import Enum
-from functools import wraps
-from typing import Union, Callable, TypeVar, ParamSpec, List, Type
+from functools import lru_cache, wraps
+from typing import (
+    Any, Dict, Hashable, Union, Callable, TypeVar, ParamSpec, Iterator, List, Literal, Optional, Tuple, Type,
+    get_args, get_origin, get_type_hints
+)
 
 
 import numpy as np
 
-from flask import make_response, request
+from flask import Response, current_app, make_response, request, stream_with_context
 
+from findviz.routes.json_provider import numpy_default
 from findviz.routes.shared import data_manager
 from findviz.viz.exception import DataRequestError
 from findviz.logger_config import setup_logger
@@ -19,6 +34,30 @@ logger = setup_logger(__name__)
 # Type variables for generic function signatures
 P = ParamSpec('P')
 R = TypeVar('R')
+S = TypeVar('S')
+
+# mimetype for binary array responses (see encode_binary_payload)
+BINARY_MIMETYPE = 'application/octet-stream'
+
+# WSGI environ key for the merged request parameters (see request_params)
+REQUEST_PARAMS_KEY = 'findviz.request_params'
+
+# response compression settings (see compress_response)
+COMPRESS_LEVEL = 3
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_MIMETYPES = ('application/json', BINARY_MIMETYPE)
+
+# number of contexts per route kept by cached_response
+RESPONSE_CACHE_SIZE = 8
+
+# number of distinct form strings whose conversion is cached (see
+# convert_value)
+CONVERT_VALUE_CACHE_SIZE = 2048
+
+# largest mask (elements) built in reused per-thread buffers
+# (see mask_range_with_nan)
+MASK_BUFFER_MAX_SIZE = 4 * 1024 * 1024
+_mask_buffers_local = threading.local()
 
 class Routes(Enum):
     ADD_ANNOTATION_MARKER='/add_annotation_marker'
@@ -41,6 +80,7 @@ class Routes(Enum):
     GET_DISTANCE_DATA='/get_distance_data'
     GET_DISTANCE_PLOT_OPTIONS='/get_distance_plot_options'
     GET_FMRI_DATA='/get_fmri_data'
+    GET_FMRI_DATA_RANGE='/get_fmri_data_range'
     GET_FMRI_PLOT_OPTIONS='/get_fmri_plot_options'
     GET_HEADER='/get_header'
     GET_LAST_TIMECOURSE='/get_last_timecourse'
@@ -114,17 +154,26 @@ def convert_value(
     Returns:
         Union[str, int, float, None]: converted value
     """
-    # check if value is a boolean
-    if isinstance(value, bool):
-        return value
-    # Check for booleans passed as strings
+    # only strings need converting (e.g. json values are already typed)
     if isinstance(value, str):
-        if value.lower() == 'true':
-            return True
-        elif value.lower() == 'false':
-            return False
+        return _convert_string_value(value)
+    return value
+
+
+# form values come from a small set of strings (booleans, directions,
+# slider values, labels), so conversions are reused. Converted values are
+# immutable, so cached results can be shared
+@lru_cache(maxsize=CONVERT_VALUE_CACHE_SIZE)
+def _convert_string_value(value: str) -> Union[str, bool, int, float, None]:
+    """Convert a string from form data to a Python type"""
+    # Check for booleans passed as strings
+    lower_value = value.lower()
+    if lower_value == 'true':
+        return True
+    elif lower_value == 'false':
+        return False
     # Check for None
-    if value.lower() == 'null' or value.lower() == 'none' or value == '':
+    if lower_value == 'null' or lower_value == 'none' or value == '':
         return None
     # Try to convert to integer
     try:
@@ -140,25 +189,32 @@ def convert_value(
     return value
 
 
+def _switch_request_context():
+    """Switch the data manager context from the request context_id.
+
+    Returns an error response if the context is invalid, else None.
+    """
+    # Get context_id from query parameters, form data or json body
+    context_id = request_params().get('context_id')
+
+    # Switch to the requested context
+    try:
+        data_manager.switch_context(context_id)
+    except ValueError as e:
+        logger.error(f"Invalid context requested: {context_id}")
+        return make_response({'error': str(e)}, 400)
+    return None
+
+
 def handle_context() -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator to handle context switching for routes.
     """
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            # Get context_id from query parameters or form data
-            context_id = request.args.get(
-                'context_id',
-                request.form.get('context_id')
-            )
-            
-            # Switch to the requested context
-            try:
-                data_manager.switch_context(context_id)
-            except ValueError as e:
-                logger.error(f"Invalid context requested: {context_id}")
-                return make_response({'error': str(e)}, 400)
-                
+            error_response = _switch_request_context()
+            if error_response is not None:
+                return error_response
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -181,7 +237,8 @@ def handle_route_errors(
     log_msg : str, optional
         Message to log on success
     fmri_file_type : Union[str, Callable[[], str]], optional
-        FMRI file type for DataRequestError. Pass a callable to get the fmri file type dynamically
+        FMRI file type for DataRequestError. Pass a callable to get the fmri file type dynamically.
+        The callable is only evaluated when an error response is built.
     route : Enum, optional
         Route name as an Enum for DataRequestError
     route_parameters : List[str], optional
@@ -195,82 +252,725 @@ def handle_route_errors(
         Decorated route function that handles errors consistently
 
     """
+    # Snapshot decorator arguments once at import time so the per-request
+    # path does no list/attribute setup
+    required_parameters = tuple(route_parameters or ())
+    handled_exceptions = tuple(custom_exceptions or ())
+    route_value = route.value if route is not None else None
+
+    def current_file_type() -> str:
+        """Resolve the fmri file type (only needed to report errors)"""
+        return fmri_file_type() if callable(fmri_file_type) else fmri_file_type
+
+    def parameter_error_response(param: str):
+        """Log and build the response for a missing or invalid parameter"""
+        data_error = DataRequestError(
+            message=f'{error_msg}.',
+            fmri_file_type=current_file_type(),
+            route=route_value,
+            input_field=param
+        )
+        logger.error(data_error)
+        return make_response(data_error.message, 400)
+
+    def check_parameters():
+        """Return an error response if a required route parameter is missing"""
+        if not required_parameters:
+            return None
+        provided = request_params()
+        # check if all expected route parameters are provided
+        for param in required_parameters:
+            if param not in provided:
+                # Handle missing required fields
+                return parameter_error_response(param)
+        return None
+
+    def success_response(result):
+        """Log success and build the response from the route result"""
+        # Log success message if provided
+        if log_msg:
+            logger.info(log_msg)
+
+        # Handle different return types
+        if isinstance(result, tuple):
+            return make_response(*result)
+        return make_response(result, 200)
+
+    def error_response(e: Exception):
+        """Log the exception and build the error response"""
+        return _route_error_response(
+            e, error_msg, route_value, current_file_type(), handled_exceptions
+        )
+
     def decorator(func: Callable[P, R]) -> Callable[P, tuple[Union[R, str], int]]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> tuple[Union[R, str], int]:
-             # Get file type at runtime if it's a callable
-            current_file_type = fmri_file_type() if callable(fmri_file_type) else fmri_file_type
-
-            # check if route parameters are provided
-            if route_parameters:
-                # check if all expected route parameters are provided
-                for param in route_parameters:
-                    if (param not in request.form) and (param not in request.args):
-                        # Handle missing required fields
-                        data_error = DataRequestError(
-                            message=f'{error_msg}.',
-                            fmri_file_type=current_file_type,
-                            route=route.value,
-                            input_field=param
-                        )
-                        logger.error(data_error)
-                        return make_response(data_error.message, 400)
+            missing_response = check_parameters()
+            if missing_response is not None:
+                return missing_response
 
             try:
                 # Execute the route function
                 result = func(*args, **kwargs)
+                return success_response(result)
+            except InvalidParameterError as e:
+                # Handle request values that do not match the schema
+                return parameter_error_response(e.field)
+            except Exception as e:
+                return error_response(e)
+
+        return wrapper
+
+    return decorator
+
+def handle_getter_route(
+    error_msg: str,
+    route: Enum,
+    fmri_file_type: Union[str, Callable[[], str]] = None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Lightweight replacement for handle_context() + handle_route_errors() on
+    read-only getter routes without parameters. The context switch and
+    error handling run in a single wrapper, and no success message is
+    logged. Errors produce the same responses as handle_route_errors.
 
-                # Log success message if provided
-                if log_msg:
-                    logger.info(log_msg)
-                
-                # Handle different return types
-                if isinstance(result, tuple):
-                    return make_response(*result)
-                return make_response(result, 200)
+    Parameters
+    ----------
+    error_msg : str
+        Base error message for the route
+    route : Enum
+        Route name as an Enum for error responses
+    fmri_file_type : Union[str, Callable[[], str]], optional
+        FMRI file type for error responses. A callable is only evaluated
+        when an error response is built.
 
+    Returns
+    -------
+    Callable
+        Decorated route function
+    """
+    route_value = route.value
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            error_response = _switch_request_context()
+            if error_response is not None:
+                return error_response
+            try:
+                result = func(*args, **kwargs)
             except Exception as e:
-                # check if exception is in custom exceptions
-                # log as error and return 400 to handle in frontend
-                if custom_exceptions:
-                    for custom_exception in custom_exceptions:
-                        if isinstance(e, custom_exception):
-                            logger.error(e)
-                            # Create a more structured error response
-                            error_response = {
-                                'error': e.message if hasattr(e, 'message') else str(e),
-                                'type': e.__class__.__name__,
-                                'route': route.value,
-                                'context': {
-                                    'file_type': current_file_type,
-                                    'route': route.value,
-                                }
-                            }
-                            return make_response(error_response, 400)
-                        
-                # log as critical and return 500 to handle in frontend
-                logger.critical(
-                    f"{error_msg}: {str(e)}", 
-                    exc_info=True
+                file_type = fmri_file_type() if callable(fmri_file_type) else fmri_file_type
+                return _route_error_response(e, error_msg, route_value, file_type)
+            if isinstance(result, tuple):
+                return make_response(*result)
+            return make_response(result, 200)
+        return wrapper
+    return decorator
+
+
+def _route_error_response(
+    e: Exception,
+    error_msg: str,
+    route_value: str,
+    file_type: str,
+    handled_exceptions: Tuple[Type[Exception], ...] = (),
+):
+    """Log a route exception and build the structured error response"""
+    # check if exception is in custom exceptions
+    # log as error and return 400 to handle in frontend
+    if handled_exceptions and isinstance(e, handled_exceptions):
+        logger.error(e)
+        # Create a more structured error response
+        error_response = {
+            'error': e.message if hasattr(e, 'message') else str(e),
+            'type': e.__class__.__name__,
+            'route': route_value,
+            'context': {
+                'file_type': file_type,
+                'route': route_value,
+            }
+        }
+        return make_response(error_response, 400)
+
+    # log as critical and return 500 to handle in frontend
+    logger.critical(
+        f"{error_msg}: {str(e)}", 
+        exc_info=True
+    )
+
+    # Create a more structured error response for critical errors
+    error_response = {
+        'error': error_msg,
+        'details': str(e),
+        'type': e.__class__.__name__,
+        'route': route_value,
+        'context': {
+            'file_type': file_type,
+            'route': route_value,
+        }
+    }
+    return make_response(error_response, 500)
+
+
+class SourceKeyedCache:
+    """
+    Thread-safe LRU cache for data derived from large source objects (e.g.
+    fmri images). Entries are keyed on a hashable key and validated against
+    the identity of their source objects, which are held by weak reference:
+    an entry is only returned if every source is still the same object, so
+    replacing an image (e.g. after preprocessing) invalidates its entries
+    without explicit bookkeeping, and cached entries never keep an image
+    alive.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached entries
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, sources: Tuple[Any, ...]) -> Optional[Any]:
+        """Return the cached value for key and sources, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            refs, value = entry
+            if not _sources_match(refs, sources):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, sources: Tuple[Any, ...], value: Any) -> None:
+        """Cache value for key and sources, evicting the oldest entry if full"""
+        refs = tuple(
+            None if source is None else weakref.ref(source)
+            for source in sources
+        )
+        with self._lock:
+            self._entries[key] = (refs, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _sources_match(refs: Tuple[Any, ...], sources: Tuple[Any, ...]) -> bool:
+    """Check that weak references point to the given source objects"""
+    if len(refs) != len(sources):
+        return False
+    for ref, source in zip(refs, sources):
+        if ref is None:
+            if source is not None:
+                return False
+        elif ref() is not source:
+            return False
+    return True
+
+
+class UpdateCoalescer:
+    """
+    Coalesce bursts of state updates (e.g. location updates while dragging
+    the crosshair). Updates are applied one at a time per key, and an
+    update that is superseded by a newer update for the same key while
+    waiting for its turn is skipped, as its state would be overwritten
+    immediately. A skipped update waits until a newer update is applied, so
+    every request of a burst returns with the latest state applied. If the
+    newer update fails, its exception is raised in the skipped updates too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # notified when an update is applied
+        self._applied_cond = threading.Condition(self._lock)
+        self._latest: Dict[Hashable, int] = {}
+        # sequence number and exception (None on success) of the last
+        # applied update per key
+        self._applied: Dict[Hashable, Tuple[int, Optional[BaseException]]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+
+    def submit(self, key: Hashable, update: Callable[..., Any], *args) -> bool:
+        """
+        Apply update(*args), unless a newer update for key arrives first.
+        In that case, wait until a newer update has been applied.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key of the state being updated
+        update : Callable[..., Any]
+            Update function
+        *args
+            Arguments passed to update
+
+        Returns
+        -------
+        bool
+            Whether the update was applied (rather than superseded)
+
+        Raises
+        ------
+        Exception
+            Exception raised by the update, or by the newer update that
+            superseded it
+        """
+        with self._lock:
+            seq = self._latest.get(key, 0) + 1
+            self._latest[key] = seq
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            superseded = self._latest[key] != seq
+            if not superseded:
+                error = None
+                try:
+                    update(*args)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    # release waiting updates, even if the update failed
+                    with self._applied_cond:
+                        self._applied[key] = (seq, error)
+                        self._applied_cond.notify_all()
+        if superseded:
+            with self._applied_cond:
+                self._applied_cond.wait_for(
+                    lambda: self._applied.get(key, (0, None))[0] > seq
                 )
-                
-                # Create a more structured error response for critical errors
-                error_response = {
-                    'error': error_msg,
-                    'details': str(e),
-                    'type': e.__class__.__name__,
-                    'route': route.value,
-                    'context': {
-                        'file_type': current_file_type,
-                        'route': route.value,
-                    }
-                }
-                return make_response(error_response, 500)
-            
+                error = self._applied[key][1]
+            if error is not None:
+                raise error
+        return not superseded
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert nested dicts/lists into hashable tuples for use as a cache key"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def conditional_response() -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator to add a weak ETag to successful GET responses and return
+    304 Not Modified when the request's If-None-Match matches.
+
+    Must be placed above handle_context() so it receives the final response.
+    The ETag is a blake2b digest of the response media type and body, so a
+    changed value always produces a new tag, and the JSON and binary
+    representations of routes that negotiate on Accept (see wants_binary)
+    never share a tag. Responses vary on Accept for the same reason. An
+    ETag already set on the response (e.g. by cached_response) is kept.
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            response = make_response(func(*args, **kwargs))
+            if response.status_code != 200 or response.direct_passthrough:
+                return response
+            if response.get_etag()[0] is None:
+                response.set_etag(
+                    _body_etag(response.get_data(), response.mimetype),
+                    weak=True
+                )
+            # always revalidate with the server before using a cached copy
+            response.headers['Cache-Control'] = 'no-cache'
+            response.vary.add('Accept')
+            return response.make_conditional(request)
         return wrapper
+    return decorator
+
+def _body_etag(body: bytes, mimetype: str) -> str:
+    """Digest of a response media type and body used as its ETag"""
+    digest = hashlib.blake2b(mimetype.encode(), digest_size=16)
+    digest.update(body)
+    return digest.hexdigest()
+
 
+def cached_response(
+    sources: Callable[[], Tuple[Any, ...]]
+) -> Callable[[Callable[P, R]], Callable[P, Response]]:
+    """Decorator to cache the serialized JSON response of a route whose
+    output only changes when its source objects are replaced (e.g. values
+    fixed for a given visualization state). The body and its ETag are
+    computed once and reused while the sources are the same objects (see
+    SourceKeyedCache).
+
+    Must be placed below handle_context(), so that sources are read from
+    the requested context, and above handle_route_errors(), so that error
+    responses are not cached.
+
+    Parameters
+    ----------
+    sources : Callable[[], Tuple[Any, ...]]
+        Returns the objects that determine the response
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, Response]:
+        cache = SourceKeyedCache(maxsize=RESPONSE_CACHE_SIZE)
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Response:
+            key = data_manager.ctx.context_id
+            response_sources = sources()
+            entry = cache.get(key, response_sources)
+            if entry is None:
+                response = make_response(func(*args, **kwargs))
+                if response.status_code != 200 or response.is_streamed:
+                    return response
+                body = response.get_data()
+                entry = (
+                    body, response.mimetype,
+                    _body_etag(body, response.mimetype)
+                )
+                cache.put(key, response_sources, entry)
+            body, mimetype, etag = entry
+            response = Response(body, mimetype=mimetype)
+            response.set_etag(etag, weak=True)
+            return response
+        return wrapper
     return decorator
 
+
+def wants_binary() -> bool:
+    """Check whether the client prefers a binary (octet-stream) response"""
+    best = request.accept_mimetypes.best_match(
+        ['application/json', BINARY_MIMETYPE]
+    )
+    return best == BINARY_MIMETYPE
+
+
+def compress_response(response: Response) -> Response:
+    """
+    Gzip-compress a JSON or binary response if the client accepts it.
+    Intended to be registered as a blueprint after_request hook. Streamed
+    responses are compressed chunk by chunk as they are sent.
+
+    Parameters
+    ----------
+    response : Response
+        Outgoing response
+
+    Returns
+    -------
+    Response
+        The response, compressed in place when applicable
+    """
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+        or response.mimetype not in COMPRESS_MIMETYPES
+    ):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.accept_encodings:
+        return response
+
+    if response.is_streamed:
+        response.response = _gzip_chunks(response.iter_encoded())
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+
+def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Gzip-compress an iterator of byte chunks"""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_json_chunks(obj: Any, depth: int = 2) -> Iterator[str]:
+    """
+    Serialize obj as JSON in chunks. Dictionaries are written key by key
+    (and lists item by item) up to the given nesting depth, so only one
+    value's JSON text is held in memory at a time.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to serialize
+    depth : int, optional
+        Number of dictionary levels to split into chunks, by default 2
+
+    Yields
+    ------
+    str
+        Consecutive pieces of the JSON document
+    """
+    if depth > 0 and isinstance(obj, list):
+        yield '['
+        for i, value in enumerate(obj):
+            yield (',' if i else '')
+            yield from iter_json_chunks(value, depth - 1)
+        yield ']'
+        return
+    if depth <= 0 or not isinstance(obj, dict):
+        yield current_app.json.dumps(obj)
+        return
+    yield '{'
+    for i, (key, value) in enumerate(obj.items()):
+        yield (',' if i else '') + json.dumps(str(key)) + ':'
+        yield from iter_json_chunks(value, depth - 1)
+    yield '}'
+
+
+def stream_json_response(obj: dict, depth: int = 2) -> Response:
+    """
+    Build a chunked JSON response that serializes obj lazily while it is
+    sent (see iter_json_chunks).
+
+    Parameters
+    ----------
+    obj : dict
+        Payload to serialize
+    depth : int, optional
+        Number of nesting levels to split into chunks, by default 2
+
+    Returns
+    -------
+    Response
+        Streamed application/json response
+    """
+    return Response(
+        stream_with_context(iter_json_chunks(obj, depth)),
+        mimetype='application/json'
+    )
+
+
+def encode_binary_payload(payload: Any) -> bytes:
+    """
+    Encode a payload containing numpy arrays as a binary message. Arrays
+    are written as raw little-endian float32 buffers (NaN preserved) and
+    the remainder of the payload as a JSON header.
+
+    Layout::
+
+        uint32 (little-endian) header length
+        header: utf-8 JSON {'data': ..., 'buffers': [...]}
+        zero padding to a 4-byte boundary
+        array buffers, each starting on a 4-byte boundary
+
+    In 'data', each array is replaced by {'__buffer__': i}, where i indexes
+    'buffers'. Each buffer entry holds its 'dtype', 'shape' and byte
+    'offset' from the start of the array buffers.
+
+    Parameters
+    ----------
+    payload : Any
+        Payload to encode, e.g. a dict or a single array. Arrays may be
+        nested in dicts and lists.
+
+    Returns
+    -------
+    bytes
+        Encoded binary message
+    """
+    arrays = []
+
+    def replace_arrays(obj):
+        if isinstance(obj, np.ndarray) and obj.dtype.kind in 'fiub':
+            arrays.append(np.ascontiguousarray(obj, dtype='<f4'))
+            return {'__buffer__': len(arrays) - 1}
+        if isinstance(obj, dict):
+            return {key: replace_arrays(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [replace_arrays(value) for value in obj]
+        return obj
+
+    data = replace_arrays(payload)
+
+    buffers = []
+    offset = 0
+    for arr in arrays:
+        buffers.append(
+            {'dtype': 'float32', 'shape': arr.shape, 'offset': offset}
+        )
+        offset += arr.nbytes
+    header = json.dumps(
+        {'data': data, 'buffers': buffers}, default=numpy_default
+    ).encode('utf-8')
+
+    # join the parts into the message, so that each array is copied once
+    # and e.g. both hemispheres of a gifti timepoint share one buffer
+    header_len = len(header)
+    padding = bytes(_align(4 + header_len) - 4 - header_len)
+    return b''.join(
+        [struct.pack('<I', header_len), header, padding]
+        + [arr.reshape(-1).data for arr in arrays]
+    )
+
+
+def _align(n: int, alignment: int = 4) -> int:
+    """Round n up to the nearest multiple of alignment"""
+    return (n + alignment - 1) // alignment * alignment
+
+class InvalidParameterError(ValueError):
+    """Request parameter value that cannot be converted to its schema type
+    (see parse_request)"""
+
+    def __init__(self, field: str, value: Any):
+        self.field = field
+        super().__init__(f'Invalid value for {field}: {value!r}')
+
+
+def parse_request(schema: Type[S]) -> S:
+    """
+    Parse route parameters into a typed request schema. Values are read
+    from an application/json body if present, otherwise from form data or
+    query parameters, and converted according to the schema's field types.
+    The per-field converters are built once per schema and cached.
+
+    Parameters
+    ----------
+    schema : Type[S]
+        Dataclass request schema (see findviz.routes.schemas)
+
+    Returns
+    -------
+    S
+        Schema instance with converted values
+
+    Raises
+    ------
+    KeyError
+        If a required parameter is missing
+    InvalidParameterError
+        If a parameter value cannot be converted to its type. Routes
+        decorated with handle_route_errors respond with 400.
+    """
+    params = request_params()
+    values = {}
+    for name, parser, required in _schema_parsers(schema):
+        if name in params:
+            value = params[name]
+        elif required:
+            raise KeyError(name)
+        else:
+            continue
+        try:
+            values[name] = parser(value)
+        except (TypeError, ValueError) as e:
+            raise InvalidParameterError(name, value) from e
+    return schema(**values)
+
+
+def request_params() -> dict:
+    """
+    Get all route parameters of the current request as a single dict. Query
+    parameters, form data and the json body are read once per request and
+    cached in the WSGI environ, so the context switch, required-parameter check and
+    request schema parsing share them. Json body values take precedence
+    over form data, and form data over query parameters.
+
+    Returns
+    -------
+    dict
+        Merged request parameters
+    """
+    params = request.environ.get(REQUEST_PARAMS_KEY)
+    if params is None:
+        params = request.args.to_dict()
+        params.update(request.form.to_dict())
+        params.update(_request_json())
+        request.environ[REQUEST_PARAMS_KEY] = params
+    return params
+
+
+def _request_json() -> dict:
+    """Get the request json body as a dict (empty if not a json request)"""
+    if not request.is_json:
+        return {}
+    body = request.get_json(silent=True)
+    return body if isinstance(body, dict) else {}
+
+
+@lru_cache(maxsize=None)
+def _schema_parsers(schema: type) -> Tuple[Tuple[str, Callable[[Any], Any], bool], ...]:
+    """Build (name, converter, required) for each field of a request schema"""
+    hints = get_type_hints(schema)
+    return tuple(
+        (
+            field.name,
+            _field_parser(hints[field.name]),
+            field.default is MISSING and field.default_factory is MISSING
+        )
+        for field in fields(schema)
+    )
+
+
+def _field_parser(annotation: Any) -> Callable[[Any], Any]:
+    """Build a converter from a raw request value to the annotated type.
+    String values come from form data; json body values are already typed.
+    Converters raise TypeError or ValueError for invalid values.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    # Optional[T] or T | None: null-like strings map to None
+    if origin in (Union, types.UnionType) and type(None) in args:
+        inner = _field_parser(next(a for a in args if a is not type(None)))
+        def parse_optional(value):
+            if value is None or (
+                isinstance(value, str) and value.lower() in ('null', 'none', '')
+            ):
+                return None
+            return inner(value)
+        return parse_optional
+
+    if origin is Literal:
+        def parse_literal(value):
+            if value not in args:
+                raise ValueError(f'{value!r} is not one of {args}')
+            return value
+        return parse_literal
+    if annotation is str:
+        return lambda value: value
+    if annotation is bool:
+        def parse_bool(value):
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, str):
+                return value.lower() == 'true'
+            raise TypeError(f'{value!r} is not a boolean')
+        return parse_bool
+    if annotation in (int, float):
+        return annotation
+    # containers (dict, list) are json encoded in form data. These are
+    # parsed by the app's JSON provider (orjson, if available)
+    container = origin or annotation
+    def parse_container(value):
+        if isinstance(value, str):
+            value = current_app.json.loads(value)
+        if isinstance(container, type) and not isinstance(value, container):
+            raise TypeError(f'{value!r} is not a {container.__name__}')
+        return value
+    return parse_container
+
+
 # check string is numeric
 def is_numeric(value):
     try:
@@ -279,6 +979,63 @@ def is_numeric(value):
     except (ValueError, TypeError):
         return False
 
+def mask_range_with_nan(
+    arr: np.ndarray,
+    threshold_min: float,
+    threshold_max: float,
+    copy: bool = False
+) -> np.ndarray:
+    """Set values within [threshold_min, threshold_max] to NaN, in place.
+
+    The mask is built in boolean buffers reused by the current thread (see
+    _mask_buffers) and applied with np.putmask, which avoids the boolean
+    temporaries and index array of ``arr[(arr >= min) & (arr <= max)] =
+    nan``. With copy=True, the thresholded values are written to a new
+    array in the same pass that applies the mask, rather than copying arr
+    first and masking the copy.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Floating point array to threshold (modified in place, unless copy)
+    threshold_min : float
+        Minimum threshold value
+    threshold_max : float
+        Maximum threshold value
+    copy : bool, optional
+        Leave arr unchanged and return a thresholded copy, by default False
+
+    Returns
+    -------
+    np.ndarray
+        The thresholded array
+    """
+    mask, upper_mask = _mask_buffers(arr.shape)
+    np.greater_equal(arr, threshold_min, out=mask)
+    np.less_equal(arr, threshold_max, out=upper_mask)
+    mask &= upper_mask
+    if copy:
+        return np.where(mask, np.nan, arr)
+    np.putmask(arr, mask, np.nan)
+    return arr
+
+
+def _mask_buffers(shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """Get two boolean buffers of the given shape for building a mask.
+    Masks of up to MASK_BUFFER_MAX_SIZE elements reuse buffers owned by
+    the current thread, so that thresholding every timepoint does not
+    allocate new masks. The contents are not initialized."""
+    size = int(np.prod(shape))
+    if size > MASK_BUFFER_MAX_SIZE:
+        return np.empty(shape, dtype=bool), np.empty(shape, dtype=bool)
+    buffers = getattr(_mask_buffers_local, 'buffers', None)
+    if buffers is None or buffers.shape[1] < size:
+        buffers = np.empty((2, size), dtype=bool)
+        _mask_buffers_local.buffers = buffers
+    return (
+        buffers[0, :size].reshape(shape), buffers[1, :size].reshape(shape)
+    )
+
 def sanitize_array_for_json(arr: np.ndarray) -> List[List[float]]:
     """Convert numpy array to JSON-serializable format, replacing NaN with None.
     
@@ -292,8 +1049,12 @@ def sanitize_array_for_json(arr: np.ndarray) -> List[List[float]]:
     List[List[float]]
         JSON-serializable 2D list with NaN values replaced by None
     """
+    nan_mask = np.isnan(arr)
+    # no object array needed if there are no NaN values
+    if not nan_mask.any():
+        return arr.tolist()
     # Replace NaN with None and convert to list
-    return np.where(np.isnan(arr), None, arr).tolist()
+    return np.where(nan_mask, None, arr).tolist()
 
 
 # Function to convert strings (passed via fetch) to list of floats
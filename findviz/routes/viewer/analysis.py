@@ -1,9 +1,8 @@
 """
 Analysis routes for findviz viewer
 """
-import json
 
-from flask import Blueprint, request, make_response
+from flask import Blueprint, current_app, request, make_response
 
 from findviz.logger_config import setup_logger
 from findviz.viz import transforms
@@ -209,7 +208,7 @@ def find_peaks():
     # get time course type (timecourse or task) from request
     time_course_type = request.form['time_course_type']
     # get peak finder parameters from request
-    peak_finder_params = json.loads(request.form['peak_finder_params'])
+    peak_finder_params = current_app.json.loads(request.form['peak_finder_params'])
     # convert peak finder parameters
     peak_finder_params = { 
         key: convert_value(value) for key, value in peak_finder_params.items()
@@ -256,7 +255,7 @@ def find_peaks():
 def windowed_average():
     logger.info('Window averaging')
     # get window average parameters from request
-    window_average_params = json.loads(request.form['window_average_params'])
+    window_average_params = current_app.json.loads(request.form['window_average_params'])
     window_average_params = {
         key: convert_value(value) for key, value in window_average_params.items()
     }
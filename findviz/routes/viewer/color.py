@@ -2,6 +2,7 @@
 Routes for display of color maps
 """
 from enum import Enum
+from functools import lru_cache
 
 import plotly.colors as pc
 
@@ -30,6 +31,21 @@ color_bp = Blueprint('color', __name__)
 )
 def get_colormaps() -> dict:
     """Get colormap data"""
+    return get_colormap_data()
+
+
+@lru_cache(maxsize=1)
+def get_colormap_data() -> dict[str, dict[str, str]]:
+    """
+    Get colormap data for all viewer color maps. The data is static, so it
+    is generated once and reused; create_app() builds it in a background
+    thread at startup.
+
+    Returns
+    -------
+    dict[str, dict[str, str]]
+        Colormap data (see generate_colormap_data). Must not be modified.
+    """
     return generate_colormap_data(ColorMaps)
 
 
@@ -9,6 +9,7 @@ Routes:
     GET_DIRECTION_LABEL_COORDS: Get direction label coords
     GET_DISTANCE_DATA: Get distance data
     GET_FMRI_DATA: Get FMRI data
+    GET_FMRI_DATA_RANGE: Get FMRI data for a batch of timepoints
     GET_LAST_TIMECOURSE: Get last added fmri timecourse
     GET_MONTAGE_DATA: Get montage data
     GET_TASK_CONDITIONS: Get task conditions
@@ -30,17 +31,37 @@ Routes:
     UPDATE_TIMEPOINT: Update timepoint
     UPDATE_TR: Update TR
 """
-import json
+from typing import List, Optional, Tuple
 
-from typing import List, Tuple
-from flask import Blueprint, request
+import numpy as np
+
+from flask import Blueprint, Response, current_app, jsonify, request
 
 from findviz.logger_config import setup_logger
 from findviz.routes.utils import (
-    convert_value,
+    BINARY_MIMETYPE,
+    cached_response,
+    compress_response,
+    conditional_response,
+    encode_binary_payload,
+    freeze,
     handle_context, 
+    handle_getter_route,
     handle_route_errors, 
-    Routes
+    parse_request,
+    Routes,
+    SourceKeyedCache,
+    stream_json_response,
+    UpdateCoalescer,
+    wants_binary
+)
+from findviz.routes.schemas import (
+    FmriDataRangeRequest,
+    UpdateLocationRequest,
+    UpdateMontageSliceDirRequest,
+    UpdateMontageSliceIdxRequest,
+    UpdateTimepointRequest,
+    UpdateTrRequest
 )
 from findviz.routes.shared import data_manager
 from findviz.routes.viewer.nifti import (
@@ -54,6 +75,20 @@ from findviz.routes.viewer.gifti import (
 logger = setup_logger(__name__)
 
 data_bp = Blueprint('data', __name__)
+# compress large json/binary payloads
+data_bp.after_request(compress_response)
+
+# recently viewed fmri timepoint data, e.g. for replaying timepoints
+TIMEPOINT_CACHE_SIZE = 128
+timepoint_cache = SourceKeyedCache(maxsize=TIMEPOINT_CACHE_SIZE)
+# recently selected voxel time courses, so that revisiting a voxel does not
+# re-read the image (e.g. decompress a .nii.gz file again)
+TIMECOURSE_CACHE_SIZE = 64
+timecourse_cache = SourceKeyedCache(maxsize=TIMECOURSE_CACHE_SIZE)
+# applies only the latest of concurrent location/slice updates
+update_coalescer = UpdateCoalescer()
+# maximum number of timepoints returned by one GET_FMRI_DATA_RANGE request
+FMRI_DATA_RANGE_MAX_FRAMES = 32
 
 
 @data_bp.route(Routes.CONVERT_TIMEPOINTS.value, methods=['POST'])
@@ -71,10 +106,8 @@ def convert_timepoints() -> dict:
 
 
 @data_bp.route(Routes.GET_CLICK_COORDS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in click coords request',
-    log_msg='Click coords request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_CLICK_COORDS
 )
@@ -84,29 +117,26 @@ def get_click_coords() -> dict:
 
 
 @data_bp.route(Routes.GET_COORD_LABELS.value, methods=['GET'])
+@conditional_response()
 @handle_context()
+@cached_response(sources=lambda: (data_manager.ctx.state,))
 @handle_route_errors(
     error_msg='Unknown error in coordinate labels request',
     log_msg='Coordinate labels request successful',
     route=Routes.GET_COORD_LABELS
 )
 def get_coord_labels() -> dict:
-    """Get coordinate labels"""
+    """Get coordinate labels. Labels are fixed for a given visualization
+    state, so the serialized response is cached per state."""
     if data_manager.ctx.fmri_file_type == 'nifti':
         return data_manager.ctx.coord_labels
     else:
-        coord_labels = data_manager.ctx.coord_labels
-        return {
-            'left_coord_labels': coord_labels[0],
-            'right_coord_labels': coord_labels[1]
-        }
+        return data_manager.ctx.get_coord_labels_dict()
 
 
 @data_bp.route(Routes.GET_CROSSHAIR_COORDS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in crosshair data request',
-    log_msg='Crosshair data request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_CROSSHAIR_COORDS
 )
@@ -116,6 +146,7 @@ def get_crosshair_coords() -> dict:
 
 
 @data_bp.route(Routes.GET_DIRECTION_LABEL_COORDS.value, methods=['GET'])
+@conditional_response()
 @handle_context()
 @handle_route_errors(
     error_msg='Unknown error in direction label coords request',
@@ -129,6 +160,7 @@ def get_direction_label_coords() -> dict:
 
 
 @data_bp.route(Routes.GET_DISTANCE_DATA.value, methods=['GET'])
+@conditional_response()
 @handle_context()
 @handle_route_errors(
     error_msg='Unknown error in distance data request',
@@ -136,9 +168,20 @@ def get_direction_label_coords() -> dict:
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_DISTANCE_DATA
 )
-def get_distance_data() -> list[float]:
-    """Get distance data"""
-    return data_manager.ctx.distance_data.tolist()
+def get_distance_data() -> Response:
+    """Get distance data.
+
+    If the client accepts application/octet-stream, the distance vector is
+    returned as a raw float32 buffer (see encode_binary_payload), rather
+    than a JSON list.
+    """
+    distance_data = data_manager.ctx.distance_data
+    if wants_binary():
+        return Response(
+            encode_binary_payload(distance_data), mimetype=BINARY_MIMETYPE
+        )
+    # serialized directly from the array buffer by the app json provider
+    return jsonify(distance_data)
 
 
 @data_bp.route(Routes.GET_FMRI_DATA.value, methods=['GET'])
@@ -149,56 +192,74 @@ def get_distance_data() -> list[float]:
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_FMRI_DATA
 )
-def get_fmri_data() -> dict:
-    """Get FMRI data for the current timepoint and location."""
-    # get plot options data from data manager
-    plot_options = data_manager.ctx.get_fmri_plot_options()
-
-    # get viewer data from data manager
-    viewer_data = data_manager.ctx.get_viewer_data(
-        fmri_data=True,
-        time_course_data=False,
-        task_data=False,
-    )
-
-    # pass viewer data to get_timepoint_data
-    if data_manager.ctx.fmri_file_type == 'nifti':
-        slice_idx = data_manager.ctx.get_slice_idx()
-        timepoint_data = get_nifti_data(
-            time_point=data_manager.ctx.timepoint,
-            func_img=viewer_data['func_img'],
-            coord_labels=data_manager.ctx.coord_labels,
-            slice_idx=slice_idx,
-            view_state=data_manager.ctx.view_state,
-            montage_slice_dir=data_manager.ctx.montage_slice_dir,
-            threshold_min=plot_options['threshold_min'],
-            threshold_max=plot_options['threshold_max'],
-            threshold_min_orig = data_manager.ctx.color_options_original['threshold_min'],
-            threshold_max_orig = data_manager.ctx.color_options_original['threshold_max'],
-            anat_img=viewer_data['anat_img']
-        )
-    else:
-        timepoint_data = get_gifti_data(
-            time_point=data_manager.ctx.timepoint,
-            left_func_img=viewer_data['left_func_img'],
-            right_func_img=viewer_data['right_func_img'],
-            threshold_min=plot_options['threshold_min'],
-            threshold_max=plot_options['threshold_max'],
-            threshold_min_orig = data_manager.ctx.color_options_original['threshold_min'],
-            threshold_max_orig = data_manager.ctx.color_options_original['threshold_max'],
+def get_fmri_data() -> dict | Response:
+    """Get FMRI data for the current timepoint and location.
+
+    If the client accepts application/octet-stream, slice/vertex arrays are
+    returned as raw float32 buffers (see encode_binary_payload). Otherwise
+    the JSON body is streamed one slice at a time, with the arrays
+    serialized directly by the app's JSON provider.
+    """
+    fmri_data = _get_fmri_timepoint_data()
+    # return arrays as binary buffers if requested by client
+    if wants_binary():
+        return Response(
+            encode_binary_payload(fmri_data), mimetype=BINARY_MIMETYPE
         )
+    return stream_json_response(fmri_data)
 
-    return {
-        'data': timepoint_data,
+
+@data_bp.route(Routes.GET_FMRI_DATA_RANGE.value, methods=['GET'])
+@handle_context()
+@handle_route_errors(
+    error_msg='Unknown error in data range request',
+    log_msg='Data range request successful',
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
+    route=Routes.GET_FMRI_DATA_RANGE,
+    route_parameters=['start', 'end']
+)
+def get_fmri_data_range() -> dict | Response:
+    """Get FMRI data for a batch of timepoints [start, end) at the current
+    location, e.g. to prefetch frames during movie playback.
+
+    The range is clipped to the available timepoints and to
+    FMRI_DATA_RANGE_MAX_FRAMES frames. Frames are stored in the timepoint
+    cache, so that subsequent GET_FMRI_DATA requests for these timepoints
+    are served without re-slicing the image. The response is encoded as in
+    GET_FMRI_DATA, with frames streamed one at a time for JSON. With
+    warm_only, the frames are only cached, and the response has no content.
+    """
+    params = parse_request(FmriDataRangeRequest)
+    ctx = data_manager.ctx
+    start = max(params.start, 0)
+    end = min(
+        params.end, ctx.n_timepoints, start + FMRI_DATA_RANGE_MAX_FRAMES
+    )
+    plot_options = ctx.get_fmri_plot_options()
+    data_kwargs = _get_fmri_data_kwargs(plot_options)
+    if params.warm_only:
+        for time_point in range(start, end):
+            _get_fmri_frame(time_point, data_kwargs)
+        return '', 204
+    fmri_data = {
+        'start': start,
+        'frames': [
+            _get_fmri_frame(time_point, data_kwargs)
+            for time_point in range(start, end)
+        ],
         'plot_options': plot_options
     }
+    # return arrays as binary buffers if requested by client
+    if wants_binary():
+        return Response(
+            encode_binary_payload(fmri_data), mimetype=BINARY_MIMETYPE
+        )
+    return stream_json_response(fmri_data)
 
 
 @data_bp.route(Routes.GET_LAST_TIMECOURSE.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in last fmri timecourse request',
-    log_msg='Last fmri timecourse request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_LAST_TIMECOURSE
 )
@@ -208,10 +269,8 @@ def get_last_timecourse() -> dict:
 
 
 @data_bp.route(Routes.GET_MONTAGE_DATA.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in montage data request',
-    log_msg='Montage data request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_MONTAGE_DATA
 )
@@ -226,10 +285,9 @@ def get_montage_data() -> dict:
 
 
 @data_bp.route(Routes.GET_TASK_CONDITIONS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in task conditions request',
-    log_msg='Task conditions request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_TASK_CONDITIONS
 )
@@ -239,10 +297,9 @@ def get_task_conditions() -> list[str]:
 
 
 @data_bp.route(Routes.GET_TIMECOURSE_LABELS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in timecourse labels request',
-    log_msg='Timecourse labels request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_TIMECOURSE_LABELS
 )
@@ -252,10 +309,8 @@ def get_timecourse_labels() -> list[str]:
 
 
 @data_bp.route(Routes.GET_TIMECOURSE_LABELS_PREPROCESSED.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in preprocessed timecourse labels request',
-    log_msg='Preprocessed timecourse labels request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_TIMECOURSE_LABELS_PREPROCESSED
 )
@@ -273,37 +328,30 @@ def get_timecourse_labels_preprocessed() -> list[str]:
     route=Routes.GET_TIMECOURSE_DATA,
     route_parameters=['ts_labels']
 )
-def get_timecourse_data() -> dict:
-    """Get timecourse data for the current location."""
-    ts_labels = json.loads(request.args['ts_labels'])
-    viewer_data = data_manager.ctx.get_viewer_data(
-        fmri_data=False,
-        time_course_data=True,
-        task_data=True,
-    )
-    timecourse_data = {}
-    # add timecourse data if it exists
-    if 'ts' in viewer_data:
-        timecourse_data.update(viewer_data['ts'])
-    # add task data if it exists
-    if 'task' in viewer_data:
-        timecourse_data.update(viewer_data['task'])
-        
-    # filter timecourse data to only include the requested ts_labels (if passed)
-    if ts_labels is not None:
-        timecourse_data = {
-            ts_label: timecourse_data[ts_label]
-            for ts_label in ts_labels
-            if ts_label in timecourse_data
+def get_timecourse_data() -> dict | Response:
+    """Get timecourse data for the current location.
+
+    If the client accepts application/octet-stream, each timecourse is
+    returned as a raw float32 buffer (see encode_binary_payload) instead of
+    a JSON list. Otherwise the JSON body is streamed one timecourse at a
+    time.
+    """
+    ts_labels = current_app.json.loads(request.args['ts_labels'])
+    timecourse_data = _get_timecourse_data(ts_labels)
+    if wants_binary():
+        timecourse_arrays = {
+            label: np.asarray(values, dtype=np.float32)
+            for label, values in timecourse_data.items()
         }
-    return timecourse_data
+        return Response(
+            encode_binary_payload(timecourse_arrays), mimetype=BINARY_MIMETYPE
+        )
+    return stream_json_response(timecourse_data, depth=1)
 
 
 @data_bp.route(Routes.GET_TIMECOURSE_SOURCE.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in timecourse source request',
-    log_msg='Timecourse source request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_TIMECOURSE_SOURCE
 )
@@ -313,10 +361,8 @@ def get_timecourse_source() -> dict:
 
 
 @data_bp.route(Routes.GET_TIMEPOINT.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in timepoint request',
-    log_msg='Timepoint request successful',
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.GET_TIMEPOINT
 )
@@ -326,22 +372,26 @@ def get_timepoint() -> dict:
 
 
 @data_bp.route(Routes.GET_TIMEPOINTS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in timepoints request',
-    log_msg='Timepoints request successful',
     route=Routes.GET_TIMEPOINTS
 )
 def get_timepoints() -> dict:
-    """Get all timepoints"""
-    return {'timepoints': data_manager.ctx.get_timepoints()}
+    """Get all timepoints as a range descriptor ({'n_timepoints', 'start',
+    'step'}), which the client materializes into the list of timepoints.
+    Timepoints that are not evenly spaced are returned as a list
+    ({'timepoints'})."""
+    timepoints_range = data_manager.ctx.get_timepoints_range()
+    if timepoints_range is None:
+        return {'timepoints': data_manager.ctx.get_timepoints()}
+    return timepoints_range
 
 
 @data_bp.route(Routes.GET_VERTEX_COORDS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in vertex coordinates request',
-    log_msg='Vertex coordinates request successful',
     route=Routes.GET_VERTEX_COORDS
 )
 def get_vertex_coords() -> dict:
@@ -352,6 +402,7 @@ def get_vertex_coords() -> dict:
     }
 
 @data_bp.route(Routes.GET_VIEWER_METADATA.value, methods=['GET'])
+@conditional_response()
 @handle_context()
 @handle_route_errors(
     error_msg='Unknown error in viewer metadata request',
@@ -373,14 +424,11 @@ def get_viewer_metadata() -> dict:
 )
 def get_voxel_coords() -> dict:
     """Get voxel coordinates"""
-    voxel_coords = data_manager.ctx.get_slice_idx()
-    if data_manager.ctx.view_state == 'montage':
-        voxel_coords = voxel_coords[data_manager.ctx.selected_slice]
-
-    return voxel_coords
+    return _get_voxel_coords()
 
 
 @data_bp.route(Routes.GET_WORLD_COORDS.value, methods=['GET'])
+@conditional_response()
 @handle_context()
 @handle_route_errors(
     error_msg='Unknown error in world coordinates request',
@@ -388,14 +436,8 @@ def get_voxel_coords() -> dict:
     route=Routes.GET_WORLD_COORDS
 )
 def get_world_coords() -> dict:
-    world_coords = data_manager.ctx.get_world_coords()
-    # package world coords into a dictionary
-    world_coords_dict = {
-        'x': world_coords[0],
-        'y': world_coords[1],
-        'z': world_coords[2]
-    }
-    return world_coords_dict
+    """Get world coordinates"""
+    return data_manager.ctx.get_world_coords_dict()
 
 
 @data_bp.route(Routes.POP_FMRI_TIMECOURSE.value, methods=['POST'])
@@ -436,10 +478,14 @@ def remove_fmri_timecourses() -> dict:
     route_parameters=['click_coords', 'slice_name']
 )
 def update_location() -> dict:
-    """Update current location based on form data."""
-    click_coords = json.loads(request.form['click_coords'])
-    slice_name = request.form['slice_name']
-    data_manager.ctx.update_location(click_coords, slice_name)
+    """Update current location based on form data. Location updates of a
+    context are coalesced (see UpdateCoalescer), e.g. while dragging."""
+    params = parse_request(UpdateLocationRequest)
+    ctx = data_manager.ctx
+    update_coalescer.submit(
+        (ctx.context_id, Routes.UPDATE_LOCATION),
+        ctx.update_location, params.click_coords, params.slice_name
+    )
     return {'status': 'success'}
 
 
@@ -453,28 +499,29 @@ def update_location() -> dict:
 )
 def update_fmri_timecourse() -> dict:
     """Update fmri timecourse data for the current location."""
-    viewer_data = data_manager.ctx.get_viewer_data(
-        fmri_data=True,
-        time_course_data=False,
-        task_data=False,
-    )
-
     if data_manager.ctx.fmri_file_type == 'nifti':
         slice_idx = data_manager.ctx.get_slice_idx()
         # if montage view, get slice idx of currently selected slice
         if data_manager.ctx.view_state == 'montage':
             slice_idx = slice_idx[data_manager.ctx.selected_slice]
-        timecourse_data, voxel_label = get_timecourse_nifti(
-            func_img=viewer_data['func_img'],
-            x=slice_idx['x'],
-            y=slice_idx['y'],
-            z=slice_idx['z']
-        )
+        func_img = data_manager.ctx.func_img
+        cache_key = (slice_idx['x'], slice_idx['y'], slice_idx['z'])
+        timecourse = timecourse_cache.get(cache_key, (func_img,))
+        if timecourse is None:
+            timecourse = get_timecourse_nifti(
+                func_img=func_img,
+                x=slice_idx['x'],
+                y=slice_idx['y'],
+                z=slice_idx['z']
+            )
+            timecourse_cache.put(cache_key, (func_img,), timecourse)
+        # copy, as the cached time course is shared with later requests
+        timecourse_data, voxel_label = list(timecourse[0]), timecourse[1]
     else:
         click_coords = data_manager.ctx.get_click_coords()
         timecourse_data, voxel_label = get_timecourse_gifti(
-            left_func_img=viewer_data['left_func_img'],
-            right_func_img=viewer_data['right_func_img'],
+            left_func_img=data_manager.ctx.left_func_img,
+            right_func_img=data_manager.ctx.right_func_img,
             vertex_index=click_coords['selected_vertex'],
             hemisphere=click_coords['selected_hemi']
         )
@@ -494,8 +541,8 @@ def update_fmri_timecourse() -> dict:
 )
 def update_montage_slice_dir() -> dict:
     """Update montage slice direction"""
-    montage_slice_dir = request.form['montage_slice_dir']
-    data_manager.ctx.update_montage_slice_dir(montage_slice_dir)
+    params = parse_request(UpdateMontageSliceDirRequest)
+    data_manager.ctx.update_montage_slice_dir(params.montage_slice_dir)
     return {'status': 'success'}
 
 
@@ -509,10 +556,14 @@ def update_montage_slice_dir() -> dict:
     route_parameters=['slice_name', 'slice_idx']
 )
 def update_montage_slice_idx() -> dict:
-    """Update montage slice indices from slider changes"""
-    slice_name = convert_value(request.form['slice_name'])
-    slice_idx = convert_value(request.form['slice_idx'])
-    data_manager.ctx.update_montage_slice_idx(slice_name, slice_idx)
+    """Update montage slice indices from slider changes. Updates of a
+    montage slice are coalesced (see UpdateCoalescer)."""
+    params = parse_request(UpdateMontageSliceIdxRequest)
+    ctx = data_manager.ctx
+    update_coalescer.submit(
+        (ctx.context_id, Routes.UPDATE_MONTAGE_SLICE_IDX, params.slice_name),
+        ctx.update_montage_slice_idx, params.slice_name, params.slice_idx
+    )
     return {'status': 'success'}
 
 
@@ -527,8 +578,8 @@ def update_montage_slice_idx() -> dict:
 )
 def update_timepoint() -> dict:
     """Update current timepoint based on form data."""
-    timepoint = convert_value(request.form['time_point'])
-    data_manager.ctx.update_timepoint(timepoint)
+    params = parse_request(UpdateTimepointRequest)
+    data_manager.ctx.update_timepoint(params.time_point)
     return {'status': 'success'}
 
 
@@ -541,6 +592,142 @@ def update_timepoint() -> dict:
 )
 def update_tr() -> dict:
     """Update TR"""
-    tr = convert_value(request.form['tr'])
-    data_manager.ctx.set_tr(tr)
+    params = parse_request(UpdateTrRequest)
+    data_manager.ctx.set_tr(params.tr)
     return {'status': 'success'}
+
+
+def _get_fmri_timepoint_data() -> dict:
+    """Get fmri data and plot options for the current timepoint and location.
+    Slice/vertex data are returned as float32 arrays (NaN preserved), which
+    are encoded as binary buffers or serialized directly to JSON (NaN as
+    null) without an intermediate list.
+
+    Returns
+    -------
+    dict
+        Dictionary with 'data' and 'plot_options' keys
+    """
+    ctx = data_manager.ctx
+    # get plot options data from data manager
+    plot_options = ctx.get_fmri_plot_options()
+    data_kwargs = _get_fmri_data_kwargs(plot_options)
+    return {
+        'data': _get_fmri_frame(ctx.timepoint, data_kwargs),
+        'plot_options': plot_options
+    }
+
+
+def _get_fmri_data_kwargs(plot_options: dict) -> dict:
+    """Get threshold arguments shared by get_nifti_data and get_gifti_data"""
+    color_options_original = data_manager.ctx.color_options_original
+    return {
+        'threshold_min': plot_options['threshold_min'],
+        'threshold_max': plot_options['threshold_max'],
+        'threshold_min_orig': color_options_original['threshold_min'],
+        'threshold_max_orig': color_options_original['threshold_max'],
+        'as_array': True,
+    }
+
+
+def _get_fmri_frame(time_point: int, data_kwargs: dict) -> dict:
+    """Get slice/vertex data of a timepoint at the current location. Results
+    are cached on the timepoint, location, thresholds and source images.
+    Images are read directly from the context, rather than through
+    get_viewer_data().
+
+    Parameters
+    ----------
+    time_point : int
+        Timepoint to extract
+    data_kwargs : dict
+        Threshold arguments (see _get_fmri_data_kwargs)
+
+    Returns
+    -------
+    dict
+        Output of get_nifti_data or get_gifti_data
+    """
+    ctx = data_manager.ctx
+    if ctx.fmri_file_type == 'nifti':
+        func_img = ctx.func_img
+        anat_img = ctx.anat_img
+        slice_idx = ctx.get_slice_idx()
+        sources = (func_img, anat_img)
+        cache_key = (
+            'nifti', time_point, freeze(slice_idx), ctx.view_state,
+            ctx.montage_slice_dir, freeze(data_kwargs)
+        )
+        timepoint_data = timepoint_cache.get(cache_key, sources)
+        if timepoint_data is None:
+            timepoint_data = get_nifti_data(
+                time_point=time_point,
+                func_img=func_img,
+                coord_labels=ctx.coord_labels,
+                slice_idx=slice_idx,
+                view_state=ctx.view_state,
+                montage_slice_dir=ctx.montage_slice_dir,
+                anat_img=anat_img,
+                **data_kwargs
+            )
+            timepoint_cache.put(cache_key, sources, timepoint_data)
+    else:
+        left_func_img = ctx.left_func_img
+        right_func_img = ctx.right_func_img
+        sources = (left_func_img, right_func_img)
+        cache_key = ('gifti', time_point, freeze(data_kwargs))
+        timepoint_data = timepoint_cache.get(cache_key, sources)
+        if timepoint_data is None:
+            timepoint_data = get_gifti_data(
+                time_point=time_point,
+                left_func_img=left_func_img,
+                right_func_img=right_func_img,
+                **data_kwargs
+            )
+            timepoint_cache.put(cache_key, sources, timepoint_data)
+    return timepoint_data
+
+
+def _get_timecourse_data(ts_labels: Optional[List[str]]) -> dict:
+    """Get timecourse and task data, filtered to the requested labels.
+
+    Parameters
+    ----------
+    ts_labels : Optional[List[str]]
+        Labels to return. If None, all timecourses are returned.
+
+    Returns
+    -------
+    dict
+        Timecourse data keyed by label
+    """
+    viewer_data = data_manager.ctx.get_viewer_data(
+        fmri_data=False,
+        time_course_data=True,
+        task_data=True,
+    )
+    ts_data = viewer_data.get('ts', {})
+    task_data = viewer_data.get('task', {})
+    # all labels (in stored order): task data follows timecourse data
+    if ts_labels is None:
+        return {**ts_data, **task_data}
+
+    # look up only the requested labels (preserving the requested order),
+    # rather than merging all timecourse and task data first. Task data
+    # takes precedence for labels present in both.
+    timecourse_data = {}
+    for ts_label in ts_labels:
+        if ts_label in task_data:
+            timecourse_data[ts_label] = task_data[ts_label]
+        elif ts_label in ts_data:
+            timecourse_data[ts_label] = ts_data[ts_label]
+    return timecourse_data
+
+
+def _get_voxel_coords() -> dict:
+    """Get voxel coordinates of the selected slice"""
+    voxel_coords = data_manager.ctx.get_slice_idx()
+    if data_manager.ctx.view_state == 'montage':
+        voxel_coords = voxel_coords[data_manager.ctx.selected_slice]
+
+    return voxel_coords
@@ -2,12 +2,19 @@
 GIFTI data handling
 """
 
+import threading
+import weakref
+
 from typing import Tuple, Optional, List, Literal, TypedDict
 
 import nibabel as nib
 import numpy as np
 
-from findviz.routes.utils import sanitize_array_for_json
+from findviz.routes.utils import mask_range_with_nan, sanitize_array_for_json
+
+# (timepoints, vertices) float32 data matrices, stacked once per image
+_data_matrices = weakref.WeakKeyDictionary()
+_data_matrices_lock = threading.Lock()
 
 
 class GiftiTimePointData(TypedDict):
@@ -21,7 +28,8 @@ def get_gifti_data(
     threshold_min: float = 0,
     threshold_max: float = 0,
     threshold_min_orig: float = 0,
-    threshold_max_orig: float = 0
+    threshold_max_orig: float = 0,
+    as_array: bool = False
 ) -> GiftiTimePointData:
     """Get functional data for a specific timepoint from left and right hemisphere Gifti images.
     
@@ -41,36 +49,35 @@ def get_gifti_data(
             Original minimum threshold value
         threshold_max_orig : float
             Original maximum threshold value
+        as_array : bool
+            Return float32 arrays (NaN preserved) rather than JSON-ready lists
     Returns:
     --------
         Dictionary containing:
             - Left hemisphere functional data array for the timepoint (None if no left data)
             - Right hemisphere functional data array for the timepoint (None if no right data)
     """
+    # threshold data if threshold_min or threshold_max have been changed
+    threshold = (
+        (threshold_min != threshold_min_orig)
+        or (threshold_max != threshold_max_orig)
+    )
     func_data_left = None
     func_data_right = None
 
     # Handle left hemisphere Gifti file
     if left_func_img is not None:
-        func_data_left = left_func_img.darrays[time_point].data.copy()
-        # threshold data if threshold_min or threshold_max have been changed
-        if (threshold_min != threshold_min_orig) or (threshold_max != threshold_max_orig):
-            func_data_left = threshold_gifti_data(
-                func_data_left, threshold_min, threshold_max
-            )
-        # sanitize data
-        func_data_left = sanitize_array_for_json(func_data_left)
+        func_data_left = _get_hemisphere_timepoint_data(
+            left_func_img, time_point, threshold,
+            threshold_min, threshold_max, as_array
+        )
 
     # Handle right hemisphere Gifti file
     if right_func_img is not None:
-        func_data_right = right_func_img.darrays[time_point].data.copy()
-        # threshold data if threshold_min or threshold_max have been changed
-        if (threshold_min != threshold_min_orig) or (threshold_max != threshold_max_orig):
-            func_data_right = threshold_gifti_data(
-                func_data_right, threshold_min, threshold_max
-            )
-        # sanitize data
-        func_data_right = sanitize_array_for_json(func_data_right)
+        func_data_right = _get_hemisphere_timepoint_data(
+            right_func_img, time_point, threshold,
+            threshold_min, threshold_max, as_array
+        )
 
     gifti_data = {
         'left_hemisphere': func_data_left,
@@ -80,6 +87,28 @@ def get_gifti_data(
     return gifti_data
 
 
+def _get_hemisphere_timepoint_data(
+    func_img: nib.GiftiImage,
+    time_point: int,
+    threshold: bool,
+    threshold_min: float,
+    threshold_max: float,
+    as_array: bool
+) -> List[float] | np.ndarray:
+    """Get (optionally thresholded) functional data of one hemisphere for a
+    timepoint. The image data is only copied when it is thresholded, in
+    the same pass that applies the threshold."""
+    func_data = get_gifti_data_matrix(func_img)[time_point]
+    if threshold:
+        func_data = threshold_gifti_data(
+            func_data, threshold_min, threshold_max
+        )
+    # sanitize data
+    if as_array:
+        return np.ascontiguousarray(func_data, dtype=np.float32)
+    return sanitize_array_for_json(func_data)
+
+
 def get_timecourse_gifti(
     left_func_img: Optional[nib.GiftiImage],
     right_func_img: Optional[nib.GiftiImage],
@@ -105,15 +134,20 @@ def get_timecourse_gifti(
         Tuple containing:
             - Functional time course for vertex
             - Label for functional time course
+
+    Raises:
+    -------
+        ValueError
+            If no functional image is loaded for the hemisphere
     """
-    if hemisphere == 'left':
-        gifti_img = left_func_img
-    elif hemisphere == 'right':
-        gifti_img = right_func_img
+    gifti_img = {'left': left_func_img, 'right': right_func_img}[hemisphere]
+    if gifti_img is None:
+        raise ValueError(
+            f'No functional data loaded for {hemisphere} hemisphere'
+        )
 
-    # Extract the vertex's time course
-    time_course = [d.data[vertex_index] for d in gifti_img.darrays]
-    time_course = [t.item() for t in time_course]
+    # Extract the vertex's time course (column) from the data matrix
+    time_course = get_gifti_data_matrix(gifti_img)[:, vertex_index].tolist()
 
     # create time course label
     time_course_label = f'Vertex: {vertex_index} ({hemisphere})'
@@ -121,12 +155,46 @@ def get_timecourse_gifti(
     return time_course, time_course_label
 
 
+def get_gifti_data_matrix(func_img: nib.GiftiImage) -> np.ndarray:
+    """Get the functional data of a Gifti image as a contiguous
+    (timepoints, vertices) float32 matrix. The matrix is stacked from the
+    image's darrays on first access and reused while the image is alive,
+    so that a timepoint is a contiguous row and a vertex time course is a
+    single strided column read. A replaced (e.g. preprocessed or reloaded)
+    image gets its own matrix, and the matrix of a released image is
+    dropped with it.
+
+    Parameters:
+    -----------
+        func_img : nib.GiftiImage
+            Gifti image containing functional data (one darray per timepoint)
+
+    Returns:
+    --------
+        Read-only np.ndarray of shape (timepoints, vertices)
+    """
+    with _data_matrices_lock:
+        data_matrix = _data_matrices.get(func_img)
+        if data_matrix is None:
+            darrays = func_img.darrays
+            data_matrix = np.empty(
+                (len(darrays), darrays[0].data.shape[0]), dtype=np.float32
+            )
+            for i, darray in enumerate(darrays):
+                data_matrix[i] = darray.data
+            # rows are handed out as views, so guard the shared matrix
+            data_matrix.flags.writeable = False
+            _data_matrices[func_img] = data_matrix
+    return data_matrix
+
+
 def threshold_gifti_data(
     gifti_data: np.ndarray,
     threshold_min: float,
     threshold_max: float,
 ) -> np.ndarray:
-    """Threshold a list of functional data
+    """Threshold a list of functional data. The input array is not
+    modified; thresholded values are written to a new array.
     
     Parameters:
     -----------
@@ -141,8 +209,6 @@ def threshold_gifti_data(
     --------
         np.ndarray of thresholded functional data
     """
-    # create mask
-    mask = (gifti_data >= threshold_min) & (gifti_data <= threshold_max)
-    # apply mask
-    gifti_data[mask] = np.nan
-    return gifti_data
+    return mask_range_with_nan(
+        gifti_data, threshold_min, threshold_max, copy=True
+    )
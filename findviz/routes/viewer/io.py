@@ -2,7 +2,7 @@
 Viewer IO routes
 """
 
-from io import BytesIO
+from tempfile import SpooledTemporaryFile
 
 from flask import Blueprint, request, send_file, make_response
 
@@ -16,6 +16,9 @@ from findviz.routes.shared import data_manager
 logger = setup_logger(__name__)
 io_bp = Blueprint('io', __name__)
 
+# Scenes larger than this are spooled to a temporary file on disk
+SCENE_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
 
 @io_bp.route(Routes.SAVE_SCENE.value, methods=['POST'])
 def save_scene() -> dict:
@@ -23,16 +26,18 @@ def save_scene() -> dict:
     Save the current scene
     """
 
-    # Get serialized data from DataManager
-    serialized_data = data_manager.save()
-    
-    # Create a BytesIO object from the serialized data
-    mem_file = BytesIO(serialized_data)
-    mem_file.seek(0)
+    # Serialize the scene into a spooled file that is streamed to the client
+    scene_file = SpooledTemporaryFile(max_size=SCENE_SPOOL_MAX_SIZE)
+    try:
+        data_manager.save_to_file(scene_file)
+    except Exception:
+        scene_file.close()
+        raise
+    scene_file.seek(0)
     
     # Create a response with the file data
     response = send_file(
-        mem_file,
+        scene_file,
         mimetype='application/octet-stream',
         as_attachment=True,
         download_name='scene'
@@ -4,20 +4,39 @@ Log retrieval routes
 import os
 import re
 import glob
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from flask import Blueprint, request, jsonify
 
 from findviz.logger_config import setup_logger
-from findviz.routes.utils import handle_route_errors, Routes
+from findviz.routes.utils import conditional_response, handle_route_errors, Routes
 
 # Set up a logger for the app
 logger = setup_logger(__name__)
 
 logs_bp = Blueprint('logs', __name__)
 
+# size of the blocks read from the end of a log file
+LOG_READ_CHUNK_SIZE = 64 * 1024
+
+# log entry format: 2023-05-21 14:30:45,123 - module_name - LEVEL - Message
+LOG_ENTRY_PATTERN = re.compile(
+    r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - ([\w\._]+) - (\w+) - (.*)',
+    re.ASCII
+)
+# run log file name, with its start time (YYYYMMDD-HHMMSS)
+LOG_FILE_PATTERN = re.compile(r'app-run-(\d{8}-\d{6})\.log')
+
+# seconds a run log file listing is reused while the logs directory is
+# unchanged (see _list_run_log_files)
+LOG_FILES_CACHE_TTL = 5.0
+# {log_dir: (directory mtime, listing time, run log files, most recent)}
+_run_log_files_cache: Dict[str, Tuple[int, float, List[str], Optional[str]]] = {}
+
 @logs_bp.route(Routes.GET_LOG_ENTRIES.value, methods=['GET'])
+@conditional_response()
 @handle_route_errors(
     error_msg='Error retrieving log entries',
     log_msg='Log entries request successful',
@@ -47,6 +66,7 @@ def get_log_entries():
     return jsonify(log_entries)
 
 @logs_bp.route(Routes.GET_LOG_FILES.value, methods=['GET'])
+@conditional_response()
 @handle_route_errors(
     error_msg='Error retrieving log files',
     log_msg='Log files request successful',
@@ -63,7 +83,7 @@ def get_log_files():
     log_files = []
     
     # Get all run-specific log files (app-run-*.log)
-    run_log_files = glob.glob(os.path.join(log_dir, 'app-run-*.log'))
+    run_log_files, _ = _list_run_log_files(log_dir)
     
     for file_path in run_log_files:
         file_name = os.path.basename(file_path)
@@ -71,7 +91,7 @@ def get_log_files():
         size = os.path.getsize(file_path)
         
         # Extract timestamp from filename
-        timestamp_match = re.search(r'app-run-(\d{8}-\d{6})\.log', file_name)
+        timestamp_match = LOG_FILE_PATTERN.search(file_name)
         timestamp_str = None
         if timestamp_match:
             # Convert YYYYMMDD-HHMMSS to a readable format
@@ -110,18 +130,50 @@ def find_most_recent_log_file() -> str:
         logger.warning(f"Log directory not found: {log_dir}")
         return None
     
-    # Look for all run-specific log files
-    run_log_files = glob.glob(os.path.join(log_dir, 'app-run-*.log'))
+    # Look for all run-specific log files, and the most recently modified
+    _, most_recent = _list_run_log_files(log_dir)
     
-    if not run_log_files:
+    if most_recent is None:
         logger.warning("No run log files found")
         return None
     
-    # Find the most recently modified file
-    most_recent = max(run_log_files, key=os.path.getmtime)
     return os.path.basename(most_recent)
 
 
+def _list_run_log_files(log_dir: str) -> Tuple[List[str], Optional[str]]:
+    """
+    List the run log files (app-run-*.log) of a logs directory. The listing
+    is reused for up to LOG_FILES_CACHE_TTL seconds while the directory's
+    modification time is unchanged, i.e. no file was added or removed.
+
+    Parameters
+    ----------
+    log_dir : str
+        Path to the logs directory
+
+    Returns
+    -------
+    Tuple[List[str], Optional[str]]
+        Paths of the run log files, and the path of the most recently
+        modified one (None if there are no run log files)
+    """
+    dir_mtime = os.stat(log_dir).st_mtime_ns
+    now = time.monotonic()
+    cached = _run_log_files_cache.get(log_dir)
+    if (
+        cached is not None and cached[0] == dir_mtime
+        and now - cached[1] < LOG_FILES_CACHE_TTL
+    ):
+        return cached[2], cached[3]
+
+    run_log_files = glob.glob(os.path.join(log_dir, 'app-run-*.log'))
+    most_recent = (
+        max(run_log_files, key=os.path.getmtime) if run_log_files else None
+    )
+    _run_log_files_cache[log_dir] = (dir_mtime, now, run_log_files, most_recent)
+    return run_log_files, most_recent
+
+
 def get_recent_log_entries(
     max_entries: int = 100, 
     since_minutes: int = 15, 
@@ -153,40 +205,37 @@ def get_recent_log_entries(
                 "source": "log_utils", 
                 "message": f"Log file not found: {log_file_path}"}]
     
-    # Calculate cutoff time
+    # Calculate cutoff time, formatted as a log entry timestamp. Timestamps
+    # are fixed-width, so they compare in chronological order as strings
     cutoff_time = datetime.now() - timedelta(minutes=since_minutes)
+    cutoff_str = cutoff_time.strftime('%Y-%m-%d %H:%M:%S,%f')[:23]
     
     try:
-        with open(log_file_path, 'r') as log_file:
-            # Read the file from the end, which is more efficient for large logs
-            lines = log_file.readlines()
-            
-            # Process the most recent lines first (reversed)
-            for line in reversed(lines):
+        with open(log_file_path, 'rb') as log_file:
+            # Process the most recent lines first, reading blocks from the
+            # end of the file, so that only the returned entries are read
+            for line in _iter_lines_reversed(log_file):
                 # Skip empty lines
                 if not line.strip():
                     continue
                 
-                # Parse log entry with regex
-                # Format: 2023-05-21 14:30:45,123 - module_name - LEVEL - Message
-                match = re.match(
-                    r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) - ([\w\._]+) - (\w+) - (.*)', 
-                    line
-                )
+                # Parse log entry with the precompiled pattern
+                match = LOG_ENTRY_PATTERN.match(line)
 
                 if match:
                     timestamp_str, source, level, message = match.groups()
                     
+                    # For run-specific logs, we might want to show all entries
+                    # regardless of time, since each run is a discrete session
+                    # But we'll keep the time filter as an option. Entries
+                    # are written in order, so all earlier entries are older
+                    # and the scan stops before parsing the timestamp
+                    if since_minutes > 0 and timestamp_str < cutoff_str:
+                        break
+
                     try:
                         # Parse timestamp - handle milliseconds correctly
-                        timestamp_str = timestamp_str.replace(',', '.')
-                        timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
-                        
-                        # For run-specific logs, we might want to show all entries
-                        # regardless of time, since each run is a discrete session
-                        # But we'll keep the time filter as an option
-                        if since_minutes > 0 and timestamp < cutoff_time:
-                            continue
+                        timestamp = _parse_log_timestamp(timestamp_str)
                         
                         entries.append({
                             "timestamp": timestamp.isoformat(),
@@ -214,4 +263,67 @@ def get_recent_log_entries(
         return [{"timestamp": datetime.now().isoformat(), 
                 "level": "ERROR", 
                 "source": "log_utils", 
-                "message": f"Error reading log file: {str(e)}"}]
\ No newline at end of file
+                "message": f"Error reading log file: {str(e)}"}]
+
+
+def _parse_log_timestamp(timestamp_str: str) -> datetime:
+    """
+    Parse a log entry timestamp (YYYY-MM-DD HH:MM:SS,mmm) from its fixed
+    field offsets, which is much faster than datetime.strptime.
+
+    Parameters
+    ----------
+    timestamp_str : str
+        Timestamp matched by LOG_ENTRY_PATTERN
+
+    Returns
+    -------
+    datetime
+        Parsed timestamp
+
+    Raises
+    ------
+    ValueError
+        If a field is out of range
+    """
+    return datetime(
+        int(timestamp_str[0:4]), int(timestamp_str[5:7]),
+        int(timestamp_str[8:10]), int(timestamp_str[11:13]),
+        int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+        int(timestamp_str[20:23]) * 1000
+    )
+
+
+def _iter_lines_reversed(
+    log_file: BinaryIO,
+    chunk_size: int = LOG_READ_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Iterate over the lines of a file from last to first, reading fixed-size
+    blocks from the end of the file.
+
+    Parameters
+    ----------
+    log_file : BinaryIO
+        Log file opened in binary mode
+    chunk_size : int
+        Number of bytes read per block
+
+    Returns
+    -------
+    Iterator[str]
+        Lines of the file (without line endings), last line first
+    """
+    position = log_file.seek(0, os.SEEK_END)
+    remainder = b''
+    while position > 0:
+        read_size = min(chunk_size, position)
+        position -= read_size
+        log_file.seek(position)
+        lines = (log_file.read(read_size) + remainder).split(b'\n')
+        # the first line may continue in the preceding block
+        remainder = lines.pop(0)
+        for line in reversed(lines):
+            # strip the carriage return of CRLF (Windows) line endings
+            yield line.rstrip(b'\r').decode('utf-8', errors='replace')
+    yield remainder.rstrip(b'\r').decode('utf-8', errors='replace')
@@ -6,10 +6,24 @@ from typing import Literal, Optional, TypedDict, List, Tuple
 import nibabel as nib
 import numpy as np
 
-from nilearn.image import index_img
-
-from findviz.routes.utils import sanitize_array_for_json
+from findviz.routes.utils import (
+    SourceKeyedCache, mask_range_with_nan, sanitize_array_for_json
+)
 from findviz.viz.viewer.types import OrthoSliceIndexDict, MontageSliceDirectionIndexDict
+from findviz.viz.viewer.utils import get_image_data
+
+# coordinate label slices, which only change with the slice index (not the
+# time point), keyed on (axis, slice index)
+COORD_LABEL_CACHE_SIZE = 64
+coord_label_cache = SourceKeyedCache(maxsize=COORD_LABEL_CACHE_SIZE)
+
+# anatomical slices, which are also time-invariant, keyed on (axis, slice
+# index, output type)
+ANAT_SLICE_CACHE_SIZE = 64
+anat_slice_cache = SourceKeyedCache(maxsize=ANAT_SLICE_CACHE_SIZE)
+
+# array axis of each slice direction
+SLICE_AXES = {'x': 0, 'y': 1, 'z': 2}
 
 class SliceData(TypedDict):
     x: List[List[float]]
@@ -39,6 +53,7 @@ def get_nifti_data(
     threshold_min_orig: float = 0,
     threshold_max_orig: float = 0,
     anat_img: Optional[nib.Nifti1Image] = None,
+    as_array: bool = False,
 ) -> NiftiTimePointData:
     """Get slice data for a specific timepoint from functional, anatomical and mask images.
 
@@ -66,6 +81,9 @@ def get_nifti_data(
         Original maximum threshold value, by default 0
     anat_img : Optional[nib.Nifti1Image], optional
         3D anatomical image, by default None
+    as_array : bool, optional
+        Return func and anat slices as float32 arrays (NaN preserved) rather
+        than JSON-ready lists, by default False
 
     Returns
     -------
@@ -78,20 +96,35 @@ def get_nifti_data(
             'coords': List[Tuple[int, int, int]]
         }
     """
-    # Select time point
-    func_data = np.array(index_img(func_img, time_point).get_fdata())
+    # get functional data, so that only the displayed slices of the time
+    # point are read (rather than the whole volume) from uncompressed files
+    func_data = get_image_data(func_img)
     
-    # threshold data if threshold_min or threshold_max have been changed
-    if (threshold_min != threshold_min_orig) or (threshold_max != threshold_max_orig):
-        func_data = threshold_nifti_data(
-            nifti_data=func_data, 
-            threshold_min=threshold_min, 
-            threshold_max=threshold_max
-        )
+    # threshold data if threshold_min or threshold_max have been changed.
+    # Only the displayed slices are thresholded, rather than the volume
+    threshold = (
+        (threshold_min != threshold_min_orig)
+        or (threshold_max != threshold_max_orig)
+    )
+
+    # numeric slice output type
+    number_type = 'array' if as_array else 'number'
+
+    # in montage view all slices are along the same direction; read the
+    # slab spanning them once (a view of in-memory data, and a single read
+    # or decompression pass of on-disk data), rather than once per slice
+    func_time_point = time_point
+    slab_offset = 0
+    if view_state == 'montage':
+        montage_slices = [
+            slice_idx[slice_container][montage_slice_dir]
+            for slice_container in ['slice_1', 'slice_2', 'slice_3']
+        ]
+        slab_offset = min(montage_slices)
+        slab = slice(slab_offset, max(montage_slices) + 1)
+        func_data = _get_slab(func_data, slab, montage_slice_dir, time_point)
+        func_time_point = None
 
-    # get anatomical data if present
-    anat_data = anat_img.get_fdata() if anat_img else None
-    
     # initialize output
     slice_out = {
         'func': {},
@@ -113,63 +146,172 @@ def get_nifti_data(
             # get slice idx
             slice_i = slice_idx[axis]
 
-        slice_out['func'][slice_container] = get_slice_data(
-            func_data, slice_i, axis=nifti_axis
-        )
+        # slice index within the (montage) slab of the image data
+        data_slice_i = slice_i - slab_offset
+        if threshold:
+            slice_out['func'][slice_container] = _get_thresholded_slice(
+                func_data, data_slice_i, nifti_axis, func_time_point,
+                threshold_min, threshold_max, as_array
+            )
+        else:
+            slice_out['func'][slice_container] = get_slice_data(
+                func_data, data_slice_i, axis=nifti_axis,
+                array_type=number_type, time_point=func_time_point
+            )
         if anat_img is not None:
-            slice_out['anat'][slice_container] = get_slice_data(
-                anat_data, slice_i, axis=nifti_axis
+            slice_out['anat'][slice_container] = _get_anat_slice(
+                anat_img, slice_i, nifti_axis, number_type
             )
         # get coord labels
-        slice_out['coords'][slice_container] = get_slice_data(
-            coord_labels, slice_i, axis=nifti_axis, array_type='string'
+        slice_out['coords'][slice_container] = _get_coord_label_slice(
+            coord_labels, slice_i, nifti_axis
         )
 
     return slice_out
 
 
+def _get_slab(
+    nifti_data: np.ndarray,
+    slab: slice,
+    axis: Literal['x', 'y', 'z'],
+    time_point: Optional[int] = None
+) -> np.ndarray:
+    """Read a 3D slab of consecutive slices along an axis (of a time point,
+    if given) from image data or an image data object."""
+    index = [slice(None)] * 3
+    index[SLICE_AXES[axis]] = slab
+    if time_point is not None:
+        index.append(time_point)
+    return nifti_data[tuple(index)]
+
+
+def _get_anat_slice(
+    anat_img: nib.Nifti1Image,
+    slice_index: int,
+    axis: Literal['x', 'y', 'z'],
+    array_type: Literal['number', 'array']
+) -> List[List[float]] | np.ndarray:
+    """Get a 2D slice of the anatomical image, reusing the slice of previous
+    time points. Only the slice is read from uncompressed files (see
+    get_image_data). Cached slices are shared, and must not be modified."""
+    key = (axis, slice_index, array_type)
+    anat_slice = anat_slice_cache.get(key, (anat_img,))
+    if anat_slice is None:
+        anat_slice = get_slice_data(
+            get_image_data(anat_img), slice_index, axis=axis,
+            array_type=array_type
+        )
+        anat_slice_cache.put(key, (anat_img,), anat_slice)
+    return anat_slice
+
+
+def _get_coord_label_slice(
+    coord_labels: np.ndarray,
+    slice_index: int,
+    axis: Literal['x', 'y', 'z']
+) -> List[List[str]]:
+    """Get a 2D slice of coordinate labels, reusing the slice of previous
+    time points. Cached slices are shared, and must not be modified."""
+    key = (axis, slice_index)
+    label_slice = coord_label_cache.get(key, (coord_labels,))
+    if label_slice is None:
+        label_slice = get_slice_data(
+            coord_labels, slice_index, axis=axis, array_type='string'
+        )
+        coord_label_cache.put(key, (coord_labels,), label_slice)
+    return label_slice
+
+
+def _get_thresholded_slice(
+    func_data: np.ndarray,
+    slice_index: int,
+    axis: Literal['x', 'y', 'z'],
+    time_point: Optional[int],
+    threshold_min: float,
+    threshold_max: float,
+    as_array: bool
+) -> List[List[float]] | np.ndarray:
+    """Extract and threshold a 2D slice of a functional time point. The
+    slice is copied once, to a new array in the output dtype, and
+    thresholded in place (the mask is built in reused buffers, see
+    mask_range_with_nan). The copy is needed as the slice may be a view of
+    the image data, and the output may be cached."""
+    func_slice = threshold_nifti_data(
+        nifti_data=np.array(
+            _index_slice(func_data, slice_index, axis, time_point),
+            dtype=np.float32 if as_array else np.float64,
+            order='C'
+        ),
+        threshold_min=threshold_min,
+        threshold_max=threshold_max
+    )
+    if as_array:
+        return func_slice
+    return sanitize_array_for_json(func_slice)
+
+
 def get_slice_data(
     nifti_data: np.ndarray,
     slice_index: int, 
     axis: Literal['x', 'y', 'z'],
-    array_type: Literal['number', 'string'] = 'number'
-) -> List[List[float]]:
+    array_type: Literal['number', 'string', 'array'] = 'number',
+    time_point: Optional[int] = None
+) -> List[List[float]] | np.ndarray:
     """Extract a 2D slice from a NIfTI image along a specified axis.
 
     Parameters
     ----------
     nifti_data : np.ndarray
-        Input NIfTI data
+        Input NIfTI data, or an image data object (e.g. img.dataobj), in
+        which case only the slice is read
     slice_index : int
         Index of the slice to extract
     axis : Literal['x', 'y', 'z']
         Axis along which to take the slice
-    array_type : Literal['number', 'string']
-        The type of elements in the input array
+    array_type : Literal['number', 'string', 'array']
+        The type of elements in the input array. 'array' returns the
+        slice as a C-contiguous float32 array with NaN values preserved
+    time_point : Optional[int]
+        Index of the time point to take the slice from, if nifti_data is 4D.
+        Passing the 4D data object reads only the slice of that time point
     Returns
     -------
     2D numpy array containing the slice data, transposed for display
     """
-    # Extract the slice data
-    if axis == 'x':
-        slice_data = np.squeeze(
-            nifti_data[slice_index, :, :]
-        ).transpose()
-    elif axis == 'y':
-        slice_data = np.squeeze(
-            nifti_data[:, slice_index, :]
-        ).transpose()
-    elif axis == 'z':
-        slice_data = np.squeeze(
-            nifti_data[:, :, slice_index]
-        ).transpose()
+    slice_data = _index_slice(nifti_data, slice_index, axis, time_point)
 
     # convert to list if string
     if array_type == 'string':
         return slice_data.tolist()
+    # keep as contiguous float32 array for binary encoding
+    elif array_type == 'array':
+        return np.ascontiguousarray(slice_data, dtype=np.float32)
     # otherwise sanitize for json (e.g. handle NaN values)
     else:
-        return sanitize_array_for_json(slice_data)
+        return sanitize_array_for_json(
+            np.asarray(slice_data, dtype=np.float64)
+        )
+
+
+def _index_slice(
+    nifti_data: np.ndarray,
+    slice_index: int,
+    axis: Literal['x', 'y', 'z'],
+    time_point: Optional[int] = None
+) -> np.ndarray:
+    """Index a 2D slice (of a time point, if given), transposed for display.
+    For array data, the slice is a view of the data."""
+    # index the slice (and time point, if any) in a single step; an integer
+    # index drops its axis, so only remaining singleton axes need squeezing
+    index = [slice(None)] * 3
+    index[SLICE_AXES[axis]] = slice_index
+    if time_point is not None:
+        index.append(time_point)
+    slice_data = nifti_data[tuple(index)]
+    if slice_data.ndim > 2:
+        slice_data = np.squeeze(slice_data)
+    # transpose for display (a view; copied once on output)
+    return slice_data.T
 
 
 def get_timecourse_nifti(
@@ -195,7 +337,11 @@ def get_timecourse_nifti(
     """
     # create time course label
     time_course_label = f'Voxel: (x={x}, y={y}, z={z})'
-    time_course = func_img.get_fdata()[x, y, z, :].tolist()
+    # index the image data, so only the voxel's values are read from
+    # uncompressed files
+    time_course = np.asarray(
+        get_image_data(func_img)[x, y, z, :], dtype=np.float64
+    ).tolist()
     return time_course, time_course_label
 
 
@@ -221,9 +367,5 @@ def threshold_nifti_data(
         Thresholded array. Voxels with values outside 
         the threshold range are set to None.
     """
-    # create mask
-    mask = (nifti_data >= threshold_min) & (nifti_data <= threshold_max)
-    # apply mask
-    nifti_data[mask] = np.nan
-    return nifti_data
+    return mask_range_with_nan(nifti_data, threshold_min, threshold_max)
 
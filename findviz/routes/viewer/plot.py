@@ -29,17 +29,36 @@ Routes:
     UPDATE_NIFTI_VIEW_STATE: Update nifti view state (ortho or montage)
 """
 
-import json
-
-from flask import Blueprint, request
+from flask import Blueprint
 
 from findviz.logger_config import setup_logger
 from findviz.routes.utils import (
+    conditional_response,
     convert_value,
     handle_context,
+    handle_getter_route,
     handle_route_errors,
+    parse_request,
     Routes
 )
+from findviz.routes.schemas import (
+    AddAnnotationMarkerRequest,
+    ChangeTaskConvolutionRequest,
+    CheckTsPreprocessedRequest,
+    MoveAnnotationSelectionRequest,
+    PlotOptionsLabelRequest,
+    ResetTimecourseShiftRequest,
+    TimecourseShiftHistoryRequest,
+    UpdateAnnotationMarkerPlotOptionsRequest,
+    UpdateDistancePlotOptionsRequest,
+    UpdateFmriPlotOptionsRequest,
+    UpdateNiftiViewStateRequest,
+    UpdateTaskDesignPlotOptionsRequest,
+    UpdateTimecourseGlobalPlotOptionsRequest,
+    UpdateTimecoursePlotOptionsRequest,
+    UpdateTimecourseShiftRequest,
+    UpdateTimemarkerPlotOptionsRequest
+)
 from findviz.routes.shared import data_manager
 
 logger = setup_logger(__name__)
@@ -56,9 +75,9 @@ plot_bp = Blueprint('plot', __name__)
 )
 def add_annotation_marker() -> dict:
     """Add annotation marker"""
-    marker = convert_value(request.form['marker'])
-    data_manager.ctx.add_annotation_markers(marker)
-    return {'marker': marker}
+    params = parse_request(AddAnnotationMarkerRequest)
+    data_manager.ctx.add_annotation_markers(params.marker)
+    return {'marker': params.marker}
 
 
 @plot_bp.route(Routes.CHANGE_TASK_CONVOLUTION.value, methods=['POST'])
@@ -70,9 +89,9 @@ def add_annotation_marker() -> dict:
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.CHANGE_TASK_CONVOLUTION
 )
-def change_task_convolution() -> int:
+def change_task_convolution() -> tuple[str, int]:
     """Change task convolution globally across all tasks"""
-    convolution = convert_value(request.form['convolution'])
+    convolution = parse_request(ChangeTaskConvolutionRequest).convolution
     data_manager.ctx.update_timecourse_global_plot_options(
         {'global_convolution': convolution}
     )
@@ -81,11 +100,10 @@ def change_task_convolution() -> int:
     else:
         conv_type = 'block'
     # update all task design plot options
-    for label in data_manager.ctx.task_plot_options:
-        data_manager.ctx.update_task_design_plot_options(
-            label, {'convolution': conv_type}
-        )
-    return {'status': 'success'}
+    data_manager.ctx.update_all_task_design_plot_options(
+        {'convolution': conv_type}
+    )
+    return '', 204
 
 
 @plot_bp.route(Routes.CHECK_FMRI_PREPROCESSED.value, methods=['POST'])
@@ -111,10 +129,9 @@ def check_fmri_preprocessed() -> dict:
 )
 def check_ts_preprocessed() -> dict:
     """Check if timecourse is preprocessed"""
-    label = convert_value(request.form['label'])
-    ts_type = convert_value(request.form['ts_type'])
-    if ts_type == 'timecourse':
-        is_preprocessed = data_manager.ctx.check_ts_preprocessed(label)
+    params = parse_request(CheckTsPreprocessedRequest)
+    if params.ts_type == 'timecourse':
+        is_preprocessed = data_manager.ctx.check_ts_preprocessed(params.label)
     else:
         # task design is not preprocessed
         is_preprocessed = False
@@ -130,19 +147,18 @@ def check_ts_preprocessed() -> dict:
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.CLEAR_ANNOTATION_MARKERS
 )
-def clear_annotation_markers() -> dict:
+def clear_annotation_markers() -> tuple[str, int]:
     """Clear annotation markers"""
     data_manager.ctx.clear_annotation_markers()
-    return {'status': 'success'}
+    return '', 204
 
 
 @plot_bp.route(Routes.GET_ANNOTATION_MARKERS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in annotation markers request',
-    log_msg='Retrieved annotation markers successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_ANNOTATION_MARKERS
+    route=Routes.GET_ANNOTATION_MARKERS,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_annotation_markers() -> dict:
     """Get annotation markers, annotation selection, and annotation plot options"""
@@ -157,12 +173,11 @@ def get_annotation_markers() -> dict:
 
 
 @plot_bp.route(Routes.GET_ANNOTATION_MARKER_PLOT_OPTIONS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in get annotation marker plot options request',
-    log_msg='Retrieved annotation marker plot options successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_ANNOTATION_MARKER_PLOT_OPTIONS
+    route=Routes.GET_ANNOTATION_MARKER_PLOT_OPTIONS,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_annotation_marker_plot_options() -> dict:
     """Get annotation marker plot options"""
@@ -170,12 +185,11 @@ def get_annotation_marker_plot_options() -> dict:
 
 
 @plot_bp.route(Routes.GET_DISTANCE_PLOT_OPTIONS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in distance plot options request',
-    log_msg='Retrieved distance plot options successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_DISTANCE_PLOT_OPTIONS
+    route=Routes.GET_DISTANCE_PLOT_OPTIONS,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_distance_plot_options() -> dict:
     """Get current distance plot options."""
@@ -183,12 +197,11 @@ def get_distance_plot_options() -> dict:
 
 
 @plot_bp.route(Routes.GET_FMRI_PLOT_OPTIONS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in get fMRI plot options request',
-    log_msg='Retrieved fMRI plot options successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_FMRI_PLOT_OPTIONS
+    route=Routes.GET_FMRI_PLOT_OPTIONS,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_fmri_plot_options() -> dict:
     """Get current fMRI plot options."""
@@ -196,12 +209,11 @@ def get_fmri_plot_options() -> dict:
 
 
 @plot_bp.route(Routes.GET_NIFTI_VIEW_STATE.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in nifti view state request',
-    log_msg='Retrieved nifti view state successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_NIFTI_VIEW_STATE
+    route=Routes.GET_NIFTI_VIEW_STATE,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_nifti_view_state() -> dict:
     """Get current nifti view state"""
@@ -209,6 +221,7 @@ def get_nifti_view_state() -> dict:
 
 
 @plot_bp.route(Routes.GET_TASK_DESIGN_PLOT_OPTIONS.value, methods=['GET'])
+@conditional_response()
 @handle_context()
 @handle_route_errors(
     error_msg='Unknown error in task design plot options request',
@@ -219,17 +232,16 @@ def get_nifti_view_state() -> dict:
 )
 def get_task_design_plot_options() -> dict:
     """Get current task design plot options"""
-    label = convert_value(request.args.get('label'))
+    label = parse_request(PlotOptionsLabelRequest).label
     return data_manager.ctx.get_task_design_plot_options(label)
 
 
 @plot_bp.route(Routes.GET_TIMECOURSE_GLOBAL_PLOT_OPTIONS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in timecourse global plot options request',
-    log_msg='Retrieved timecourse global plot options successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_TIMECOURSE_GLOBAL_PLOT_OPTIONS
+    route=Routes.GET_TIMECOURSE_GLOBAL_PLOT_OPTIONS,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_timecourse_global_plot_options() -> dict:
     """Get current timecourse global plot options"""
@@ -237,6 +249,7 @@ def get_timecourse_global_plot_options() -> dict:
 
 
 @plot_bp.route(Routes.GET_TIMECOURSE_PLOT_OPTIONS.value, methods=['GET'])
+@conditional_response()
 @handle_context()
 @handle_route_errors(
     error_msg='Unknown error in timecourse plot options request',
@@ -247,7 +260,7 @@ def get_timecourse_global_plot_options() -> dict:
 )
 def get_timecourse_plot_options() -> dict:
     """Get current timecourse plot options"""
-    label = convert_value(request.args.get('label'))
+    label = parse_request(PlotOptionsLabelRequest).label
     return data_manager.ctx.get_timecourse_plot_options(label)
 
 
@@ -262,18 +275,18 @@ def get_timecourse_plot_options() -> dict:
 )
 def get_timecourse_shift_history() -> dict:
     """Get current timecourse shift history"""
-    label = convert_value(request.args.get('label'))
-    source = convert_value(request.args.get('source'))
-    return data_manager.ctx.get_timecourse_shift_history(label, source)
+    params = parse_request(TimecourseShiftHistoryRequest)
+    return data_manager.ctx.get_timecourse_shift_history(
+        params.label, params.source
+    )
 
 
 @plot_bp.route(Routes.GET_TIMEMARKER_PLOT_OPTIONS.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@conditional_response()
+@handle_getter_route(
     error_msg='Unknown error in timemarker plot options request',
-    log_msg='Retrieved timemarker plot options successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_TIMEMARKER_PLOT_OPTIONS
+    route=Routes.GET_TIMEMARKER_PLOT_OPTIONS,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_timemarker_plot_options() -> dict:
     """Get current timemarker plot options"""
@@ -281,12 +294,10 @@ def get_timemarker_plot_options() -> dict:
 
 
 @plot_bp.route(Routes.GET_TS_FMRI_PLOTTED.value, methods=['GET'])
-@handle_context()
-@handle_route_errors(
+@handle_getter_route(
     error_msg='Unknown error in get ts fmri plotted request',
-    log_msg='Retrieved ts fmri plotted successfully',
-    fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
-    route=Routes.GET_TS_FMRI_PLOTTED
+    route=Routes.GET_TS_FMRI_PLOTTED,
+    fmri_file_type=lambda: data_manager.ctx.fmri_file_type
 )
 def get_ts_fmri_plotted() -> dict:
     """Get whether an fmri timecourse is plotted"""
@@ -303,7 +314,7 @@ def get_ts_fmri_plotted() -> dict:
 )
 def move_annotation_selection() -> dict:
     """Move annotation selection"""
-    direction = convert_value(request.form['direction'])
+    direction = parse_request(MoveAnnotationSelectionRequest).direction
     selected_marker = data_manager.ctx.move_annotation_selection(direction)
     return {'selected_marker': selected_marker}
 
@@ -316,10 +327,10 @@ def move_annotation_selection() -> dict:
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.REMOVE_DISTANCE_PLOT
 )
-def remove_distance_plot() -> dict:
+def remove_distance_plot() -> tuple[str, int]:
     """Remove distance plot"""
     data_manager.ctx.clear_distance_plot_state()
-    return {'status': 'success'}
+    return '', 204
 
 
 @plot_bp.route(Routes.RESET_FMRI_COLOR_OPTIONS.value, methods=['POST'])
@@ -330,10 +341,10 @@ def remove_distance_plot() -> dict:
     fmri_file_type=lambda: data_manager.ctx.fmri_file_type,
     route=Routes.RESET_FMRI_COLOR_OPTIONS
 )
-def reset_fmri_color_options() -> dict:
+def reset_fmri_color_options() -> tuple[str, int]:
     """Reset fMRI color options to defaults."""
     data_manager.ctx.reset_fmri_color_options()
-    return {'status': 'success'}
+    return '', 204
 
 
 @plot_bp.route(Routes.RESET_TIMECOURSE_SHIFT.value, methods=['POST'])
@@ -345,13 +356,13 @@ def reset_fmri_color_options() -> dict:
     route=Routes.RESET_TIMECOURSE_SHIFT,
     route_parameters=['label', 'source', 'change_type']
 )
-def reset_timecourse_shift() -> dict:
+def reset_timecourse_shift() -> tuple[str, int]:
     """Reset timecourse shift"""
-    label = convert_value(request.form['label'])
-    change_type = convert_value(request.form['change_type'])
-    source = convert_value(request.form['source'])
-    data_manager.ctx.reset_timecourse_shift(label, change_type, source)
-    return {'status': 'success'}
+    params = parse_request(ResetTimecourseShiftRequest)
+    data_manager.ctx.reset_timecourse_shift(
+        params.label, params.change_type, params.source
+    )
+    return '', 204
 
 
 @plot_bp.route(Routes.UNDO_ANNOTATION_MARKER.value, methods=['POST'])
@@ -385,11 +396,11 @@ def undo_annotation_marker() -> dict:
     route=Routes.UPDATE_DISTANCE_PLOT_OPTIONS,
     route_parameters=['distance_plot_options']
 )
-def update_distance_plot_options() -> dict:
+def update_distance_plot_options() -> tuple[str, int]:
     """Update distance plot options"""
-    distance_plot_options = json.loads(request.form['distance_plot_options'])
-    data_manager.ctx.update_distance_plot_options(distance_plot_options)
-    return {'status': 'success'}
+    params = parse_request(UpdateDistancePlotOptionsRequest)
+    data_manager.ctx.update_distance_plot_options(params.distance_plot_options)
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_FMRI_PLOT_OPTIONS.value, methods=['POST'])
@@ -401,11 +412,11 @@ def update_distance_plot_options() -> dict:
     route=Routes.UPDATE_FMRI_PLOT_OPTIONS,
     route_parameters=['fmri_plot_options']
 )
-def update_fmri_plot_options() -> dict:
+def update_fmri_plot_options() -> tuple[str, int]:
     """Update plot options based on form data."""
-    fmri_plot_options = json.loads(request.form['fmri_plot_options'])
-    data_manager.ctx.update_fmri_plot_options(fmri_plot_options)
-    return {'status': 'success'}
+    params = parse_request(UpdateFmriPlotOptionsRequest)
+    data_manager.ctx.update_fmri_plot_options(params.fmri_plot_options)
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_ANNOTATION_MARKER_PLOT_OPTIONS.value, methods=['POST'])
@@ -417,15 +428,13 @@ def update_fmri_plot_options() -> dict:
     route=Routes.UPDATE_ANNOTATION_MARKER_PLOT_OPTIONS,
     route_parameters=['annotation_marker_plot_options']
 )
-def update_annotation_marker_plot_options() -> dict:
+def update_annotation_marker_plot_options() -> tuple[str, int]:
     """Update annotation marker plot options"""
-    annotation_marker_plot_options = json.loads(
-        request.form['annotation_marker_plot_options']
-    )
+    params = parse_request(UpdateAnnotationMarkerPlotOptionsRequest)
     data_manager.ctx.update_annotation_marker_plot_options(
-        annotation_marker_plot_options
+        params.annotation_marker_plot_options
     )
-    return {'status': 'success'}
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_NIFTI_VIEW_STATE.value, methods=['POST'])
@@ -437,11 +446,11 @@ def update_annotation_marker_plot_options() -> dict:
     route=Routes.UPDATE_NIFTI_VIEW_STATE,
     route_parameters=['view_state']
 )
-def update_nifti_view_state() -> dict:
+def update_nifti_view_state() -> tuple[str, int]:
     """Update nifti view state"""
-    view_state = convert_value(request.form['view_state'])
+    view_state = parse_request(UpdateNiftiViewStateRequest).view_state
     data_manager.ctx.update_view_state(view_state)
-    return {'status': 'success'}
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_TASK_DESIGN_PLOT_OPTIONS.value, methods=['POST'])
@@ -453,12 +462,13 @@ def update_nifti_view_state() -> dict:
     route=Routes.UPDATE_TASK_DESIGN_PLOT_OPTIONS,
     route_parameters=['label']
 )
-def update_task_design_plot_options() -> dict:
+def update_task_design_plot_options() -> tuple[str, int]:
     """Update task design plot options"""
-    label = convert_value(request.form['label'])
-    task_design_plot_options = json.loads(request.form['task_design_plot_options'])
-    data_manager.ctx.update_task_design_plot_options(label, task_design_plot_options)
-    return {'status': 'success'}
+    params = parse_request(UpdateTaskDesignPlotOptionsRequest)
+    data_manager.ctx.update_task_design_plot_options(
+        params.label, params.task_design_plot_options
+    )
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_TIMECOURSE_GLOBAL_PLOT_OPTIONS.value, methods=['POST'])
@@ -470,15 +480,13 @@ def update_task_design_plot_options() -> dict:
     route=Routes.UPDATE_TIMECOURSE_GLOBAL_PLOT_OPTIONS,
     route_parameters=['timecourse_global_plot_options']
 )
-def update_timecourse_global_plot_options() -> dict:
+def update_timecourse_global_plot_options() -> tuple[str, int]:
     """Update timecourse global plot options"""
-    timecourse_global_plot_options = json.loads(
-        request.form['timecourse_global_plot_options']
-    )
+    params = parse_request(UpdateTimecourseGlobalPlotOptionsRequest)
     data_manager.ctx.update_timecourse_global_plot_options(
-        timecourse_global_plot_options
+        params.timecourse_global_plot_options
     )
-    return {'status': 'success'}
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_TIMECOURSE_PLOT_OPTIONS.value, methods=['POST'])
@@ -490,17 +498,18 @@ def update_timecourse_global_plot_options() -> dict:
     route=Routes.UPDATE_TIMECOURSE_PLOT_OPTIONS,
     route_parameters=['label', 'timecourse_plot_options']
 )
-def update_timecourse_plot_options() -> dict:
+def update_timecourse_plot_options() -> tuple[str, int]:
     """Update timecourse plot options"""
-    label = convert_value(request.form['label'])
-    timecourse_plot_options = json.loads(request.form['timecourse_plot_options'])
-    # convert values
+    params = parse_request(UpdateTimecoursePlotOptionsRequest)
+    # convert values sent as strings (json values are already typed)
     timecourse_plot_options = {
-        convert_value(key): convert_value(value)
-        for key, value in timecourse_plot_options.items()
+        key: convert_value(value) if isinstance(value, str) else value
+        for key, value in params.timecourse_plot_options.items()
     }
-    data_manager.ctx.update_timecourse_plot_options(label, timecourse_plot_options)
-    return {'status': 'success'}
+    data_manager.ctx.update_timecourse_plot_options(
+        params.label, timecourse_plot_options
+    )
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_TIMECOURSE_SHIFT.value, methods=['POST'])
@@ -512,14 +521,13 @@ def update_timecourse_plot_options() -> dict:
     route=Routes.UPDATE_TIMECOURSE_SHIFT,
     route_parameters=['label', 'source', 'change_type', 'change_direction']
 )
-def update_timecourse_shift() -> dict:
+def update_timecourse_shift() -> tuple[str, int]:
     """Update timecourse shift"""
-    label = convert_value(request.form['label'])
-    source = convert_value(request.form['source'])
-    change_type = convert_value(request.form['change_type'])
-    change_direction = convert_value(request.form['change_direction'])
-    data_manager.ctx.update_timecourse_shift(label, source, change_type, change_direction)
-    return {'status': 'success'}
+    params = parse_request(UpdateTimecourseShiftRequest)
+    data_manager.ctx.update_timecourse_shift(
+        params.label, params.source, params.change_type, params.change_direction
+    )
+    return '', 204
 
 
 @plot_bp.route(Routes.UPDATE_TIMEMARKER_PLOT_OPTIONS.value, methods=['POST'])
@@ -531,9 +539,10 @@ def update_timecourse_shift() -> dict:
     route=Routes.UPDATE_TIMEMARKER_PLOT_OPTIONS,
     route_parameters=['timemarker_plot_options']
 )
-def update_timemarker_plot_options() -> dict:
+def update_timemarker_plot_options() -> tuple[str, int]:
     """Update timemarker plot options"""
-    timemarker_plot_options = json.loads(request.form['timemarker_plot_options'])
-    data_manager.ctx.update_time_marker_plot_options(timemarker_plot_options)
-    return {'status': 'success'}
-
+    params = parse_request(UpdateTimemarkerPlotOptionsRequest)
+    data_manager.ctx.update_time_marker_plot_options(
+        params.timemarker_plot_options
+    )
+    return '', 204
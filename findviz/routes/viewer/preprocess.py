@@ -7,9 +7,8 @@ Routes:
     RESET_FMRI_PREPROCESS: Reset fmri preprocessing
     RESET_TIMECOURSE_PREPROCESS: Reset timecourse preprocessing
 """
-import json
 
-from flask import Blueprint, request, make_response
+from flask import Blueprint, current_app, request, make_response
 
 from findviz.logger_config import setup_logger
 from findviz.routes.shared import data_manager
@@ -92,7 +91,7 @@ def get_preprocessed_fmri() -> dict:
 )
 def get_preprocessed_timecourse() -> dict:
     """Get preprocessed timecourse data"""
-    ts_labels = json.loads(request.form['ts_labels'])
+    ts_labels = current_app.json.loads(request.form['ts_labels'])
     params = {
         key: convert_value(value) for key, value in request.form.items()
         if key != 'ts_labels'
@@ -151,7 +150,7 @@ def reset_fmri_preprocess() -> dict:
 )
 def reset_timecourse_preprocess() -> dict:
     """Reset timecourse preprocessing"""
-    ts_labels = json.loads(request.form['ts_labels'])
+    ts_labels = current_app.json.loads(request.form['ts_labels'])
     # check if no timecourse labels provided
     if len(ts_labels) == 0:
         raise PreprocessInputError(
@@ -20,6 +20,7 @@ export const API_ENDPOINTS = {
         GET_DIRECTION_LABEL_COORDS: '/get_direction_label_coords',
         GET_DISTANCE_DATA: '/get_distance_data',
         GET_FMRI_DATA: '/get_fmri_data',
+        GET_FMRI_DATA_RANGE: '/get_fmri_data_range',
         GET_LAST_TIMECOURSE: '/get_last_timecourse',
         GET_MONTAGE_DATA: '/get_montage_data',
         GET_TASK_CONDITIONS: '/get_task_conditions',
@@ -7,6 +7,7 @@ import {
     getDirectionLabelCoords,
     getDistanceData,
     getFMRIData,
+    getFMRIDataRange,
     getClickCoords,
     getCoordLabels,
     getLastTimecourse,
@@ -110,6 +111,7 @@ class ViewerContextManager {
             getDirectionLabelCoords: (...args) => this.wrapApiCall(getDirectionLabelCoords, ...args),
             getDistanceData: (...args) => this.wrapApiCall(getDistanceData, ...args),
             getFMRIData: (...args) => this.wrapApiCall(getFMRIData, ...args),
+            getFMRIDataRange: (...args) => this.wrapApiCall(getFMRIDataRange, ...args),
             getClickCoords: (...args) => this.wrapApiCall(getClickCoords, ...args),
             getCoordLabels: (...args) => this.wrapApiCall(getCoordLabels, ...args),
             getLastTimecourse: (...args) => this.wrapApiCall(getLastTimecourse, ...args),
@@ -127,13 +127,15 @@ export const getDirectionLabelCoords = async (context_id) => {
 
 /**
  * Fetches distance vector from the server
- * @returns {Promise} Promise object representing the API call
+ * @returns {Promise} Promise object resolving to the distance vector (Float32Array)
  */
 export const getDistanceData = async (context_id) => {
     return makeRequest(
         API_ENDPOINTS.DATA.GET_DISTANCE_DATA,
         {
             method: 'GET', 
+            // request distance vector as a binary float32 buffer
+            headers: { 'Accept': 'application/octet-stream' },
             body: createFormData({ context_id }) 
         },
         {
@@ -152,6 +154,8 @@ export const getFMRIData = async (context_id) => {
         API_ENDPOINTS.DATA.GET_FMRI_DATA,
         { 
             method: 'GET', 
+            // request slice/vertex arrays as binary float32 buffers
+            headers: { 'Accept': 'application/octet-stream' },
             body: createFormData({ context_id }) 
         },
         {
@@ -160,6 +164,34 @@ export const getFMRIData = async (context_id) => {
     );
 };
 
+/**
+ * Fetches FMRI data for a batch of timepoints [start, end) from the server.
+ * The server caches the frames, so that subsequent getFMRIData requests
+ * for these timepoints are served without re-slicing the image.
+ * @param {number} start - First timepoint of the batch
+ * @param {number} end - Timepoint after the last of the batch
+ * @param {boolean} warmOnly - Only cache the frames on the server; the
+ *   response has no content
+ * @param {string} context_id - ID of context to switch to
+ * @returns {Promise} Promise object representing the API call
+ */
+export const getFMRIDataRange = async (start, end, warmOnly, context_id) => {
+    return makeRequest(
+        API_ENDPOINTS.DATA.GET_FMRI_DATA_RANGE,
+        {
+            method: 'GET',
+            // request slice/vertex arrays as binary float32 buffers
+            headers: { 'Accept': 'application/octet-stream' },
+            body: createFormData({
+                start, end, warm_only: warmOnly, context_id
+            })
+        },
+        {
+            errorPrefix: 'Error fetching FMRI data range'
+        }
+    );
+};
+
 /**
  * Fetches last added fmri timecourse from the server
  * @param {string} context_id - ID of context to switch to
@@ -226,6 +258,8 @@ export const getTimeCourseData = async (ts_labels = null, context_id) => {
         API_ENDPOINTS.DATA.GET_TIMECOURSE_DATA,
         {
             method: 'GET',
+            // request timecourses as binary float32 buffers
+            headers: { 'Accept': 'application/octet-stream' },
             body: createFormData({ ts_labels, context_id })
         },
         {
@@ -305,12 +339,14 @@ export const getTimePoint = async (context_id) => {
 };
 
 /**
- * Fetches timepoints from the server
+ * Fetches timepoints from the server. The server returns a range
+ * descriptor ({n_timepoints, start, step}) that is expanded here, or the
+ * list of timepoints ({timepoints}) if they are not evenly spaced.
  * @param {string} context_id - ID of context to switch to
- * @returns {Promise} Promise object representing the API call
+ * @returns {Promise} Promise resolving to {timepoints: number[]}
  */
 export const getTimePoints = async (context_id) => {
-    return makeRequest(
+    const response = await makeRequest(
         API_ENDPOINTS.DATA.GET_TIMEPOINTS,
         {
             method: 'GET',
@@ -320,6 +356,23 @@ export const getTimePoints = async (context_id) => {
             errorPrefix: 'Error fetching timepoints'
         }
     );
+    if ('timepoints' in response) {
+        return response;
+    }
+    return { timepoints: expandTimepointsRange(response) };
+};
+
+/**
+ * Expand a timepoint range descriptor into the list of timepoints
+ * (rounded to 5 decimals, as when converting timepoints to seconds)
+ * @param {Object} timepointsRange - {n_timepoints, start, step}
+ * @returns {number[]} timepoints
+ */
+const expandTimepointsRange = ({ n_timepoints, start, step }) => {
+    return Array.from(
+        { length: n_timepoints },
+        (_, i) => Math.round((start + i * step) * 1e5) / 1e5
+    );
 };
 
 
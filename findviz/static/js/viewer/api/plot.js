@@ -51,7 +51,7 @@ export const addAnnotationMarker = async (marker, context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.ADD_ANNOTATION_MARKER,
         {
             method: 'POST',
-            body: createFormData({ marker, context_id })
+            body: JSON.stringify({ marker, context_id })
         },
         {
             errorPrefix: 'Error adding annotation marker'
@@ -69,7 +69,7 @@ export const clearAnnotationMarkers = async (context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.CLEAR_ANNOTATION_MARKERS,
         {
             method: 'POST',
-            body: createFormData({ context_id })
+            body: JSON.stringify({ context_id })
         },
         {
             errorPrefix: 'Error clearing annotation markers'
@@ -88,7 +88,7 @@ export const changeTaskConvolution = async (convolution, context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.CHANGE_TASK_CONVOLUTION,
         {
             method: 'POST',
-            body: createFormData({ convolution, context_id })
+            body: JSON.stringify({ convolution, context_id })
         },
         { errorPrefix: 'Error changing task convolution' }
     );
@@ -105,7 +105,7 @@ export const checkFmriPreprocessed = async (context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.CHECK_FMRI_PREPROCESSED, 
         { 
             method: 'POST', 
-            body: createFormData({ context_id }) 
+            body: JSON.stringify({ context_id }) 
         }, 
         { errorPrefix: 'Error checking fmri preprocessed' }
     );
@@ -124,7 +124,7 @@ export const checkTsPreprocessed = async (label, ts_type, context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.CHECK_TS_PREPROCESSED,
         {
             method: 'POST',
-            body: createFormData({ label, ts_type, context_id })
+            body: JSON.stringify({ label, ts_type, context_id })
         },
         { errorPrefix: 'Error checking time course preprocessed' }
     );
@@ -351,7 +351,7 @@ export const moveAnnotationSelection = async (direction, context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.MOVE_ANNOTATION_SELECTION,
         {
             method: 'POST',
-            body: createFormData({ direction, context_id })
+            body: JSON.stringify({ direction, context_id })
         },
         {
             errorPrefix: 'Error moving annotation selection'
@@ -369,7 +369,7 @@ export const resetFmriColorOptions = async (context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.RESET_FMRI_COLOR_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({ context_id })
+            body: JSON.stringify({ context_id })
         },
         {
             errorPrefix: 'Error resetting color options'
@@ -390,7 +390,7 @@ export const resetTimeCourseShift = async (label, source, change_type, context_i
         API_ENDPOINTS.PLOT_OPTIONS.RESET_TIMECOURSE_SHIFT,
         {
             method: 'POST',
-            body: createFormData({ label, source, change_type, context_id })
+            body: JSON.stringify({ label, source, change_type, context_id })
         },
         { errorPrefix: 'Error resetting time course shift' }
     );
@@ -404,7 +404,7 @@ export const removeDistancePlot = async (context_id) => {
     return makeRequest(
         API_ENDPOINTS.PLOT_OPTIONS.REMOVE_DISTANCE_PLOT,
         { method: 'POST',
-            body: createFormData({ context_id })
+            body: JSON.stringify({ context_id })
         },
         { errorPrefix: 'Error removing distance plot' }
     );
@@ -418,7 +418,7 @@ export const undoAnnotationMarker = async (context_id) => {
     return makeRequest(
         API_ENDPOINTS.PLOT_OPTIONS.UNDO_ANNOTATION_MARKER,
         { method: 'POST',
-            body: createFormData({ context_id })
+            body: JSON.stringify({ context_id })
         },
         {
             errorPrefix: 'Error undoing annotation marker'
@@ -437,7 +437,7 @@ export const updateAnnotationMarkerPlotOptions = async (annotationMarkerPlotOpti
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_ANNOTATION_MARKER_PLOT_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 annotation_marker_plot_options: annotationMarkerPlotOptions,
                 context_id
             })
@@ -457,7 +457,7 @@ export const updateDistancePlotOptions = async (plotOptions, context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_DISTANCE_PLOT_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 distance_plot_options: plotOptions,
                 context_id
             })
@@ -478,7 +478,7 @@ export const updateFmriPlotOptions = async (plotOptions, context_id) => {
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_FMRI_PLOT_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 fmri_plot_options: plotOptions,
                 context_id
             })
@@ -499,7 +499,7 @@ export const updateNiftiViewState = async (viewState, context_id) => {
     return makeRequest(
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_NIFTI_VIEW_STATE,
         { method: 'POST',
-            body: createFormData({ view_state: viewState, context_id })
+            body: JSON.stringify({ view_state: viewState, context_id })
         },
         { errorPrefix: 'Error updating nifti view state' }
     );
@@ -517,7 +517,7 @@ export const updateTaskDesignPlotOptions = async (label, taskDesignPlotOptions,
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_TASK_DESIGN_PLOT_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 label,
                 task_design_plot_options: taskDesignPlotOptions,
                 context_id
@@ -539,7 +539,7 @@ export const updateTimeCoursePlotOptions = async (label, timeCoursePlotOptions,
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_TIMECOURSE_PLOT_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 label,
                 timecourse_plot_options: timeCoursePlotOptions,
                 context_id
@@ -560,7 +560,7 @@ export const updateTimeCourseGlobalPlotOptions = async (timeCourseGlobalPlotOpti
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_TIMECOURSE_GLOBAL_PLOT_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 timecourse_global_plot_options: timeCourseGlobalPlotOptions,
                 context_id
             })
@@ -589,7 +589,7 @@ export const updateTimeCourseShift = async (
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_TIMECOURSE_SHIFT,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 label,
                 source,
                 change_type,
@@ -612,7 +612,7 @@ export const updateTimeMarkerPlotOptions = async (timeMarkerPlotOptions, context
         API_ENDPOINTS.PLOT_OPTIONS.UPDATE_TIMEMARKER_PLOT_OPTIONS,
         {
             method: 'POST',
-            body: createFormData({
+            body: JSON.stringify({
                 timemarker_plot_options: timeMarkerPlotOptions,
                 context_id
             })
@@ -81,6 +81,17 @@ export const makeRequest = async (url, options, errorConfig) => {
             clearInlineError(errorConfig.errorId);
         }
 
+        // Updates without a result respond with 204 No Content
+        if (response.status === 204) {
+            return null;
+        }
+
+        // Binary array payloads (see decodeBinaryPayload)
+        const contentType = response.headers.get('Content-Type') || '';
+        if (contentType.startsWith('application/octet-stream')) {
+            return decodeBinaryPayload(await response.arrayBuffer());
+        }
+
         const data = await response.json();
 
         return data || null;
@@ -90,6 +101,52 @@ export const makeRequest = async (url, options, errorConfig) => {
     }
 };
 
+/**
+ * Decodes a binary payload returned by the server (encode_binary_payload).
+ * Layout: uint32 (little-endian) header length, utf-8 JSON header, padding
+ * to a 4-byte boundary, then float32 array buffers. Each {'__buffer__': i}
+ * reference in the header data is replaced by a Float32Array view (1D) or
+ * an array of Float32Array row views (2D). NaN values are preserved.
+ * @param {ArrayBuffer} buffer - Binary response body
+ * @returns {Object} Decoded payload
+ */
+export const decodeBinaryPayload = (buffer) => {
+    const headerLength = new DataView(buffer).getUint32(0, true);
+    const header = JSON.parse(
+        new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength))
+    );
+    const start = Math.ceil((4 + headerLength) / 4) * 4;
+
+    const arrays = header.buffers.map(({ shape, offset }) => {
+        const size = shape.reduce((a, b) => a * b, 1);
+        const flat = new Float32Array(buffer, start + offset, size);
+        if (shape.length !== 2) {
+            return flat;
+        }
+        const [rows, cols] = shape;
+        return Array.from(
+            { length: rows },
+            (_, i) => flat.subarray(i * cols, (i + 1) * cols)
+        );
+    });
+
+    const restore = (obj) => {
+        if (Array.isArray(obj)) {
+            return obj.map(restore);
+        }
+        if (obj !== null && typeof obj === 'object') {
+            if ('__buffer__' in obj) {
+                return arrays[obj.__buffer__];
+            }
+            return Object.fromEntries(
+                Object.entries(obj).map(([key, value]) => [key, restore(value)])
+            );
+        }
+        return obj;
+    };
+    return restore(header.data);
+};
+
 /**
  * Creates FormData from an object
  * @param {Object} data - Object to convert to FormData
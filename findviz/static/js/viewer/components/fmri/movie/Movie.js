@@ -2,6 +2,9 @@
 import { EVENT_TYPES } from '../../../../constants/EventTypes.js';
 import ContextManager from '../../../api/ContextManager.js';
 
+// number of timepoints fetched per batch during playback
+const PREFETCH_BATCH_SIZE = 16;
+
 /**
  * Movie class for handling fMRI time point animation
  */
@@ -21,6 +24,8 @@ class Movie {
         this.intervalId = null;
         this.eventBus = eventBus;
         this.contextManager = contextManager;
+        // timepoint after the last prefetched batch
+        this.prefetchEnd = null;
 
         // get interval time from state
         this.getIntervalTime();
@@ -64,6 +69,9 @@ class Movie {
             let maxValue = this.timeSlider.slider('getAttribute', 'max');
 
             if (currentValue < maxValue) {
+                // the displayed timepoint is fetched by the slider change,
+                // so prefetching starts at the timepoint after it
+                this.prefetch(currentValue + 2, maxValue);
                 this.timeSlider.slider('setValue', currentValue + 1);
                 this.timeSlider.trigger('change');
             } else {
@@ -72,11 +80,33 @@ class Movie {
         }, this.intervalTime);
     }
 
+    /**
+     * Warm the server's frame cache with the next batch of timepoints, once
+     * playback reaches the end of the previous batch. The frames are not
+     * sent (warm-only request); the per-timepoint fmri data requests of the
+     * viewer are then served without re-slicing the image.
+     * @param {number} timePoint - First timepoint to prefetch
+     * @param {number} maxValue - Last timepoint
+     */
+    prefetch(timePoint, maxValue) {
+        if (timePoint > maxValue) {
+            return;
+        }
+        if (this.prefetchEnd !== null && timePoint < this.prefetchEnd) {
+            return;
+        }
+        const end = Math.min(timePoint + PREFETCH_BATCH_SIZE, maxValue + 1);
+        this.prefetchEnd = end;
+        this.contextManager.data.getFMRIDataRange(timePoint, end, true)
+            .catch((error) => console.warn('fmri data prefetch failed', error));
+    }
+
     /**
      * Stop playing the movie
      */
     stop() {
         clearInterval(this.intervalId);
+        this.prefetchEnd = null;
         this.isPlaying = false;
         this.playMovieButtonIcon.removeClass('fa-stop').addClass('fa-play');
     }
@@ -105,7 +105,7 @@ class Distance {
 
     /**
      * Plots the distance vector
-     * @param {Array} distanceVector - Distance vector
+     * @param {Float32Array} distanceVector - Distance vector
      * @param {number} timeIndex - Time index
      * @param {Object} plotOptions - Plot options
      */
@@ -3,6 +3,7 @@ Utilities for handling nifti file uploads
 """
 import gzip
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from io import BytesIO
 from pathlib import Path
@@ -23,6 +24,11 @@ FilePath = Union[str, Path]
 FileUploadDict = Dict[str, Optional[Union[FilePath, 'FileStorage']]]
 NiftiDict = Dict[str, Optional[nib.Nifti1Image]]
 
+# Background readers for the optional anatomical and mask files. nibabel
+# releases the GIL while decompressing and copying image data, so these
+# are read while the functional file is read on the request thread.
+_read_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='nifti-read')
+
 # Expected file upload inputs
 class NiftiFiles(Enum):
     FUNC = 'nii_func'
@@ -104,6 +110,12 @@ class NiftiUpload:
                 [browser_fields[NiftiFiles.FUNC.value]]
             )
 
+        # start reading the optional anat and mask files in the background
+        pending_reads = {
+            file_key: _submit_read_nii(file_uploads[file_key], self.method)
+            for file_key in (NiftiFiles.ANAT.value, NiftiFiles.MASK.value)
+        }
+
         # Initialize output dictionary
         nifti_out = {
             NiftiFiles.FUNC.value: None,
@@ -148,7 +160,7 @@ class NiftiUpload:
                 )
             
             try:
-                nii_anat = read_nii(file_uploads[NiftiFiles.ANAT.value], self.method)
+                nii_anat = pending_reads[NiftiFiles.ANAT.value].result()
             except Exception as e:
                 raise exception.FileUploadError(
                     'Error in reading anatomical nifti file',
@@ -192,7 +204,7 @@ class NiftiUpload:
                 )
             
             try:
-                nii_mask = read_nii(file_uploads[NiftiFiles.MASK.value], self.method)
+                nii_mask = pending_reads[NiftiFiles.MASK.value].result()
             except Exception as e:
                 raise exception.FileUploadError(
                     'Error in reading mask nifti file',
@@ -279,7 +291,9 @@ def read_nii(
     """
     if method =='cli':
         try:
-            nifti_img = nib.load(file)
+            # keep the file handle open, so that repeated slice and time
+            # course reads from the image data object do not reopen the file
+            nifti_img = nib.load(file, keep_file_open=True)
         # raise generic exception to be handled higher in stack
         except Exception as e:
             raise e
@@ -293,6 +307,32 @@ def read_nii(
     return nifti_img
 
 
+def _submit_read_nii(
+    file: Optional[Union[FilePath, 'FileStorage']],
+    method: Literal['cli', 'browser']
+) -> Optional[Future]:
+    """
+    Start reading an optional nifti file in a background thread.
+
+    Parameters
+    ----------
+    file : Optional[Union[FilePath, FileStorage]]
+        Either a nifti file from the browser or full path to file from CLI
+    method : Literal['cli', 'browser']
+        Whether the file was uploaded through browser or CLI
+
+    Returns
+    -------
+    Optional[Future]
+        Future resolving to the loaded nibabel image, or None if no file
+        was provided or its extension is not a nifti extension (reported
+        when the file is validated).
+    """
+    if file is None or not validate.validate_nii_ext(utils.get_filename(file)):
+        return None
+    return _read_pool.submit(read_nii, file, method)
+
+
 def _read_nii_browser(
     file: 'FileStorage',
     ext: Literal['.nii', '.nii.gz']
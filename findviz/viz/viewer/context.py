@@ -35,7 +35,7 @@ from findviz.viz.viewer.types import (
     OrthoSliceIndexDict, AnnotationMarkerPlotOptionsDict, 
     MontageSliceDirectionIndexDict, MontageSliceCoordsDict,
     MontageSliceIndexDict, CrosshairCoordsDict, DirectionLabelCoordsDict,
-    ColorOptions
+    ColorOptions, TimepointsRangeDict
 )
 from findviz.viz.viewer.utils import (
     apply_mask_nifti, get_coord_labels_gifti, 
@@ -84,8 +84,11 @@ class VisualizationContext:
         get_timecourse_plot_options(): Get time course plot options for a given label
         get_timecourse_shift_history(): Get time course shift history
         get_timepoints(): Get all timepoints
+        get_timepoints_range(): Get all timepoints as a start/step range
         get_time_marker_plot_options(): Get time marker plot options
         get_world_coords(): Get world coordinates of currently selected coordinates
+        get_world_coords_dict(): Get world coordinates packaged into a dictionary
+        get_coord_labels_dict(): Get gifti coordinate labels packaged into a dictionary
         get_viewer_metadata(): Get metadata for viewer
         get_viewer_data(): Get formatted data for viewer
         move_annotation_selection(): Move annotation selection
@@ -97,6 +100,7 @@ class VisualizationContext:
         set_tr(): set the fMRI TR (repitition time)
         store_fmri_preprocessed(): Store preprocessed fMRI data
         store_timecourse_preprocessed(): Store preprocessed timecourse data
+        update_all_task_design_plot_options(): Update task design plot options of all conditions
         update_annotation_marker_plot_options(): Update annotation marker plot options
         update_annotation_selection(): Update annotation selection
         update_distance_plot_options(): Update distance plot options
@@ -117,6 +121,8 @@ class VisualizationContext:
     def __init__(self, context_id: str):
         self.context_id = context_id
         self._state = Optional[NiftiVisualizationState | GiftiVisualizationState]
+        # single-entry memos of packaged getter outputs: {name: (key, value)}
+        self._memo: Dict[str, Tuple[Any, Any]] = {}
     
     @requires_state
     @property
@@ -160,6 +166,15 @@ class VisualizationContext:
         else:
             return self._state.left_coord_labels, self._state.right_coord_labels
     
+    @requires_state
+    @property
+    def anat_img(self) -> Optional[nib.Nifti1Image]:
+        if self._state.file_type == 'nifti':
+            return self._state.nifti_data['anat_img']
+        else:
+            logger.warning("anat_img attribute does not exist for GIFTI data")
+            return None
+
     @requires_state
     @property
     def color_options_original(self) -> ColorOptions:
@@ -183,6 +198,28 @@ class VisualizationContext:
     def fmri_file_type(self) -> Literal['nifti', 'gifti']:
         return self._state.file_type
     
+    @requires_state
+    @property
+    def func_img(self) -> Optional[nib.Nifti1Image]:
+        if self._state.file_type == 'nifti':
+            if self._state.fmri_preprocessed:
+                return self._state.nifti_data_preprocessed['func_img']
+            return self._state.nifti_data['func_img']
+        else:
+            logger.warning("func_img attribute does not exist for GIFTI data")
+            return None
+
+    @requires_state
+    @property
+    def left_func_img(self) -> Optional[nib.GiftiImage]:
+        if self._state.file_type == 'gifti':
+            if self._state.fmri_preprocessed:
+                return self._state.gifti_data_preprocessed['left_func_img']
+            return self._state.gifti_data['left_func_img']
+        else:
+            logger.warning("left_func_img attribute does not exist for NIFTI data")
+            return None
+
     @requires_state
     @property
     def left_surface_input(self) -> bool:
@@ -225,6 +262,17 @@ class VisualizationContext:
     def n_timepoints(self) -> int:
         return len(self._state.timepoints)
     
+    @requires_state
+    @property
+    def right_func_img(self) -> Optional[nib.GiftiImage]:
+        if self._state.file_type == 'gifti':
+            if self._state.fmri_preprocessed:
+                return self._state.gifti_data_preprocessed['right_func_img']
+            return self._state.gifti_data['right_func_img']
+        else:
+            logger.warning("right_func_img attribute does not exist for NIFTI data")
+            return None
+
     @requires_state
     @property
     def right_surface_input(self) -> bool:
@@ -531,6 +579,7 @@ class VisualizationContext:
         """Clear state."""
         logger.info("Clearing data manager state")
         self._state = None
+        self._memo.clear()
     
     @requires_state
     def convert_timepoints(self, round_to: int = 5) -> None:
@@ -556,7 +605,8 @@ class VisualizationContext:
         """
         logger.info("Creating distance plot state")
         self._state.distance_data_enabled = True
-        self._state.distance_data = distance_data
+        # contiguous buffer so the json provider can serialize it directly
+        self._state.distance_data = np.ascontiguousarray(distance_data)
         metadata = package_distance_metadata(
             distance_data,
             slider_steps=100,
@@ -584,6 +634,8 @@ class VisualizationContext:
             mask_img: The mask NIFTI image (optional)
         """
         metadata = package_nii_metadata(func_img)
+        # drop memoized getter outputs of any previous state
+        self._memo.clear()
         
         self._state = NiftiVisualizationState(
             timepoints=metadata['timepoints'],
@@ -672,6 +724,8 @@ class VisualizationContext:
         else:
             right_input = False
 
+        # drop memoized getter outputs of any previous state
+        self._memo.clear()
         self._state = GiftiVisualizationState(
             left_input=left_input,
             right_input=right_input,
@@ -704,14 +758,15 @@ class VisualizationContext:
         self._state.gifti_data['left_func_img'] = left_func_img
         self._state.gifti_data['right_func_img'] = right_func_img
             
-        # Store mesh data
+        # Store mesh data as arrays, which the JSON provider serializes
+        # directly (rather than boxing every coordinate as a Python float)
         # TODO: ensure first position is coordinates, and second is faces
         if left_mesh:
-            self._state.vertices_left = left_mesh.darrays[0].data.tolist()
-            self._state.faces_left = left_mesh.darrays[1].data.tolist()
+            self._state.vertices_left = np.asarray(left_mesh.darrays[0].data)
+            self._state.faces_left = np.asarray(left_mesh.darrays[1].data)
         if right_mesh:
-            self._state.vertices_right = right_mesh.darrays[0].data.tolist()
-            self._state.faces_right = right_mesh.darrays[1].data.tolist()
+            self._state.vertices_right = np.asarray(right_mesh.darrays[0].data)
+            self._state.faces_right = np.asarray(right_mesh.darrays[1].data)
         
         # if no mesh data is provided, use faces and vertices
         if not left_mesh and not right_mesh:
@@ -1002,6 +1057,32 @@ class VisualizationContext:
         else:
             return self._state.timepoints
     
+    @requires_state
+    def get_timepoints_range(self) -> TimepointsRangeDict | None:
+        """Return timepoints (in seconds or in TRs) as an arithmetic range,
+        rather than the full list returned by get_timepoints(). The range is
+        taken from the stored timepoints, which may be overridden (e.g. lags
+        set by set_timepoints).
+
+        Returns:
+            TimepointsRangeDict | None: number of timepoints, start and step,
+                or None if the timepoints are not evenly spaced
+        """
+        timepoints = self.get_timepoints()
+        n_timepoints = len(timepoints)
+        start = timepoints[0] if n_timepoints > 0 else 0
+        step = timepoints[1] - timepoints[0] if n_timepoints > 1 else 1
+        # the client expands the range rounded to 5 decimals, as when
+        # converting timepoints to seconds
+        expected = np.round(start + np.arange(n_timepoints) * step, 5)
+        if not np.allclose(expected, timepoints, rtol=0, atol=1e-9):
+            return None
+        return {
+            'n_timepoints': n_timepoints,
+            'start': start,
+            'step': step
+        }
+
     @requires_state
     def get_time_marker_plot_options(self) -> TimeMarkerPlotOptionsDict:
         """Get time marker plot options. The time marker is a vertical line
@@ -1034,6 +1115,55 @@ class VisualizationContext:
             logger.warning("World coordinates not supported for GIFTI data")
             return None
     
+    @requires_state
+    def get_world_coords_dict(self) -> Dict[Literal['x', 'y', 'z'], float] | None:
+        """Get world coordinates of currently selected coordinates as a dictionary.
+        The dictionary is memoized on the selected voxel, so repeated requests
+        for an unchanged location return the same object.
+        
+        Returns:
+            Dict[Literal['x', 'y', 'z'], float]: World coordinates
+        """
+        if self._state.file_type != 'nifti':
+            logger.warning("World coordinates not supported for GIFTI data")
+            return None
+        slice_idx = self.get_slice_idx()
+        if self._state.view_state == 'montage':
+            slice_idx = slice_idx[self._state.selected_slice]
+        key = (slice_idx['x'], slice_idx['y'], slice_idx['z'])
+
+        def build():
+            world_coords = transform_to_world_coords(
+                slice_idx, self._state.func_affine
+            )
+            return {
+                'x': world_coords[0],
+                'y': world_coords[1],
+                'z': world_coords[2]
+            }
+        return self._memoize('world_coords', key, build)
+
+    @requires_state
+    def get_coord_labels_dict(
+        self
+    ) -> Dict[str, List[Tuple[int, Literal['left', 'right']]]] | None:
+        """Get gifti coordinate labels packaged into a dictionary. Memoized
+        on the label lists, which are fixed for a given state.
+        
+        Returns:
+            Dict[str, List[Tuple[int, Literal['left', 'right']]]]: left and
+                right hemisphere coordinate labels
+        """
+        if self._state.file_type == 'nifti':
+            logger.warning("Coordinate label dictionary only supported for GIFTI data")
+            return None
+        left, right = self._state.left_coord_labels, self._state.right_coord_labels
+        return self._memoize(
+            'coord_labels',
+            (id(left), id(right)),
+            lambda: {'left_coord_labels': left, 'right_coord_labels': right}
+        )
+
     @requires_state
     def get_viewer_metadata(self) -> ViewerMetadataNiftiDict | ViewerMetadataGiftiDict:
         """Get metadata for viewer
@@ -1671,6 +1801,27 @@ class VisualizationContext:
         self._state.montage_slice_idx[montage_slice_dir][slice_name][montage_slice_dir] = slice_idx
         logger.info("Updated montage slice index for slice %s", slice_name)
 
+    @requires_state
+    def update_all_task_design_plot_options(
+        self,
+        plot_options: Dict[str, Any]
+    ) -> None:
+        """Update task design plot options shared by all conditions
+        (e.g. convolution) in a single pass.
+        
+        Arguments:
+            plot_options: Dictionary containing task design plot options.
+                Colors are specific to a condition, and can not be updated
+                for all conditions.
+        """
+        if 'color' in plot_options:
+            raise ValueError(
+                "Task design colors can not be updated for all conditions"
+            )
+        for task_plot_options in self._state.task_plot_options.values():
+            task_plot_options.update_from_dict(plot_options)
+        logger.info("Updated task design plot options for all conditions")
+
     @requires_state
     def update_task_design_plot_options(
         self, 
@@ -1980,6 +2131,22 @@ class VisualizationContext:
         else:
             raise ValueError("Invalid slice direction")
 
+    def _memoize(self, name: str, key: Any, build) -> Any:
+        """Return the memoized value for name if its key is unchanged,
+        otherwise build, store and return a new value.
+        
+        Arguments:
+            name: Name of the memoized value
+            key: Hashable key of the inputs the value is built from
+            build: Callable with no arguments that builds the value
+        """
+        cached = self._memo.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build()
+        self._memo[name] = (key, value)
+        return value
+
     def _update_slice_indices(
         self, 
         click_coords: Dict[str, Literal['x', 'y']], 
@@ -9,7 +9,7 @@ Classes:
     DataManager: Singleton manager for visualization state
 """
 
-from typing import Dict, Optional, ClassVar, List
+from typing import BinaryIO, Dict, Optional, ClassVar, List
 
 from findviz.logger_config import setup_logger
 from findviz.viz.viewer.context import VisualizationContext
@@ -155,6 +155,20 @@ class DataManager:
         
         return serialized_data
 
+    def save_to_file(self, file: BinaryIO, file_name: str = "scene.fvstate") -> None:
+        """Save the current scene in .fvstate format into a binary file object.
+        
+        Arguments:
+            file: Writable binary file object to write the serialized scene into
+            file_name: Name of the file to save to
+        """
+        # Get current context
+        context = self.get_context(self._active_context_id)
+        
+        # Serialize context directly into the file
+        StateFile.serialize_to_file(context, file)
+        logger.info(f"Prepared context {self._active_context_id} for download as {file_name}")
+
     def switch_context(self, context_id: str) -> None:
         """Switch the active context to the specified ID.
         
@@ -6,7 +6,7 @@ import json
 import zipfile
 import datetime
 
-from typing import Dict, List, Union
+from typing import BinaryIO, Dict, List, Union
 
 import numpy as np
 import nibabel as nib
@@ -48,18 +48,35 @@ class StateFile:
         Returns:
             bytes: Serialized data in .fvstate format
         """
+        # Create an in-memory ZIP file
+        buffer = io.BytesIO()
+        cls.serialize_to_file(context, buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def serialize_to_file(cls, context: VisualizationContext, file: BinaryIO) -> None:
+        """Serialize a context in the .fvstate format into a binary file object.
+        
+        Writing into the caller's file avoids holding a second copy of the
+        archive in memory when it is streamed to disk or to a response.
+        
+        Args:
+            context: The visualization context to serialize
+            file: Writable binary file object to write the archive into
+        """
         # Ensure we have a state to save
         if context._state is None:
             raise ValueError("Cannot serialize context with no state")
         
-        # Create an in-memory ZIP file
-        buffer = io.BytesIO()
         manifest = {"format_version": cls.FORMAT_VERSION, "files": []}
         
-        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED) as zipf:
             # Serialize state JSON (excluding large data)
             state_dict = cls._serialize_state(context._state)
-            state_json = json.dumps(state_dict, indent=2)
+            # compact separators: the values of numpy_array entries (e.g.
+            # mesh vertices and faces) and of time courses are written as
+            # nested lists, so indentation would dominate the size
+            state_json = json.dumps(state_dict, separators=(',', ':'))
             zipf.writestr('state.json', state_json)
             manifest["files"].append("state.json")
             
@@ -77,10 +94,6 @@ class StateFile:
             
             # Write manifest
             zipf.writestr('manifest.json', json.dumps(manifest, indent=2))
-        
-        # Get the bytes from the buffer
-        buffer.seek(0)
-        return buffer.getvalue()
     
     @classmethod
     def deserialize_from_bytes(cls, data: bytes) -> VisualizationContext:
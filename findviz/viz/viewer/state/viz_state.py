@@ -235,10 +235,10 @@ class GiftiVisualizationState(VisualizationState):
     file_type: Literal['gifti'] = 'gifti'
     left_input: bool = False
     right_input: bool = False
-    vertices_left: Optional[List[float]] = None
-    faces_left: Optional[List[float]] = None
-    vertices_right: Optional[List[float]] = None
-    faces_right: Optional[List[float]] = None
+    vertices_left: Optional[np.ndarray] = None
+    faces_left: Optional[np.ndarray] = None
+    vertices_right: Optional[np.ndarray] = None
+    faces_right: Optional[np.ndarray] = None
     both_hemispheres: bool = False
     
     # gifti data
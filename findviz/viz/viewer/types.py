@@ -166,6 +166,12 @@ class TimeMarkerPlotOptionsDict(TypedDict):
     color: Optional[str]
 
 # define outpus from get_metadata() method
+class TimepointsRangeDict(TypedDict):
+    """Compact description of all timepoints: start + i * step, i < n_timepoints"""
+    n_timepoints: int
+    start: float
+    step: float
+
 class ViewerMetadataNiftiDict(TypedDict):
     """output dict from get_metadata() method for nifti data"""
     file_type: Literal['nifti']
@@ -193,10 +199,10 @@ class ViewerMetadataGiftiDict(TypedDict):
     right_input: bool
     tr: Optional[float]
     slicetime_ref: Optional[float]
-    vertices_left: List[float]
-    faces_left: List[float]
-    vertices_right: List[float]
-    faces_right: List[float]
+    vertices_left: np.ndarray
+    faces_left: np.ndarray
+    vertices_right: np.ndarray
+    faces_right: np.ndarray
     timepoints: List[int]
     fmri_preprocessed: bool
     ts_preprocessed: bool
@@ -9,6 +9,7 @@ Functions:
     - get_coord_labels_gifti: Get coordinate labels for GIFTI data as a list of tuples
     - get_coord_labels_nifti: Get coordinate labels for NIFTI data as a 3D array
     - get_fmri_minmax: Calculate global minimum and maximum values for fmri data
+    - get_image_data: Get NIfTI image data to read slices and time courses from
     - get_ts_minmax: Calculate global minimum and maximum values for time series data
     - get_ortho_slice_coords: Get initial orthogonal view slice coordinates for NIFTI data
     - get_ortho_slice_idx: Get initial orthogonal view slice indices for NIFTI data
@@ -23,6 +24,9 @@ Functions:
     - requires_state: Decorator to check if state exists before executing method
 """
 import decimal
+import os
+import threading
+import weakref
 
 from functools import wraps
 from typing import Dict, Tuple, Union, Optional, List, Literal
@@ -32,6 +36,7 @@ import nibabel as nib
 
 from nibabel.gifti import GiftiImage
 from nibabel.nifti1 import Nifti1Image
+from nibabel.openers import ImageOpener
 
 from findviz.logger_config import setup_logger
 
@@ -40,6 +45,16 @@ logger = setup_logger(__name__)
 # define slice containers for nifti visualization
 slices_containers = ['slice_1', 'slice_2', 'slice_3']
 
+# extensions of compressed image files, which have no random access
+COMPRESSED_EXTENSIONS = tuple(
+    ext for ext in ImageOpener.compress_ext_map if ext is not None
+)
+
+# decoded data of images read from compressed files, held until the image
+# is released (see get_image_data)
+_decoded_data_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_decoded_data_lock = threading.Lock()
+
 def apply_mask_nifti(
     nifti_img: nib.Nifti1Image,
     mask_img: nib.Nifti1Image,
@@ -58,9 +73,12 @@ def apply_mask_nifti(
     nib.Nifti1Image
         Masked NIfTI image
     """
-    # apply mask
-    nifti_data = nifti_img.get_fdata()
-    mask_data = mask_img.get_fdata()
+    # apply mask (without caching a float copy on the input images). The
+    # mask is compared in its stored dtype, rather than decoded to floats.
+    # The masked data is held as float32, which halves its memory and the
+    # bytes read by every slice, time course and threshold operation
+    nifti_data = nifti_img.get_fdata(caching='unchanged', dtype=np.float32)
+    mask_data = np.asanyarray(mask_img.dataobj)
     nifti_data[mask_data == 0, :] = np.nan
     masked_img = nib.Nifti1Image(nifti_data, nifti_img.affine, nifti_img.header)
     return masked_img
@@ -128,35 +146,28 @@ def get_coord_labels_nifti(
     Returns
     -------
     np.ndarray
-        3D array of shape (X, Y, Z, 3) containing the coordinate indices
-        for each voxel position
+        3D string array of shape (X, Y, Z) containing the coordinate
+        label ('Voxel: x, y, z') of each voxel position
     """
-    data = nii_img.get_fdata()
-    shape = data.shape[:3]  # Get first 3 dimensions (X, Y, Z)
-    
-    # Create coordinate arrays for each dimension
-    x_coords = np.arange(shape[0])[:, np.newaxis, np.newaxis]
-    y_coords = np.arange(shape[1])[np.newaxis, :, np.newaxis]
-    z_coords = np.arange(shape[2])[np.newaxis, np.newaxis, :]
-    
-    # Broadcast to full 3D arrays
-    X = np.broadcast_to(x_coords, shape)
-    Y = np.broadcast_to(y_coords, shape)
-    Z = np.broadcast_to(z_coords, shape)
-    
-    # Stack the coordinates into a single array with shape (X, Y, Z, 3)
-    coord_labels = np.stack([X, Y, Z], axis=-1)
-
-    # Vectorize the string formatting function
-    format_coord = np.vectorize(lambda x, y, z: f"Voxel: {x}, {y}, {z}")
-
-    # Apply the formatting function to each coordinate
-    coord_labels = format_coord(
-        coord_labels[..., 0], 
-        coord_labels[..., 1], 
-        coord_labels[..., 2]
+    # only the image shape is needed, so the data is not read
+    shape = nii_img.shape[:3]  # Get first 3 dimensions (X, Y, Z)
+
+    # format the coordinate indices of each dimension once, as strings no
+    # wider than the largest index
+    x_labels, y_labels, z_labels = [
+        np.arange(n).astype(f'U{len(str(max(n - 1, 0)))}') for n in shape
+    ]
+
+    # broadcast the per-dimension strings into the 3D label array, rather
+    # than formatting each voxel label in python
+    coord_labels = np.char.add(
+        np.char.add('Voxel: ', x_labels)[:, np.newaxis, np.newaxis],
+        np.char.add(', ', y_labels)[np.newaxis, :, np.newaxis]
     )
-    
+    coord_labels = np.char.add(
+        coord_labels, np.char.add(', ', z_labels)[np.newaxis, np.newaxis, :]
+    )
+
     return coord_labels
 
 
@@ -197,6 +208,49 @@ def get_fmri_minmax(
     return data_min, data_max
 
 
+def get_image_data(nifti_img: nib.Nifti1Image) -> np.ndarray:
+    """Get the data of a NIfTI image to read slices and time courses from.
+
+    Data objects of uncompressed images (memory-mapped files or in-memory
+    bytes) are returned as is, so that indexing reads only the requested
+    values. Compressed files (e.g. .nii.gz) have no random access, so that
+    every read would decompress the file from the start; their data is
+    decoded once and reused until the image is released.
+
+    Parameters
+    ----------
+    nifti_img : nib.Nifti1Image
+        NIfTI image
+
+    Returns
+    -------
+    np.ndarray
+        Image data object, or the decoded (read-only) image data
+    """
+    dataobj = nifti_img.dataobj
+    if not _is_compressed_proxy(dataobj):
+        return dataobj
+    with _decoded_data_lock:
+        data = _decoded_data_cache.get(nifti_img)
+        if data is None:
+            data = np.asanyarray(dataobj)
+            # the decoded data is shared, and must not be modified
+            data.flags.writeable = False
+            _decoded_data_cache[nifti_img] = data
+    return data
+
+
+def _is_compressed_proxy(dataobj) -> bool:
+    """Check whether a data object is a proxy for a compressed image file"""
+    if not nib.is_proxy(dataobj):
+        return False
+    file_like = getattr(dataobj, 'file_like', None)
+    if not isinstance(file_like, (str, os.PathLike)):
+        # e.g. an in-memory file object
+        return False
+    return os.fspath(file_like).endswith(COMPRESSED_EXTENSIONS)
+
+
 def get_ortho_slice_coords(
     ortho_slice_idx: Dict[str, int]
 ) -> Dict[str, Dict[str, int]]:
@@ -549,7 +603,11 @@ def package_nii_metadata(
         - precision: Precision of the color mapping
         - slider_step_size: Stepsize of the sliders
     """
-    data = nii_img.get_fdata()
+    # read the data object in its stored (or scaled) dtype, rather than as a
+    # float64 copy: in-memory and memory-mapped data are not copied, and
+    # float32 data is read at half the size. Compressed data is decoded
+    # once, and reused for slice reads (see get_image_data)
+    data = np.asanyarray(get_image_data(nii_img))
     # Calculate global min and max
     data_min, data_max = get_fmri_minmax(data, 'nifti')
     # Calculate precision for slider step size
@@ -2,6 +2,7 @@ import pytest
 from flask import Flask, make_response
 import json
 import copy
+import struct
 from unittest.mock import patch, MagicMock
 import numpy as np
 from functools import wraps
@@ -166,4 +167,33 @@ def json_content_type():
 @pytest.fixture
 def form_content_type():
     """Return form content type header."""
-    return {"Content-Type": "application/x-www-form-urlencoded"}
\ No newline at end of file
+    return {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def decode_binary_payload(message: bytes) -> dict:
+    """Decode a binary message created by encode_binary_payload (as the
+    client does in decodeBinaryPayload). Buffer references in the header
+    data are replaced by float32 arrays."""
+    (header_len,) = struct.unpack_from('<I', message)
+    header = json.loads(message[4:4 + header_len])
+    # array buffers start on the 4-byte boundary after the header
+    start = (4 + header_len + 3) // 4 * 4
+    arrays = []
+    for buffer in header['buffers']:
+        count = int(np.prod(buffer['shape']))
+        arr = np.frombuffer(
+            message, dtype='<f4', count=count,
+            offset=start + buffer['offset']
+        )
+        arrays.append(arr.reshape(buffer['shape']))
+
+    def restore_arrays(obj):
+        if isinstance(obj, dict):
+            if set(obj) == {'__buffer__'}:
+                return arrays[obj['__buffer__']]
+            return {key: restore_arrays(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [restore_arrays(value) for value in obj]
+        return obj
+
+    return restore_arrays(header['data'])
@@ -205,6 +205,7 @@ class TestFileRoutes:
         
         # Mock upload method
         mocker.patch.object(FileUpload, 'upload', return_value=mock_upload_result)
+        mock_get_matrix = mocker.patch('findviz.routes.file.get_gifti_data_matrix')
         
         # Mock context methods
         if file_type == 'nifti':
@@ -229,8 +230,11 @@ class TestFileRoutes:
         # Verify context methods were called
         if file_type == 'nifti':
             mock_data_manager_ctx.create_nifti_state.assert_called_once()
+            mock_get_matrix.assert_not_called()
         else:
             mock_data_manager_ctx.create_gifti_state.assert_called_once()
+            # data matrices of both hemispheres are stacked at load time
+            assert mock_get_matrix.call_count == 2
         
         mock_data_manager_ctx.add_timeseries.assert_called_once()
         
@@ -0,0 +1,47 @@
+import json
+import numpy as np
+
+from findviz.routes.json_provider import NumpyJSONProvider, numpy_default
+
+
+class TestJSONProvider:
+    """Test suite for the numpy-aware JSON provider"""
+
+    def test_app_uses_numpy_provider(self, app):
+        """Test that the app factory registers the provider"""
+        assert isinstance(app.json, NumpyJSONProvider)
+
+    def test_dumps_ndarray(self, app):
+        """Test that arrays serialize to lists with NaN as null"""
+        data = {'values': np.array([[1.0, np.nan], [3.0, 4.0]])}
+        assert json.loads(app.json.dumps(data)) == {
+            'values': [[1.0, None], [3.0, 4.0]]
+        }
+
+    def test_dumps_non_contiguous_ndarray(self, app):
+        """Test that non-contiguous arrays fall back to the default"""
+        arr = np.arange(6, dtype=np.float64).reshape(2, 3).T
+        assert json.loads(app.json.dumps(arr)) == arr.tolist()
+
+    def test_dumps_numpy_scalars(self, app):
+        """Test that numpy scalars serialize as python numbers"""
+        data = {'int': np.int64(3), 'float': np.float32(0.5)}
+        assert json.loads(app.json.dumps(data)) == {'int': 3, 'float': 0.5}
+
+    def test_response(self, app):
+        """Test that response returns a json response"""
+        response = app.json.response(np.array([0.1, 0.2]))
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.data) == [0.1, 0.2]
+
+    def test_numpy_default(self):
+        """Test numpy default conversion"""
+        assert numpy_default(np.array([1, 2])) == [1, 2]
+        assert numpy_default(np.array([np.nan, 1.0])) == [None, 1.0]
+        assert numpy_default(np.array([0.5, 1.0], dtype=np.float32)) == [0.5, 1.0]
+        assert numpy_default(np.float64(1.5)) == 1.5
+
+    def test_loads(self, app):
+        """Test that request bodies are parsed, including NaN literals"""
+        assert app.json.loads(b'{"a": [1, 2.5]}') == {'a': [1, 2.5]}
+        assert np.isnan(app.json.loads('{"a": NaN}')['a'])
@@ -1,19 +1,54 @@
+import gzip
 import pytest
 import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Literal, Optional
 import numpy as np
 from unittest.mock import patch, MagicMock
 from flask import request, make_response
 
 from findviz.routes.utils import (
     Routes, 
+    compress_response,
     convert_value, 
-    handle_context, 
+    encode_binary_payload,
+    freeze,
+    handle_context,
+    InvalidParameterError, 
+    handle_getter_route,
     handle_route_errors,
     is_numeric,
+    iter_json_chunks,
+    mask_range_with_nan,
+    parse_request,
+    request_params,
     sanitize_array_for_json,
-    str_to_float_list
+    SourceKeyedCache,
+    str_to_float_list,
+    UpdateCoalescer,
 )
 from findviz.viz.exception import DataRequestError
+from tests.routes.conftest import decode_binary_payload
+
+
+@dataclass(frozen=True)
+class ExampleRequest:
+    """Request schema used to test parse_request"""
+    name: str
+    index: int
+    value: float
+    flag: bool
+    coords: Dict[str, Any]
+    tr: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ExampleChoiceRequest:
+    """Request schema with literal and PEP 604 optional fields"""
+    source: Literal['timecourse', 'task']
+    scale: float | None = None
 
 
 class TestUtils:
@@ -61,6 +96,10 @@ class TestUtils:
             ('hello', 'hello'),
             ('123abc', '123abc'),
             ('true_value', 'true_value'),
+
+            # Typed (json) values are returned as-is
+            (5, 5),
+            (1.5, 1.5),
         ]
     )
     def test_convert_value(self, input_value, expected_output):
@@ -267,7 +306,289 @@ class TestUtils:
             # Check that the response includes the dynamically determined file type
             error_data = json.loads(response.data)
             assert error_data['context']['file_type'] == "dynamic_file_type"
-    
+
+    def test_handle_route_errors_file_type_lazy(self, app):
+        """Test that a callable file_type is not evaluated on success"""
+        get_file_type = MagicMock(return_value="nifti")
+
+        @handle_route_errors(
+            error_msg="Test error",
+            fmri_file_type=get_file_type,
+            route=Routes.GET_HEADER
+        )
+        def test_route():
+            return {'success': True}
+
+        with app.test_request_context('/'):
+            response = test_route()
+            assert response.status_code == 200
+            get_file_type.assert_not_called()
+
+    def test_iter_json_chunks(self, app):
+        """Test that chunked serialization yields a valid JSON document"""
+        payload = {
+            'data': {'slice_1': np.array([0.5, np.nan]), 'slice_2': [[1, 2]]},
+            'plot_options': {'threshold_min': 0.1},
+            'empty': {}
+        }
+        with app.app_context():
+            chunks = list(iter_json_chunks(payload))
+        assert len(chunks) > 1
+        assert json.loads(''.join(chunks)) == {
+            'data': {'slice_1': [0.5, None], 'slice_2': [[1, 2]]},
+            'plot_options': {'threshold_min': 0.1},
+            'empty': {}
+        }
+        # lists are split item by item
+        frames = {'frames': [{'a': np.array([1.0])}, {'a': None}], 'empty': []}
+        with app.app_context():
+            chunks = list(iter_json_chunks(frames))
+        assert json.loads(''.join(chunks)) == {
+            'frames': [{'a': [1.0]}, {'a': None}], 'empty': []
+        }
+
+    def test_compress_response(self, app):
+        """Test gzip compression of large, small and streamed responses"""
+        payload = json.dumps({'values': [0.5] * 1000})
+        headers = {'Accept-Encoding': 'gzip'}
+        with app.test_request_context('/', headers=headers):
+            response = compress_response(
+                app.response_class(payload, mimetype='application/json')
+            )
+            assert response.headers['Content-Encoding'] == 'gzip'
+            assert gzip.decompress(response.get_data()).decode() == payload
+
+            small = compress_response(
+                app.response_class('{}', mimetype='application/json')
+            )
+            assert 'Content-Encoding' not in small.headers
+
+            streamed = compress_response(
+                app.response_class(iter([payload[:10], payload[10:]]),
+                                   mimetype='application/json')
+            )
+            assert streamed.headers['Content-Encoding'] == 'gzip'
+            assert gzip.decompress(streamed.get_data()).decode() == payload
+
+        with app.test_request_context('/'):
+            response = compress_response(
+                app.response_class(payload, mimetype='application/json')
+            )
+            assert 'Content-Encoding' not in response.headers
+            assert 'Accept-Encoding' in response.headers['Vary']
+
+    def test_mask_range_with_nan(self):
+        """Test that values within the threshold range are set to NaN in place"""
+        arr = np.array([[0.0, 0.5], [1.0, 1.5]])
+        result = mask_range_with_nan(arr, 0.5, 1.0)
+        assert result is arr
+        np.testing.assert_array_equal(
+            arr, np.array([[0.0, np.nan], [np.nan, 1.5]])
+        )
+
+    def test_mask_range_with_nan_copy(self):
+        """Test that copy=True thresholds into a new array of the same dtype"""
+        arr = np.array([0.0, 0.5, 1.0, 1.5], dtype=np.float32)
+        result = mask_range_with_nan(arr, 0.5, 1.0, copy=True)
+        assert result is not arr
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, [0.0, np.nan, np.nan, 1.5])
+        np.testing.assert_array_equal(arr, [0.0, 0.5, 1.0, 1.5])
+
+    def test_mask_range_with_nan_reused_buffers(self):
+        """Test thresholding arrays of different shapes in turn"""
+        large = np.linspace(0, 1, 12).reshape(3, 4)
+        expected_large = np.where((large >= 0.2) & (large <= 0.6), np.nan, large)
+        mask_range_with_nan(large, 0.2, 0.6)
+        np.testing.assert_array_equal(large, expected_large)
+
+        small = np.array([0.1, 0.3, 0.9])
+        mask_range_with_nan(small, 0.2, 0.6)
+        np.testing.assert_array_equal(small, [0.1, np.nan, 0.9])
+
+    def test_handle_getter_route(self, app, mocker):
+        """Test handle_getter_route switches context and handles errors"""
+        mock_switch_context = mocker.patch('findviz.routes.utils.data_manager.switch_context')
+        mock_logger = mocker.patch('findviz.routes.utils.logger')
+
+        @handle_getter_route(
+            error_msg="Getter error",
+            fmri_file_type="nifti",
+            route=Routes.GET_TIMEPOINT
+        )
+        def test_route():
+            return {'timepoint': 1}
+
+        @handle_getter_route(
+            error_msg="Getter error",
+            fmri_file_type="nifti",
+            route=Routes.GET_TIMEPOINT
+        )
+        def test_route_error():
+            raise ValueError("Test error")
+
+        with app.test_request_context('/?context_id=test_context'):
+            response = test_route()
+            assert response.status_code == 200
+            assert json.loads(response.data) == {'timepoint': 1}
+            mock_switch_context.assert_called_once_with('test_context')
+            mock_logger.info.assert_not_called()
+
+            response = test_route_error()
+            assert response.status_code == 500
+            error_data = json.loads(response.data)
+            assert error_data['error'] == "Getter error"
+            assert error_data['details'] == "Test error"
+            assert error_data['context']['file_type'] == "nifti"
+
+    def test_update_coalescer(self):
+        """Test that updates superseded while waiting are skipped"""
+        coalescer = UpdateCoalescer()
+        applied = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_update(value):
+            started.set()
+            release.wait(timeout=5)
+            applied.append(value)
+
+        first = threading.Thread(
+            target=coalescer.submit, args=('loc', blocking_update, 1)
+        )
+        first.start()
+        started.wait(timeout=5)
+        # both wait for the first update; only the latest is applied
+        results = {}
+
+        def submit(value):
+            results[value] = coalescer.submit('loc', applied.append, value)
+
+        waiting = []
+        for seq, value in enumerate((2, 3), start=2):
+            thread = threading.Thread(target=submit, args=(value,))
+            thread.start()
+            waiting.append(thread)
+            # wait until the update is queued behind the first one
+            while coalescer._latest['loc'] < seq:
+                time.sleep(0.001)
+        release.set()
+        for thread in [first] + waiting:
+            thread.join(timeout=5)
+
+        assert applied == [1, 3]
+        assert results == {2: False, 3: True}
+        assert coalescer._applied['loc'] == (3, None)
+        # other keys are independent
+        assert coalescer.submit('slice', applied.append, 4) is True
+
+    def test_update_coalescer_waits_for_newer_update(self):
+        """Test that a superseded update returns after the newer update is applied"""
+        coalescer = UpdateCoalescer()
+        applied = []
+        release = {value: threading.Event() for value in (1, 3)}
+        started = {value: threading.Event() for value in (1, 3)}
+
+        def blocking_update(value):
+            started[value].set()
+            release[value].wait(timeout=5)
+            applied.append(value)
+
+        first = threading.Thread(
+            target=coalescer.submit, args=('loc', blocking_update, 1)
+        )
+        first.start()
+        started[1].wait(timeout=5)
+        superseded = threading.Thread(
+            target=coalescer.submit, args=('loc', applied.append, 2)
+        )
+        superseded.start()
+        while coalescer._latest['loc'] < 2:
+            time.sleep(0.001)
+        latest = threading.Thread(
+            target=coalescer.submit, args=('loc', blocking_update, 3)
+        )
+        latest.start()
+        while coalescer._latest['loc'] < 3:
+            time.sleep(0.001)
+
+        release[1].set()
+        started[3].wait(timeout=5)
+        # the superseded update is skipped, but waits for the latest update
+        superseded.join(timeout=0.05)
+        assert superseded.is_alive()
+        release[3].set()
+        for thread in (first, superseded, latest):
+            thread.join(timeout=5)
+
+        assert not superseded.is_alive()
+        assert applied == [1, 3]
+
+    def test_update_coalescer_raises_newer_update_error(self):
+        """Test that a superseded update raises the error of the newer update"""
+        coalescer = UpdateCoalescer()
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_update():
+            started.set()
+            release.wait(timeout=5)
+
+        def failing_update():
+            raise ValueError('invalid location')
+
+        first = threading.Thread(
+            target=coalescer.submit, args=('loc', blocking_update)
+        )
+        first.start()
+        started.wait(timeout=5)
+        errors = {}
+
+        def submit(value, update):
+            try:
+                coalescer.submit('loc', update)
+            except ValueError as e:
+                errors[value] = str(e)
+
+        waiting = []
+        for seq, update in enumerate((lambda: None, failing_update), start=2):
+            thread = threading.Thread(target=submit, args=(seq, update))
+            thread.start()
+            waiting.append(thread)
+            while coalescer._latest['loc'] < seq:
+                time.sleep(0.001)
+        release.set()
+        for thread in [first] + waiting:
+            thread.join(timeout=5)
+
+        # the superseded update reports the failure of the newer update
+        assert errors == {2: 'invalid location', 3: 'invalid location'}
+
+    def test_source_keyed_cache(self):
+        """Test cache hits, source invalidation and LRU eviction"""
+        cache = SourceKeyedCache(maxsize=2)
+        img_1, img_2 = MagicMock(), MagicMock()
+
+        cache.put(('a', 1), (img_1, None), 'value_a')
+        assert cache.get(('a', 1), (img_1, None)) == 'value_a'
+        # a different source object invalidates the entry
+        assert cache.get(('a', 1), (img_2, None)) is None
+        assert cache.get(('a', 1), (img_1, None)) is None
+
+        cache.put('b', (img_1,), 'value_b')
+        cache.put('c', (img_1,), 'value_c')
+        cache.get('b', (img_1,))
+        cache.put('d', (img_1,), 'value_d')
+        # least recently used entry is evicted
+        assert len(cache) == 2
+        assert cache.get('c', (img_1,)) is None
+        assert cache.get('b', (img_1,)) == 'value_b'
+
+    def test_freeze(self):
+        """Test that nested dicts and lists are converted to hashable keys"""
+        key = freeze({'slice_1': {'x': 1, 'y': [2, 3]}, 'a': 0})
+        assert hash(key) == hash(freeze({'a': 0, 'slice_1': {'y': [2, 3], 'x': 1}}))
+
     @pytest.mark.parametrize(
         "input_value,expected_output",
         [
@@ -307,6 +628,176 @@ class TestUtils:
         result = sanitize_array_for_json(test_array)
         assert result == expected_output
     
+    def test_parse_request_form(self, app):
+        """Test parse_request converts form strings to schema types"""
+        data = {
+            'name': 'slice_1', 'index': '3', 'value': '0.5',
+            'flag': 'true', 'coords': '{"x": 1}', 'tr': 'null'
+        }
+        with app.test_request_context('/', method='POST', data=data):
+            params = parse_request(ExampleRequest)
+        assert params == ExampleRequest(
+            name='slice_1', index=3, value=0.5, flag=True,
+            coords={'x': 1}, tr=None
+        )
+
+    def test_parse_request_container_uses_json_provider(self, app, mocker):
+        """Test that json encoded form containers are parsed by the app's
+        JSON provider"""
+        spy = mocker.spy(app.json, 'loads')
+        data = {
+            'name': 'slice_1', 'index': '3', 'value': '0.5',
+            'flag': 'false', 'coords': '{"x": 1.5, "y": [1, 2]}'
+        }
+        with app.test_request_context('/', method='POST', data=data):
+            params = parse_request(ExampleRequest)
+        assert params.coords == {'x': 1.5, 'y': [1, 2]}
+        spy.assert_called_once_with('{"x": 1.5, "y": [1, 2]}')
+
+    def test_parse_request_json(self, app):
+        """Test parse_request reads typed values from a json body"""
+        data = {
+            'name': 'slice_1', 'index': 3, 'value': 1, 'flag': False,
+            'coords': {'x': 1}, 'tr': 2
+        }
+        with app.test_request_context('/', method='POST', json=data):
+            params = parse_request(ExampleRequest)
+        assert params == ExampleRequest(
+            name='slice_1', index=3, value=1.0, flag=False,
+            coords={'x': 1}, tr=2.0
+        )
+
+    def test_parse_request_missing(self, app):
+        """Test parse_request raises for missing required fields and
+        uses defaults for optional ones"""
+        with app.test_request_context('/?name=a&index=1&value=1&flag=false&coords={}'):
+            params = parse_request(ExampleRequest)
+            assert params.tr is None
+            assert params.coords == {}
+        with app.test_request_context('/?name=a'):
+            with pytest.raises(KeyError):
+                parse_request(ExampleRequest)
+
+    def test_parse_request_literal_and_union_type(self, app):
+        """Test literal values and T | None fields are parsed"""
+        with app.test_request_context('/?source=task&scale=none'):
+            params = parse_request(ExampleChoiceRequest)
+        assert params == ExampleChoiceRequest(source='task', scale=None)
+        with app.test_request_context('/', method='POST', json={'source': 'timecourse', 'scale': 2}):
+            assert parse_request(ExampleChoiceRequest).scale == 2.0
+
+    @pytest.mark.parametrize(
+        "schema,data",
+        [
+            (ExampleChoiceRequest, {'source': 'other'}),
+            (ExampleChoiceRequest, {'source': 'task', 'scale': 'abc'}),
+            (ExampleRequest, {'name': 'a', 'index': 1, 'value': 1, 'flag': 1, 'coords': {}}),
+            (ExampleRequest, {'name': 'a', 'index': 1, 'value': 1, 'flag': None, 'coords': {}}),
+            (ExampleRequest, {'name': 'a', 'index': None, 'value': 1, 'flag': True, 'coords': {}}),
+            (ExampleRequest, {'name': 'a', 'index': 1, 'value': 1, 'flag': True, 'coords': '[1, 2]'}),
+        ]
+    )
+    def test_parse_request_invalid(self, app, schema, data):
+        """Test that values not matching the schema type raise InvalidParameterError"""
+        with app.test_request_context('/', method='POST', json=data):
+            with pytest.raises(InvalidParameterError):
+                parse_request(schema)
+
+    def test_handle_route_errors_invalid_parameter(self, app, mocker):
+        """Test that invalid parameter values give a 400 response"""
+        mocker.patch('findviz.routes.utils.logger')
+
+        @handle_route_errors(
+            error_msg="Test error",
+            fmri_file_type="nifti",
+            route=Routes.GET_HEADER
+        )
+        def test_route():
+            parse_request(ExampleChoiceRequest)
+            return {'success': True}
+
+        with app.test_request_context('/', method='POST', json={'source': 'other'}):
+            response = test_route()
+        assert response.status_code == 400
+        assert response.get_data(as_text=True) == 'Test error.'
+
+    def test_request_params(self, app):
+        """Test that request parameters are merged and read once per request"""
+        with app.test_request_context(
+            '/?context_id=main&index=1', method='POST', json={'index': 2}
+        ):
+            params = request_params()
+            assert params == {'context_id': 'main', 'index': 2}
+            assert request_params() is params
+
+    def test_handle_context_json(self, app, mocker):
+        """Test handle_context decorator with context ID in a json body"""
+        mock_switch_context = mocker.patch('findviz.routes.utils.data_manager.switch_context')
+
+        @handle_context()
+        def test_route():
+            return {'success': True}
+
+        with app.test_request_context('/', method='POST', json={'context_id': 'test_context'}):
+            assert test_route() == {'success': True}
+            mock_switch_context.assert_called_once_with('test_context')
+
+    def test_encode_binary_payload(self):
+        """Test binary payload round trip with nested arrays"""
+        payload = {
+            'data': {
+                'func': {'slice_1': np.array([[1.0, np.nan], [3.0, 4.0]])},
+                'coords': {'slice_1': [['a', 'b'], ['c', 'd']]},
+                'values': [np.arange(3, dtype=np.int64), None],
+            },
+            'plot_options': {'threshold_min': 0.5},
+        }
+        message = encode_binary_payload(payload)
+        decoded = decode_binary_payload(message)
+
+        func = decoded['data']['func']['slice_1']
+        assert func.dtype == np.float32
+        assert func.shape == (2, 2)
+        np.testing.assert_array_equal(func, payload['data']['func']['slice_1'])
+        np.testing.assert_array_equal(decoded['data']['values'][0], [0, 1, 2])
+        assert decoded['data']['values'][1] is None
+        assert decoded['data']['coords'] == payload['data']['coords']
+        assert decoded['plot_options'] == {'threshold_min': 0.5}
+
+    def test_encode_binary_payload_alignment(self):
+        """Test that array buffers start on a 4-byte boundary"""
+        message = encode_binary_payload({'a': np.ones(5), 'bb': np.zeros(2)})
+        header_len = int.from_bytes(message[:4], 'little')
+        header = json.loads(message[4:4 + header_len])
+        start = len(message) - 7 * 4
+        assert start % 4 == 0
+        assert [b['offset'] for b in header['buffers']] == [0, 20]
+
+    def test_encode_binary_payload_padding(self):
+        """Test that the header is zero padded and messages are independent"""
+        first = encode_binary_payload({'a': np.full(8, np.nan)})
+        second = encode_binary_payload({'b': np.ones(2)})
+
+        assert isinstance(second, bytes)
+        header_len = int.from_bytes(second[:4], 'little')
+        assert set(second[4 + header_len:len(second) - 8]) <= {0}
+        np.testing.assert_array_equal(decode_binary_payload(second)['b'], [1, 1])
+        assert np.isnan(decode_binary_payload(first)['a']).all()
+
+    def test_encode_binary_payload_hemispheres(self):
+        """Test that hemispheres of different sizes are packed back to back"""
+        left = np.arange(3, dtype=np.float32)
+        right = np.array([np.nan, 1.5], dtype=np.float32)
+        message = encode_binary_payload(
+            {'left_hemisphere': left, 'right_hemisphere': right}
+        )
+        decoded = decode_binary_payload(message)
+
+        assert len(message) % 4 == 0
+        assert message.endswith(left.tobytes() + right.tobytes())
+        np.testing.assert_array_equal(decoded['left_hemisphere'], left)
+        np.testing.assert_array_equal(decoded['right_hemisphere'], right)
+
     @pytest.mark.parametrize(
         "input_string,expected_output",
         [
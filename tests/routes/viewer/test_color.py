@@ -3,6 +3,7 @@ import json
 from unittest.mock import patch, MagicMock
 
 from findviz.routes.utils import Routes
+from findviz.routes.viewer.color import get_colormap_data
 from findviz.viz.viewer.state.components import ColorMaps
 
 
@@ -23,6 +24,7 @@ class TestColorRoutes:
         # Mock the generate_colormap_data function
         with patch('findviz.routes.viewer.color.generate_colormap_data') as mock_generate:
             mock_generate.return_value = expected_data
+            get_colormap_data.cache_clear()
             
             # Make the request with context_id
             response = client.get(Routes.GET_COLORMAPS.value + "?context_id=main")
@@ -32,6 +34,12 @@ class TestColorRoutes:
             assert json.loads(response.data) == expected_data
             # Verify the function was called with ColorMaps
             mock_generate.assert_called_once_with(ColorMaps)
+
+            # Colormap data is generated once and reused
+            response = client.get(Routes.GET_COLORMAPS.value + "?context_id=main")
+            assert json.loads(response.data) == expected_data
+            mock_generate.assert_called_once()
+        get_colormap_data.cache_clear()
     
     def test_generate_colormap_data(self):
         """Test generate_colormap_data function."""
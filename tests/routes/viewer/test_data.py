@@ -5,6 +5,7 @@ import numpy as np
 from unittest.mock import patch, MagicMock
 
 from findviz.routes.utils import Routes
+from tests.routes.conftest import decode_binary_payload
 
 
 @pytest.mark.usefixtures("mock_data_manager_ctx")
@@ -60,11 +61,41 @@ class TestDataRoutes:
         assert response.status_code == 200
         assert json.loads(response.data) == ["x", "y", "z"]
 
+    def test_get_coord_labels_cached(self, client, mock_data_manager_ctx):
+        """Test GET_COORD_LABELS reuses the serialized response per state."""
+        mock_data_manager_ctx.fmri_file_type = "nifti"
+        mock_data_manager_ctx.state = MagicMock()
+        mock_data_manager_ctx.coord_labels = ["x", "y", "z"]
+
+        response = client.get(Routes.GET_COORD_LABELS.value + "?context_id=main")
+        etag = response.headers['ETag']
+        assert json.loads(response.data) == ["x", "y", "z"]
+
+        # same state: cached body and ETag, 304 on revalidation
+        mock_data_manager_ctx.coord_labels = ["a"]
+        response = client.get(Routes.GET_COORD_LABELS.value + "?context_id=main")
+        assert json.loads(response.data) == ["x", "y", "z"]
+        assert response.headers['ETag'] == etag
+        response = client.get(
+            Routes.GET_COORD_LABELS.value + "?context_id=main",
+            headers={'If-None-Match': etag}
+        )
+        assert response.status_code == 304
+
+        # a new state is served fresh
+        mock_data_manager_ctx.state = MagicMock()
+        response = client.get(Routes.GET_COORD_LABELS.value + "?context_id=main")
+        assert json.loads(response.data) == ["a"]
+        assert response.headers['ETag'] != etag
+
     def test_get_coord_labels_gifti(self, client, mock_data_manager_ctx):
         """Test GET_COORD_LABELS route with gifti file type."""
         # Setup for gifti file type
         mock_data_manager_ctx.fmri_file_type = "gifti"
-        mock_data_manager_ctx.coord_labels = [["left_x", "left_y", "left_z"], ["right_x", "right_y", "right_z"]]
+        mock_data_manager_ctx.get_coord_labels_dict.return_value = {
+            "left_coord_labels": ["left_x", "left_y", "left_z"],
+            "right_coord_labels": ["right_x", "right_y", "right_z"]
+        }
         
         # Make the request with context_id
         response = client.get(Routes.GET_COORD_LABELS.value + "?context_id=main")
@@ -112,11 +143,8 @@ class TestDataRoutes:
             "threshold_max": 0.9
         }
         
-        mock_viewer_data = {
-            "func_img": MagicMock(),
-            "anat_img": MagicMock()
-        }
-        mock_data_manager_ctx.get_viewer_data.return_value = mock_viewer_data
+        mock_data_manager_ctx.func_img = MagicMock()
+        mock_data_manager_ctx.anat_img = MagicMock()
         mock_data_manager_ctx.color_options_original = {
             "threshold_min": 0.0, 
             "threshold_max": 1.0
@@ -131,13 +159,189 @@ class TestDataRoutes:
             
             # Check the response
             assert response.status_code == 200
+            assert response.is_streamed
             result = json.loads(response.data)
             assert "data" in result
             assert "plot_options" in result
             assert result["data"] == {"slice_data": [[[0.5]]]}
-            mock_data_manager_ctx.get_viewer_data.assert_called_once()
+            # images are read from the context, without get_viewer_data
+            mock_data_manager_ctx.get_viewer_data.assert_not_called()
             mock_get_nifti_data.assert_called_once()
-    
+            assert mock_get_nifti_data.call_args.kwargs['func_img'] is (
+                mock_data_manager_ctx.func_img
+            )
+
+    def test_get_fmri_data_json_arrays(self, client, mock_data_manager_ctx):
+        """Test GET_FMRI_DATA serializes float32 arrays to JSON with NaN as null."""
+        mock_data_manager_ctx.fmri_file_type = 'gifti'
+        mock_data_manager_ctx.get_fmri_plot_options.return_value = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+        mock_data_manager_ctx.left_func_img = MagicMock()
+        mock_data_manager_ctx.right_func_img = None
+        mock_data_manager_ctx.color_options_original = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+
+        with patch('findviz.routes.viewer.data.get_gifti_data') as mock_get_gifti_data:
+            mock_get_gifti_data.return_value = {
+                "left_hemisphere": np.array([0.5, np.nan, 1.5], dtype=np.float32),
+                "right_hemisphere": None
+            }
+            response = client.get(Routes.GET_FMRI_DATA.value + "?context_id=main")
+
+        assert response.status_code == 200
+        assert mock_get_gifti_data.call_args.kwargs['as_array'] is True
+        result = json.loads(response.data)
+        assert result['data']['left_hemisphere'] == [0.5, None, 1.5]
+        assert result['data']['right_hemisphere'] is None
+
+    def test_get_fmri_data_cached(self, client, mock_data_manager_ctx):
+        """Test GET_FMRI_DATA reuses timepoint data for a repeated location."""
+        mock_data_manager_ctx.fmri_file_type = 'gifti'
+        mock_data_manager_ctx.get_fmri_plot_options.return_value = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+        mock_data_manager_ctx.left_func_img = MagicMock()
+        mock_data_manager_ctx.right_func_img = None
+
+        with patch('findviz.routes.viewer.data.get_gifti_data') as mock_get_gifti_data:
+            mock_get_gifti_data.return_value = {
+                "left_hemisphere": np.array([0.5], dtype=np.float32),
+                "right_hemisphere": None
+            }
+            client.get(Routes.GET_FMRI_DATA.value + "?context_id=main")
+            client.get(Routes.GET_FMRI_DATA.value + "?context_id=main")
+            assert mock_get_gifti_data.call_count == 1
+
+            # a new timepoint is computed
+            mock_data_manager_ctx.timepoint = 1
+            client.get(Routes.GET_FMRI_DATA.value + "?context_id=main")
+            assert mock_get_gifti_data.call_count == 2
+
+    def test_get_fmri_data_binary(self, client, mock_data_manager_ctx):
+        """Test GET_FMRI_DATA route with a binary response."""
+        mock_data_manager_ctx.fmri_file_type = 'gifti'
+        mock_data_manager_ctx.get_fmri_plot_options.return_value = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+        mock_data_manager_ctx.left_func_img = MagicMock()
+        mock_data_manager_ctx.right_func_img = None
+        mock_data_manager_ctx.color_options_original = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+        left = np.array([0.5, np.nan, 1.5], dtype=np.float32)
+
+        with patch('findviz.routes.viewer.data.get_gifti_data') as mock_get_gifti_data:
+            mock_get_gifti_data.return_value = {
+                'left_hemisphere': left, 'right_hemisphere': None
+            }
+            response = client.get(
+                Routes.GET_FMRI_DATA.value + "?context_id=main",
+                headers={'Accept': 'application/octet-stream'}
+            )
+
+            assert response.status_code == 200
+            assert response.mimetype == 'application/octet-stream'
+            result = decode_binary_payload(response.data)
+            np.testing.assert_array_equal(
+                result['data']['left_hemisphere'], left
+            )
+            assert result['data']['right_hemisphere'] is None
+            assert result['plot_options']['threshold_max'] == 1.0
+            assert mock_get_gifti_data.call_args.kwargs['as_array'] is True
+
+    def test_get_fmri_data_range(self, client, mock_data_manager_ctx):
+        """Test GET_FMRI_DATA_RANGE returns clipped frames and fills the cache."""
+        mock_data_manager_ctx.fmri_file_type = 'gifti'
+        mock_data_manager_ctx.n_timepoints = 4
+        mock_data_manager_ctx.get_fmri_plot_options.return_value = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+        mock_data_manager_ctx.left_func_img = MagicMock()
+        mock_data_manager_ctx.right_func_img = None
+        mock_data_manager_ctx.color_options_original = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+
+        with patch('findviz.routes.viewer.data.get_gifti_data') as mock_get_gifti_data:
+            mock_get_gifti_data.side_effect = lambda time_point, **kwargs: {
+                'left_hemisphere': np.array([time_point], dtype=np.float32),
+                'right_hemisphere': None
+            }
+            response = client.get(
+                Routes.GET_FMRI_DATA_RANGE.value
+                + "?context_id=main&start=2&end=10"
+            )
+
+            assert response.status_code == 200
+            result = json.loads(response.data)
+            assert result['start'] == 2
+            assert [f['left_hemisphere'] for f in result['frames']] == [[2.0], [3.0]]
+            assert result['plot_options']['threshold_max'] == 1.0
+            assert mock_get_gifti_data.call_count == 2
+
+            # a single timepoint request in the range is served from cache
+            mock_data_manager_ctx.timepoint = 3
+            response = client.get(Routes.GET_FMRI_DATA.value + "?context_id=main")
+            assert json.loads(response.data)['data']['left_hemisphere'] == [3.0]
+            assert mock_get_gifti_data.call_count == 2
+
+            # binary response
+            response = client.get(
+                Routes.GET_FMRI_DATA_RANGE.value
+                + "?context_id=main&start=0&end=2",
+                headers={'Accept': 'application/octet-stream'}
+            )
+            result = decode_binary_payload(response.data)
+            assert len(result['frames']) == 2
+            np.testing.assert_array_equal(
+                result['frames'][1]['left_hemisphere'], [1.0]
+            )
+
+    def test_get_fmri_data_range_warm_only(self, client, mock_data_manager_ctx):
+        """Test GET_FMRI_DATA_RANGE with warm_only caches frames without sending them."""
+        mock_data_manager_ctx.fmri_file_type = 'gifti'
+        mock_data_manager_ctx.n_timepoints = 4
+        mock_data_manager_ctx.get_fmri_plot_options.return_value = {
+            "threshold_min": 0.0,
+            "threshold_max": 1.0
+        }
+        mock_data_manager_ctx.left_func_img = MagicMock()
+        mock_data_manager_ctx.right_func_img = None
+
+        with patch('findviz.routes.viewer.data.get_gifti_data') as mock_get_gifti_data:
+            mock_get_gifti_data.side_effect = lambda time_point, **kwargs: {
+                'left_hemisphere': np.array([time_point], dtype=np.float32),
+                'right_hemisphere': None
+            }
+            response = client.get(
+                Routes.GET_FMRI_DATA_RANGE.value
+                + "?context_id=main&start=1&end=3&warm_only=true"
+            )
+            assert response.status_code == 204
+            assert response.data == b''
+            assert mock_get_gifti_data.call_count == 2
+
+            mock_data_manager_ctx.timepoint = 2
+            response = client.get(Routes.GET_FMRI_DATA.value + "?context_id=main")
+            assert json.loads(response.data)['data']['left_hemisphere'] == [2.0]
+            assert mock_get_gifti_data.call_count == 2
+
+    def test_get_fmri_data_range_missing_params(self, client, mock_data_manager_ctx):
+        """Test GET_FMRI_DATA_RANGE requires start and end."""
+        response = client.get(
+            Routes.GET_FMRI_DATA_RANGE.value + "?context_id=main&start=0"
+        )
+        assert response.status_code == 400
+
     def test_get_last_timecourse(self, client, mock_data_manager_ctx):
         """Test GET_LAST_TIMECOURSE route."""
         # Setup
@@ -163,7 +367,44 @@ class TestDataRoutes:
         # Check the response
         assert response.status_code == 200
         assert json.loads(response.data) == expected_data
+
+    def test_get_distance_data_binary(self, client, mock_data_manager_ctx):
+        """Test GET_DISTANCE_DATA returns a float32 buffer when requested."""
+        mock_data_manager_ctx.distance_data = np.array([0.1, np.nan, 0.3])
+
+        response = client.get(
+            Routes.GET_DISTANCE_DATA.value + "?context_id=main",
+            headers={'Accept': 'application/octet-stream'}
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/octet-stream'
+        result = decode_binary_payload(response.data)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, [0.1, np.nan, 0.3], rtol=1e-6)
     
+    def test_get_distance_data_conditional_by_media_type(self, client, mock_data_manager_ctx):
+        """Test that JSON and binary GET_DISTANCE_DATA responses have distinct ETags."""
+        mock_data_manager_ctx.distance_data = np.array([0.1, 0.2])
+        url = Routes.GET_DISTANCE_DATA.value + "?context_id=main"
+        binary = {'Accept': 'application/octet-stream'}
+
+        response = client.get(url)
+        json_etag = response.headers['ETag']
+        assert 'Accept' in response.headers['Vary']
+
+        # a cached JSON copy does not validate the binary representation
+        response = client.get(url, headers={**binary, 'If-None-Match': json_etag})
+        assert response.status_code == 200
+        assert response.mimetype == 'application/octet-stream'
+        assert response.headers['ETag'] != json_etag
+        assert 'Accept' in response.headers['Vary']
+
+        response = client.get(
+            url, headers={**binary, 'If-None-Match': response.headers['ETag']}
+        )
+        assert response.status_code == 304
+
     def test_get_montage_data(self, client, mock_data_manager_ctx):
         """Test GET_MONTAGE_DATA route."""
         # Make the request with context_id
@@ -260,6 +501,68 @@ class TestDataRoutes:
         assert response.status_code == 200
         assert json.loads(response.data) == ["voxel_1_preprocessed"]
     
+    def test_get_timecourse_data_binary(self, client, mock_data_manager_ctx):
+        """Test GET_TIMECOURSE_DATA route with a binary response."""
+        mock_data_manager_ctx.get_viewer_data.return_value = {
+            "ts": {"voxel_1": [0.1, np.nan, 0.3]},
+            "task": {"rest": [1, 0, 0]}
+        }
+
+        response = client.get(
+            f"{Routes.GET_TIMECOURSE_DATA.value}?context_id=main"
+            f"&ts_labels={json.dumps(['voxel_1', 'rest'])}",
+            headers={'Accept': 'application/octet-stream'}
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/octet-stream'
+        result = decode_binary_payload(response.data)
+        assert result['voxel_1'].dtype == np.float32
+        np.testing.assert_allclose(result['voxel_1'], [0.1, np.nan, 0.3], rtol=1e-6)
+        np.testing.assert_array_equal(result['rest'], [1, 0, 0])
+
+    def test_get_timecourse_data_streamed(self, client, mock_data_manager_ctx):
+        """Test GET_TIMECOURSE_DATA streams JSON without modifying viewer data."""
+        ts_data = {"voxel_1": np.array([0.1, np.nan])}
+        task_data = {"rest": [1, 0]}
+        mock_data_manager_ctx.get_viewer_data.return_value = {
+            "ts": ts_data, "task": task_data
+        }
+
+        response = client.get(
+            f"{Routes.GET_TIMECOURSE_DATA.value}?context_id=main&ts_labels=null"
+        )
+
+        assert response.is_streamed
+        assert json.loads(response.data) == {
+            "voxel_1": [0.1, None], "rest": [1, 0]
+        }
+        assert list(ts_data) == ["voxel_1"]
+        assert list(task_data) == ["rest"]
+
+    def test_get_timecourse_data_all_labels(self, client, mock_data_manager_ctx):
+        """Test GET_TIMECOURSE_DATA with all labels and unknown labels."""
+        mock_data_manager_ctx.get_viewer_data.return_value = {
+            "ts": {"voxel_1": [0.1], "voxel_2": [0.2]},
+            "task": {"rest": [1]}
+        }
+
+        expected = {"voxel_1": [0.1], "voxel_2": [0.2], "rest": [1]}
+
+        # all labels in stored order
+        labels = ["voxel_1", "voxel_2", "rest"]
+        response = client.get(
+            f"{Routes.GET_TIMECOURSE_DATA.value}?context_id=main&ts_labels={json.dumps(labels)}"
+        )
+        assert json.loads(response.data) == expected
+
+        # all labels in a different order, with an unknown label
+        labels = ["rest", "missing", "voxel_2", "voxel_1"]
+        response = client.get(
+            f"{Routes.GET_TIMECOURSE_DATA.value}?context_id=main&ts_labels={json.dumps(labels)}"
+        )
+        assert json.loads(response.data) == expected
+
     def test_get_timecourse_source(self, client, mock_data_manager_ctx):
         """Test GET_TIMECOURSE_SOURCE route."""
         # Make the request with context_id
@@ -292,9 +595,8 @@ class TestDataRoutes:
     def test_get_timepoints(self, client, mock_data_manager_ctx):
         """Test GET_TIMEPOINTS route."""
         # Setup
-        expected_timepoints = [0, 1, 2, 3, 4]
-        mock_data_manager_ctx.get_timepoints.return_value = expected_timepoints
-        expected_data = {"timepoints": expected_timepoints}
+        expected_data = {"n_timepoints": 5, "start": 0, "step": 2.0}
+        mock_data_manager_ctx.get_timepoints_range.return_value = expected_data
         
         # Make the request with context_id
         response = client.get(Routes.GET_TIMEPOINTS.value + "?context_id=main")
@@ -302,7 +604,48 @@ class TestDataRoutes:
         # Check the response
         assert response.status_code == 200
         assert json.loads(response.data) == expected_data
-        mock_data_manager_ctx.get_timepoints.assert_called_once()
+        mock_data_manager_ctx.get_timepoints_range.assert_called_once()
+
+    def test_get_timepoints_list(self, client, mock_data_manager_ctx):
+        """Test GET_TIMEPOINTS returns the list of unevenly spaced timepoints."""
+        mock_data_manager_ctx.get_timepoints_range.return_value = None
+        mock_data_manager_ctx.get_timepoints.return_value = [0, 1, 4, 9]
+
+        response = client.get(Routes.GET_TIMEPOINTS.value + "?context_id=main")
+
+        assert response.status_code == 200
+        assert json.loads(response.data) == {"timepoints": [0, 1, 4, 9]}
+
+    def test_get_timepoints_conditional(self, client, mock_data_manager_ctx):
+        """Test GET_TIMEPOINTS returns 304 when the ETag matches."""
+        mock_data_manager_ctx.get_timepoints_range.return_value = {
+            "n_timepoints": 3, "start": 0, "step": 1
+        }
+
+        response = client.get(Routes.GET_TIMEPOINTS.value + "?context_id=main")
+        etag = response.headers['ETag']
+        assert etag.startswith('W/')
+        assert response.headers['Cache-Control'] == 'no-cache'
+
+        # Matching ETag returns an empty 304
+        response = client.get(
+            Routes.GET_TIMEPOINTS.value + "?context_id=main",
+            headers={'If-None-Match': etag}
+        )
+        assert response.status_code == 304
+        assert response.data == b''
+
+        # Changed value returns a full response with a new ETag
+        mock_data_manager_ctx.get_timepoints_range.return_value = {
+            "n_timepoints": 4, "start": 0, "step": 1
+        }
+        response = client.get(
+            Routes.GET_TIMEPOINTS.value + "?context_id=main",
+            headers={'If-None-Match': etag}
+        )
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert json.loads(response.data)["n_timepoints"] == 4
 
     def test_get_vertex_coords(self, client, mock_data_manager_ctx):
         """Test GET_VERTEX_COORDS route."""
@@ -397,8 +740,8 @@ class TestDataRoutes:
     def test_get_world_coords(self, client, mock_data_manager_ctx):
         """Test GET_WORLD_COORDS route."""
         # Setup
-        mock_data_manager_ctx.get_world_coords.return_value = [10, 20, 30]
         expected_data = {"x": 10, "y": 20, "z": 30}
+        mock_data_manager_ctx.get_world_coords_dict.return_value = expected_data
         
         # Make the request with context_id
         response = client.get(Routes.GET_WORLD_COORDS.value + "?context_id=main")
@@ -406,7 +749,7 @@ class TestDataRoutes:
         # Check the response
         assert response.status_code == 200
         assert json.loads(response.data) == expected_data
-        mock_data_manager_ctx.get_world_coords.assert_called_once()
+        mock_data_manager_ctx.get_world_coords_dict.assert_called_once()
     
     def test_pop_fmri_timecourse(self, client, mock_data_manager_ctx, form_content_type):
         """Test POP_FMRI_TIMECOURSE route."""
@@ -507,11 +850,7 @@ class TestDataRoutes:
     def test_update_fmri_timecourse_nifti(self, client, mock_data_manager_ctx, form_content_type):
         """Test UPDATE_FMRI_TIMECOURSE route for nifti data."""
         # Setup
-        mock_viewer_data = {
-            "func_img": MagicMock(),
-            "anat_img": MagicMock()
-        }
-        mock_data_manager_ctx.get_viewer_data.return_value = mock_viewer_data
+        mock_data_manager_ctx.func_img = MagicMock()
         mock_data_manager_ctx.get_slice_idx.return_value = {'x': 0, 'y': 1, 'z': 2}
 
         # Mock the get_timecourse_nifti function
@@ -531,29 +870,35 @@ class TestDataRoutes:
             # Check the response
             assert response.status_code == 200
             assert json.loads(response.data) == {"status": "success"}
-            mock_data_manager_ctx.get_viewer_data.assert_called_once_with(
-                fmri_data=True,
-                time_course_data=False,
-                task_data=False
-            )
+            mock_data_manager_ctx.get_viewer_data.assert_not_called()
             mock_get_timecourse_nifti.assert_called_once_with(
-                func_img=mock_viewer_data["func_img"],
+                func_img=mock_data_manager_ctx.func_img,
                 x=0, y=1, z=2
             )
             mock_data_manager_ctx.update_timecourse.assert_called_once_with(
                 [1, 2, 3],
                 "voxel_1"
             )
+
+            # the time course of a revisited voxel is not read again
+            response = client.post(
+                Routes.UPDATE_FMRI_TIMECOURSE.value,
+                data={"context_id": "main"},
+                headers=form_content_type
+            )
+            assert response.status_code == 200
+            mock_get_timecourse_nifti.assert_called_once()
+            assert mock_data_manager_ctx.update_timecourse.call_count == 2
+            first, second = mock_data_manager_ctx.update_timecourse.call_args_list
+            assert second.args == ([1, 2, 3], "voxel_1")
+            assert second.args[0] is not first.args[0]
     
     def test_update_fmri_timecourse_gifti(self, client, mock_data_manager_ctx, form_content_type):
         """Test UPDATE_FMRI_TIMECOURSE route for gifti data."""
         # Setup
         mock_data_manager_ctx.fmri_file_type = "gifti"
-        mock_viewer_data = {
-            "left_func_img": MagicMock(),
-            "right_func_img": MagicMock()
-        }
-        mock_data_manager_ctx.get_viewer_data.return_value = mock_viewer_data
+        mock_data_manager_ctx.left_func_img = MagicMock()
+        mock_data_manager_ctx.right_func_img = MagicMock()
         mock_data_manager_ctx.get_click_coords.return_value = {"selected_vertex": 0, "selected_hemi": "left"}
 
         # Mock the get_timecourse_gifti function
@@ -574,8 +919,8 @@ class TestDataRoutes:
             assert response.status_code == 200
             assert json.loads(response.data) == {"status": "success"}
             mock_get_timecourse_gifti.assert_called_once_with(
-                left_func_img=mock_viewer_data["left_func_img"],
-                right_func_img=mock_viewer_data["right_func_img"],
+                left_func_img=mock_data_manager_ctx.left_func_img,
+                right_func_img=mock_data_manager_ctx.right_func_img,
                 vertex_index=0,
                 hemisphere="left"
             )
@@ -648,6 +993,42 @@ class TestDataRoutes:
         # Check that the timepoint was not reset to the old value
         assert mock_data_manager_ctx.timepoint != old_timepoint
 
+    def test_update_timepoint_json(self, client, mock_data_manager_ctx):
+        """Test UPDATE_TIMEPOINT route with a json body."""
+        response = client.post(
+            Routes.UPDATE_TIMEPOINT.value,
+            json={"time_point": 4, "context_id": "main"}
+        )
+
+        assert response.status_code == 200
+        mock_data_manager_ctx.update_timepoint.assert_called_once_with(4)
+
+    def test_update_location_json(self, client, mock_data_manager_ctx):
+        """Test UPDATE_LOCATION route with a json body."""
+        response = client.post(
+            Routes.UPDATE_LOCATION.value,
+            json={
+                "click_coords": {"x": 1, "y": 2},
+                "slice_name": "slice_1",
+                "context_id": "main"
+            }
+        )
+
+        assert response.status_code == 200
+        mock_data_manager_ctx.update_location.assert_called_once_with(
+            {"x": 1, "y": 2}, "slice_1"
+        )
+
+    def test_update_location_json_missing_param(self, client, mock_data_manager_ctx):
+        """Test UPDATE_LOCATION route with a json body missing a parameter."""
+        response = client.post(
+            Routes.UPDATE_LOCATION.value,
+            json={"click_coords": {"x": 1, "y": 2}, "context_id": "main"}
+        )
+
+        assert response.status_code == 400
+        mock_data_manager_ctx.update_location.assert_not_called()
+
     def test_update_tr(self, client, mock_data_manager_ctx, form_content_type):
         """Test UPDATE_TR route."""
         # Setup
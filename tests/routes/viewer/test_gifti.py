@@ -1,14 +1,18 @@
 """
 Tests for gifti.py module
 """
+import gc
+
 import numpy as np
 import nibabel as nib
 import pytest
 from unittest.mock import patch, MagicMock
 from nibabel.gifti.gifti import GiftiDataArray
 
+from findviz.routes.viewer import gifti as gifti_module
 from findviz.routes.viewer.gifti import (
     get_gifti_data,
+    get_gifti_data_matrix,
     get_timecourse_gifti,
     threshold_gifti_data
 )
@@ -86,6 +90,24 @@ def test_get_gifti_data_left_only(mock_left_functional_image):
     assert np.isclose(left_data[42], 0.5, atol=1e-6)   # Special vertex value
 
 
+def test_get_gifti_data_as_array(mock_left_functional_image):
+    """Test getting GIFTI data as float32 arrays with NaN preserved."""
+    result = get_gifti_data(
+        time_point=0,
+        left_func_img=mock_left_functional_image,
+        right_func_img=None,
+        threshold_min=0.9,
+        threshold_max=1.1,
+        as_array=True
+    )
+    left_data = result['left_hemisphere']
+    assert isinstance(left_data, np.ndarray)
+    assert left_data.dtype == np.float32
+    assert np.isnan(left_data[0])
+    assert np.isclose(left_data[42], 0.5)
+    assert result['right_hemisphere'] is None
+
+
 def test_get_gifti_data_right_only(mock_right_functional_image):
     """Test getting GIFTI data with only right hemisphere data."""
     # Test for timepoint 2
@@ -244,3 +266,67 @@ def test_get_timecourse_gifti_with_both_hemispheres(mock_left_functional_image,
     assert len(timecourse_right) == 5
     assert np.allclose(timecourse_right, [0.7, 1.7, 2.7, 3.7, 4.7], atol=1e-6)
     assert label_right == "Vertex: 57 (right)"
+
+
+def test_get_timecourse_gifti_missing_hemisphere(mock_left_functional_image):
+    """Test error when the requested hemisphere has no functional image."""
+    with pytest.raises(ValueError):
+        get_timecourse_gifti(
+            left_func_img=mock_left_functional_image,
+            right_func_img=None,
+            vertex_index=0,
+            hemisphere='right'
+        )
+
+
+def test_get_gifti_data_threshold_does_not_modify_image(mock_left_functional_image):
+    """Test that thresholding leaves the source image data unchanged."""
+    original = mock_left_functional_image.darrays[0].data.copy()
+    result = get_gifti_data(
+        time_point=0,
+        left_func_img=mock_left_functional_image,
+        right_func_img=None,
+        threshold_min=0.9,
+        threshold_max=1.1,
+        as_array=True
+    )
+    assert np.isnan(result['left_hemisphere'][0])
+    np.testing.assert_array_equal(mock_left_functional_image.darrays[0].data, original)
+    # the stacked data matrix is also left unchanged
+    np.testing.assert_array_equal(
+        get_gifti_data_matrix(mock_left_functional_image)[0], original
+    )
+
+
+def test_get_gifti_data_matrix(mock_left_functional_image):
+    """Test that darrays are stacked once into a (timepoints, vertices) matrix."""
+    data_matrix = get_gifti_data_matrix(mock_left_functional_image)
+    assert data_matrix.shape == (5, 100)
+    assert data_matrix.dtype == np.float32
+    assert data_matrix.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(
+        data_matrix[:, 42], [0.5, 1.5, 2.5, 3.5, 4.5]
+    )
+    # reused for the same image
+    assert get_gifti_data_matrix(mock_left_functional_image) is data_matrix
+
+
+def test_get_gifti_data_matrix_invalidation(mock_left_functional_image):
+    """Test that the matrix is read-only and tied to the image's lifetime."""
+    data_matrix = get_gifti_data_matrix(mock_left_functional_image)
+    with pytest.raises(ValueError):
+        data_matrix[0, 0] = 0
+
+    # a reloaded image gets a new matrix
+    reloaded_img = nib.gifti.GiftiImage(
+        darrays=[GiftiDataArray(data=d.data * 2) for d in mock_left_functional_image.darrays]
+    )
+    reloaded_matrix = get_gifti_data_matrix(reloaded_img)
+    assert reloaded_matrix is not data_matrix
+    np.testing.assert_array_equal(reloaded_matrix, data_matrix * 2)
+
+    # the matrix is released with its image
+    n_matrices = len(gifti_module._data_matrices)
+    del reloaded_img
+    gc.collect()
+    assert len(gifti_module._data_matrices) == n_matrices - 1
@@ -14,9 +14,9 @@ class TestIORoutes:
         # Create mock serialized data
         mock_serialized_data = b'mock_serialized_scene_data'
         
-        # Mock the data_manager.save() method
-        with patch('findviz.routes.shared.data_manager.save') as mock_save:
-            mock_save.return_value = mock_serialized_data
+        # Mock the data_manager.save_to_file() method
+        with patch('findviz.routes.shared.data_manager.save_to_file') as mock_save:
+            mock_save.side_effect = lambda file: file.write(mock_serialized_data)
             
             # Make the request
             response = client.post(Routes.SAVE_SCENE.value)
@@ -38,18 +38,18 @@ class TestIORoutes:
             # Verify the attachment filename
             assert response.headers["Content-Disposition"] == "attachment; filename=scene"
             
-            # Verify the data_manager.save() method was called
+            # Verify the data_manager.save_to_file() method was called
             mock_save.assert_called_once()
     
     def test_save_scene_error(self, client, mock_data_manager_ctx):
         """Test SAVE_SCENE route when an error occurs."""
-        # Mock the data_manager.save() method to raise an exception
-        with patch('findviz.routes.shared.data_manager.save') as mock_save:
+        # Mock the data_manager.save_to_file() method to raise an exception
+        with patch('findviz.routes.shared.data_manager.save_to_file') as mock_save:
             mock_save.side_effect = Exception("Error saving scene")
             
             # Make the request and expect an error response
             with pytest.raises(Exception, match="Error saving scene"):
                 client.post(Routes.SAVE_SCENE.value)
             
-            # Verify the data_manager.save() method was called
+            # Verify the data_manager.save_to_file() method was called
             mock_save.assert_called_once()
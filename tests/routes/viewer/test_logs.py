@@ -0,0 +1,136 @@
+"""
+Tests for logs.py module
+"""
+import io
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from findviz.routes.utils import Routes
+from findviz.routes.viewer import logs as logs_module
+from findviz.routes.viewer.logs import (
+    _iter_lines_reversed,
+    _list_run_log_files,
+    _parse_log_timestamp,
+    get_recent_log_entries
+)
+
+
+def _log_line(timestamp: datetime, message: str) -> str:
+    """Format a log line as written by the app logger."""
+    return (
+        f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')},000 - "
+        f"findviz.test - INFO - {message}\n"
+    )
+
+
+def test_iter_lines_reversed():
+    """Test reading lines from the end of a file across block boundaries."""
+    lines = [f'line {i} ' + 'x' * i for i in range(20)]
+    log_file = io.BytesIO(('\n'.join(lines) + '\n').encode('utf-8'))
+
+    result = list(_iter_lines_reversed(log_file, chunk_size=7))
+
+    # trailing newline yields an empty last line
+    assert result == [''] + lines[::-1]
+
+
+def test_iter_lines_reversed_crlf():
+    """Test that CRLF line endings are stripped, also across block boundaries."""
+    lines = [f'line {i} ' + 'x' * i for i in range(20)]
+    log_file = io.BytesIO(('\r\n'.join(lines) + '\r\n').encode('utf-8'))
+
+    result = list(_iter_lines_reversed(log_file, chunk_size=7))
+
+    assert result == [''] + lines[::-1]
+
+
+def test_parse_log_timestamp():
+    """Test parsing log timestamps by field offsets."""
+    assert _parse_log_timestamp('2023-05-21 14:30:45,123') == datetime(
+        2023, 5, 21, 14, 30, 45, 123000
+    )
+    with pytest.raises(ValueError):
+        _parse_log_timestamp('2023-13-21 14:30:45,123')
+
+
+def test_get_recent_log_entries(tmp_path):
+    """Test that the most recent entries are returned in chronological order."""
+    now = datetime.now()
+    log_file_path = tmp_path / 'app-run-test.log'
+    log_file_path.write_text(
+        _log_line(now - timedelta(minutes=30), 'old')
+        + ''.join(_log_line(now, f'message {i}') for i in range(5))
+    )
+
+    entries = get_recent_log_entries(
+        max_entries=3, since_minutes=15, log_file_path=str(log_file_path)
+    )
+
+    assert [entry['message'] for entry in entries] == [
+        'message 2', 'message 3', 'message 4'
+    ]
+    assert entries[0]['level'] == 'INFO'
+    assert entries[0]['source'] == 'findviz.test'
+
+
+def test_get_recent_log_entries_since_minutes(tmp_path):
+    """Test that entries older than since_minutes are not returned."""
+    now = datetime.now()
+    log_file_path = tmp_path / 'app-run-test.log'
+    log_file_path.write_text(
+        _log_line(now - timedelta(minutes=30), 'old')
+        + _log_line(now, 'new')
+    )
+
+    entries = get_recent_log_entries(
+        max_entries=10, since_minutes=15, log_file_path=str(log_file_path)
+    )
+
+    assert [entry['message'] for entry in entries] == ['new']
+
+
+def test_list_run_log_files(tmp_path, mocker):
+    """Test that the run log file listing is reused until the directory changes."""
+    (tmp_path / 'app-run-20240101-000000.log').write_text('')
+    glob_spy = mocker.spy(logs_module.glob, 'glob')
+
+    files, most_recent = _list_run_log_files(str(tmp_path))
+    assert most_recent == str(tmp_path / 'app-run-20240101-000000.log')
+    assert _list_run_log_files(str(tmp_path)) == (files, most_recent)
+    assert glob_spy.call_count == 1
+
+    # a new run log file invalidates the listing
+    new_file = tmp_path / 'app-run-20240102-000000.log'
+    new_file.write_text('')
+    dir_stat = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns + 1))
+    files, most_recent = _list_run_log_files(str(tmp_path))
+    assert glob_spy.call_count == 2
+    assert len(files) == 2
+
+
+def test_get_log_files_not_modified(client, tmp_path, monkeypatch):
+    """Test that an unchanged log file listing is answered with 304."""
+    (tmp_path / 'logs').mkdir()
+    (tmp_path / 'logs' / 'app-run-20240101-000000.log').write_text('')
+    monkeypatch.chdir(tmp_path)
+
+    response = client.get(Routes.GET_LOG_FILES.value)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+
+    response = client.get(
+        Routes.GET_LOG_FILES.value, headers={'If-None-Match': etag}
+    )
+    assert response.status_code == 304
+    assert response.data == b''
+
+    # a changed log file produces a new listing
+    (tmp_path / 'logs' / 'app-run-20240101-000000.log').write_text('entry')
+    response = client.get(
+        Routes.GET_LOG_FILES.value, headers={'If-None-Match': etag}
+    )
+    assert response.status_code == 200
+    assert response.json[0]['size'] == 5
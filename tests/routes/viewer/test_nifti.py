@@ -7,6 +7,8 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from findviz.routes.viewer.nifti import (
+    anat_slice_cache,
+    coord_label_cache,
     get_nifti_data,
     get_slice_data,
     get_timecourse_nifti,
@@ -14,6 +16,16 @@ from findviz.routes.viewer.nifti import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_slice_caches():
+    """Clear cached coordinate label and anatomical slices between tests."""
+    coord_label_cache.clear()
+    anat_slice_cache.clear()
+    yield
+    coord_label_cache.clear()
+    anat_slice_cache.clear()
+
+
 @pytest.fixture
 def mock_functional_image():
     """Create a mock 4D functional NIfTI image."""
@@ -151,6 +163,115 @@ def test_get_slice_data_string_type(mock_coord_labels):
     assert slice_data[2][5] == "Voxel: 5, 5, 2"  # z coordinate at [5, 5, 2]
 
 
+def test_get_slice_data_array_type(mock_functional_image):
+    """Test extracting a slice as a float32 array with NaN preserved."""
+    data = mock_functional_image.get_fdata()[..., 0]
+    data[5, 0, 0] = np.nan
+    slice_data = get_slice_data(data, slice_index=5, axis='x', array_type='array')
+
+    assert isinstance(slice_data, np.ndarray)
+    assert slice_data.dtype == np.float32
+    assert slice_data.flags['C_CONTIGUOUS']
+    assert slice_data.shape == (8, 12)
+    assert np.isnan(slice_data[0, 0])
+
+
+def test_get_slice_data_singleton_axis():
+    """Test that trailing singleton axes (e.g. a single volume) are dropped."""
+    data = np.arange(10 * 12 * 8, dtype=np.float32).reshape(10, 12, 8, 1)
+    slice_data = get_slice_data(data, slice_index=3, axis='z', array_type='array')
+
+    assert slice_data.shape == (12, 10)
+    assert np.array_equal(slice_data, data[:, :, 3, 0].T)
+
+
+def test_get_slice_data_time_point(mock_functional_image):
+    """Test extracting a slice of a time point from the 4D data object."""
+    data = mock_functional_image.get_fdata()
+    for axis, slice_index in [('x', 5), ('y', 6), ('z', 3)]:
+        slice_data = get_slice_data(
+            mock_functional_image.dataobj, slice_index=slice_index,
+            axis=axis, array_type='array', time_point=2
+        )
+        expected = get_slice_data(
+            data[..., 2], slice_index=slice_index, axis=axis, array_type='array'
+        )
+        assert np.array_equal(slice_data, expected)
+
+
+def test_get_nifti_data_reuses_coord_labels(mock_functional_image, mock_coord_labels, mock_ortho_slice_index):
+    """Test that coordinate label slices are reused across time points."""
+    kwargs = dict(
+        func_img=mock_functional_image,
+        coord_labels=mock_coord_labels,
+        slice_idx=mock_ortho_slice_index,
+        view_state='ortho',
+        montage_slice_dir='x'
+    )
+    result_1 = get_nifti_data(time_point=0, **kwargs)
+    result_2 = get_nifti_data(time_point=1, **kwargs)
+
+    assert result_2['coords']['slice_1'] is result_1['coords']['slice_1']
+    assert result_2['coords']['slice_1'][3][6] == "Voxel: 5, 6, 3"
+    assert len(coord_label_cache) == 3
+
+    # new coordinate labels (e.g. a new image) are not served from the cache
+    result_3 = get_nifti_data(
+        time_point=0, **{**kwargs, 'coord_labels': mock_coord_labels.copy()}
+    )
+    assert result_3['coords']['slice_1'] is not result_1['coords']['slice_1']
+
+
+def test_get_nifti_data_reuses_anat_slices(mock_functional_image, mock_anatomical_image, mock_coord_labels, mock_ortho_slice_index):
+    """Test that anatomical slices are reused across time points."""
+    kwargs = dict(
+        func_img=mock_functional_image,
+        coord_labels=mock_coord_labels,
+        slice_idx=mock_ortho_slice_index,
+        view_state='ortho',
+        montage_slice_dir='x',
+        anat_img=mock_anatomical_image,
+        as_array=True
+    )
+    result_1 = get_nifti_data(time_point=0, **kwargs)
+    result_2 = get_nifti_data(time_point=1, **kwargs)
+
+    assert result_2['anat']['slice_1'] is result_1['anat']['slice_1']
+    assert len(anat_slice_cache) == 3
+
+    # slices of a new anatomical image are not served from the cache
+    anat_img = nib.Nifti1Image(
+        mock_anatomical_image.get_fdata() * 2, np.eye(4)
+    )
+    result_3 = get_nifti_data(time_point=0, **{**kwargs, 'anat_img': anat_img})
+    assert np.array_equal(
+        result_3['anat']['slice_1'], result_1['anat']['slice_1'] * 2
+    )
+
+
+def test_get_nifti_data_montage_slab(mock_functional_image, mock_anatomical_image, mock_coord_labels, mock_montage_slice_index):
+    """Test that montage slices read from a single slab match the volume."""
+    data = mock_functional_image.get_fdata()
+    data[:, :, :, 1] += np.arange(10)[:, None, None]
+    func_img = nib.Nifti1Image(data.astype(np.float32), np.eye(4))
+
+    result = get_nifti_data(
+        time_point=1,
+        func_img=func_img,
+        coord_labels=mock_coord_labels,
+        slice_idx=mock_montage_slice_index,
+        view_state='montage',
+        montage_slice_dir='x',
+        anat_img=mock_anatomical_image,
+        as_array=True
+    )
+
+    for slice_container, x in [('slice_1', 3), ('slice_2', 5), ('slice_3', 7)]:
+        assert np.array_equal(result['func'][slice_container], data[x, :, :, 1].T)
+        assert result['anat'][slice_container].shape == (8, 12)
+        assert result['coords'][slice_container][0][0] == f"Voxel: {x}, 0, 0"
+
+
 def test_threshold_nifti_data():
     """Test thresholding NIfTI data."""
     # Create test data
@@ -299,8 +420,105 @@ def test_get_nifti_data_with_threshold(mock_get_slice_data, mock_threshold, mock
     assert 'func' in result
     assert 'slice_1' in result['func']
     
-    # Verify the threshold function was called with the right parameters
-    mock_threshold.assert_called_once()
-    args, kwargs = mock_threshold.call_args
-    assert kwargs['threshold_min'] == 0.5
-    assert kwargs['threshold_max'] == 2.0
+    # Verify the threshold function was called with the right parameters,
+    # once for each displayed slice (rather than the whole volume)
+    assert mock_threshold.call_count == 3
+    for call_args in mock_threshold.call_args_list:
+        kwargs = call_args.kwargs
+        assert kwargs['nifti_data'].ndim == 2
+        assert kwargs['threshold_min'] == 0.5
+        assert kwargs['threshold_max'] == 2.0
+
+
+def test_get_nifti_data_threshold_does_not_modify_image(mock_functional_image, mock_coord_labels, mock_ortho_slice_index):
+    """Test that thresholding a timepoint leaves the source image unchanged."""
+    original = np.asarray(mock_functional_image.dataobj).copy()
+
+    result = get_nifti_data(
+        time_point=1,
+        func_img=mock_functional_image,
+        coord_labels=mock_coord_labels,
+        slice_idx=mock_ortho_slice_index,
+        view_state='ortho',
+        montage_slice_dir='x',
+        threshold_min=1.5,
+        threshold_max=1.9,
+        threshold_min_orig=0.0,
+        threshold_max_orig=5.0,
+        as_array=True
+    )
+
+    # only the test voxel (1.5 at timepoint 1) falls inside the threshold
+    # range; other values of timepoint 1 (2.0) are kept
+    for slice_container, slice_data in [
+        ('slice_1', original[5, :, :, 1]),
+        ('slice_2', original[:, 6, :, 1]),
+        ('slice_3', original[:, :, 3, 1]),
+    ]:
+        expected = slice_data.T.copy()
+        expected[(expected >= 1.5) & (expected <= 1.9)] = np.nan
+        func_slice = result['func'][slice_container]
+        assert func_slice.dtype == np.float32
+        assert func_slice.flags['C_CONTIGUOUS']
+        assert np.array_equal(func_slice, expected, equal_nan=True)
+        assert np.isnan(func_slice).sum() == 1
+    np.testing.assert_array_equal(np.asarray(mock_functional_image.dataobj), original)
+
+
+def test_nifti_reads_do_not_load_full_image(tmp_path, mock_functional_image, mock_anatomical_image, mock_coord_labels, mock_ortho_slice_index):
+    """Test that timepoint and timecourse reads from a file-backed image do not cache the full data."""
+    file_path = tmp_path / 'func.nii'
+    nib.save(mock_functional_image, file_path)
+    img = nib.load(file_path)
+    anat_path = tmp_path / 'anat.nii'
+    nib.save(mock_anatomical_image, anat_path)
+    anat_img = nib.load(anat_path)
+
+    timecourse, _ = get_timecourse_nifti(func_img=img, x=5, y=6, z=3)
+    result = get_nifti_data(
+        time_point=0,
+        func_img=img,
+        coord_labels=mock_coord_labels,
+        slice_idx=mock_ortho_slice_index,
+        view_state='ortho',
+        montage_slice_dir='x',
+        anat_img=anat_img
+    )
+
+    assert np.allclose(timecourse, [0.5, 1.5, 2.5, 3.5, 4.5], atol=1e-6)
+    assert not img.in_memory
+    # anatomical slices are read from the data object, as floats
+    assert result['anat']['slice_1'] == [[10.0] * 12] * 8
+    assert not anat_img.in_memory
+
+
+def test_nifti_reads_decode_compressed_image_once(tmp_path, mock_functional_image, mock_coord_labels, mock_ortho_slice_index):
+    """Test that reads from a gzipped image decode the file once and reuse the data."""
+    file_path = tmp_path / 'func.nii.gz'
+    nib.save(mock_functional_image, file_path)
+    img = nib.load(file_path)
+
+    proxy_type = type(img.dataobj)
+    with patch.object(
+        proxy_type, '__array__', autospec=True,
+        side_effect=proxy_type.__array__
+    ) as mock_array, patch.object(
+        proxy_type, '__getitem__', autospec=True,
+        side_effect=proxy_type.__getitem__
+    ) as mock_getitem:
+        for time_point in (0, 1):
+            result = get_nifti_data(
+                time_point=time_point,
+                func_img=img,
+                coord_labels=mock_coord_labels,
+                slice_idx=mock_ortho_slice_index,
+                view_state='ortho',
+                montage_slice_dir='x'
+            )
+            timecourse, _ = get_timecourse_nifti(func_img=img, x=5, y=6, z=3)
+            assert result['func']['slice_1'][0][0] == pytest.approx(time_point + 1)
+            assert np.allclose(timecourse, [0.5, 1.5, 2.5, 3.5, 4.5], atol=1e-6)
+
+    # the file is decoded once, and not sliced through the proxy
+    assert mock_array.call_count == 1
+    mock_getitem.assert_not_called()
@@ -45,21 +45,18 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_timecourse_global_plot_options.assert_called_once_with(
             {"global_convolution": convolution}
         )
         
-        # Check that update_task_design_plot_options was called for each task condition
-        assert mock_data_manager_ctx.update_task_design_plot_options.call_count == len(mock_data_manager_ctx.task_conditions)
-        
-        # Check that it was called with the correct arguments for each label
-        for label in mock_data_manager_ctx.task_conditions:
-            mock_data_manager_ctx.update_task_design_plot_options.assert_any_call(
-                label, {"convolution": "hrf"}
-            )
-    
+        # task design plot options of all conditions are updated in one call
+        mock_data_manager_ctx.update_all_task_design_plot_options.assert_called_once_with(
+            {"convolution": "hrf"}
+        )
+        mock_data_manager_ctx.update_task_design_plot_options.assert_not_called()
+
     def test_check_fmri_preprocessed(self, client, mock_data_manager_ctx, form_content_type):
         """Test CHECK_FMRI_PREPROCESSED route."""
         # Setup
@@ -118,8 +115,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.clear_annotation_markers.assert_called_once()
     
     def test_get_annotation_markers(self, client, mock_data_manager_ctx):
@@ -184,7 +181,30 @@ class TestPlotRoutes:
             "colormap": "viridis"
         }
         mock_data_manager_ctx.get_fmri_plot_options.assert_called_once()
-    
+
+    def test_get_fmri_plot_options_not_modified(self, client, mock_data_manager_ctx):
+        """Test GET_FMRI_PLOT_OPTIONS returns 304 for unchanged plot options."""
+        mock_data_manager_ctx.get_fmri_plot_options.return_value = {
+            "threshold_min": 0.1
+        }
+        url = Routes.GET_FMRI_PLOT_OPTIONS.value + "?context_id=main"
+
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+        # changed plot options produce a new response
+        mock_data_manager_ctx.get_fmri_plot_options.return_value = {
+            "threshold_min": 0.2
+        }
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert json.loads(response.data) == {"threshold_min": 0.2}
+
     def test_get_nifti_view_state(self, client, mock_data_manager_ctx):
         """Test GET_NIFTI_VIEW_STATE route."""
         # Setup
@@ -318,14 +338,14 @@ class TestPlotRoutes:
         # Make the request with context_id
         response = client.post(
             Routes.MOVE_ANNOTATION_SELECTION.value,
-            data={"direction": "next", "context_id": "main"},
+            data={"direction": "right", "context_id": "main"},
             headers=form_content_type
         )
         
         # Check the response
         assert response.status_code == 200
         assert json.loads(response.data) == {"selected_marker": 1}
-        mock_data_manager_ctx.move_annotation_selection.assert_called_once_with("next")
+        mock_data_manager_ctx.move_annotation_selection.assert_called_once_with("right")
     
     def test_remove_distance_plot(self, client, mock_data_manager_ctx, form_content_type):
         """Test REMOVE_DISTANCE_PLOT route."""
@@ -337,8 +357,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.clear_distance_plot_state.assert_called_once()
     
     def test_reset_fmri_color_options(self, client, mock_data_manager_ctx, form_content_type):
@@ -351,8 +371,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.reset_fmri_color_options.assert_called_once()
     
     def test_reset_timecourse_shift(self, client, mock_data_manager_ctx, form_content_type):
@@ -370,8 +390,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.reset_timecourse_shift.assert_called_once_with(
             "voxel_1", "scale", "timecourse"
         )
@@ -414,8 +434,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_distance_plot_options.assert_called_once_with(distance_plot_options)
     
     def test_update_fmri_plot_options(self, client, mock_data_manager_ctx, form_content_type):
@@ -438,8 +458,27 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
+        mock_data_manager_ctx.update_fmri_plot_options.assert_called_once_with(fmri_plot_options)
+    
+    def test_update_fmri_plot_options_json(self, client, mock_data_manager_ctx):
+        """Test UPDATE_FMRI_PLOT_OPTIONS route with a json body."""
+        fmri_plot_options = {
+            "threshold_min": 0.2,
+            "threshold_max": 0.8,
+            "colormap": "hot"
+        }
+        
+        response = client.post(
+            Routes.UPDATE_FMRI_PLOT_OPTIONS.value,
+            json={
+                "fmri_plot_options": fmri_plot_options,
+                "context_id": "main"
+            }
+        )
+        
+        assert response.status_code == 204
         mock_data_manager_ctx.update_fmri_plot_options.assert_called_once_with(fmri_plot_options)
     
     def test_update_annotation_marker_plot_options(self, client, mock_data_manager_ctx, form_content_type):
@@ -462,8 +501,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_annotation_marker_plot_options.assert_called_once_with(
             annotation_marker_plot_options
         )
@@ -488,8 +527,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_view_state.assert_called_once_with(new_view_state)
         # Check that view_state was updated
         assert mock_data_manager_ctx.view_state == new_view_state
@@ -517,8 +556,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_task_design_plot_options.assert_called_once_with(
             "rest", task_design_plot_options
         )
@@ -542,8 +581,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_timecourse_global_plot_options.assert_called_once_with(
             timecourse_global_plot_options
         )
@@ -569,13 +608,51 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         timecourse_plot_options["linewidth"] = 2
         mock_data_manager_ctx.update_timecourse_plot_options.assert_called_once_with(
             "voxel_1", timecourse_plot_options
         )
     
+    def test_update_timecourse_plot_options_malformed(self, client, mock_data_manager_ctx):
+        """Test UPDATE_TIMECOURSE_PLOT_OPTIONS rejects options that are not a dict."""
+        response = client.post(
+            Routes.UPDATE_TIMECOURSE_PLOT_OPTIONS.value,
+            json={
+                "label": "voxel_1",
+                "timecourse_plot_options": ["color", "red"],
+                "context_id": "main"
+            }
+        )
+
+        assert response.status_code == 400
+        mock_data_manager_ctx.update_timecourse_plot_options.assert_not_called()
+
+    def test_update_timecourse_plot_options_json(self, client, mock_data_manager_ctx):
+        """Test UPDATE_TIMECOURSE_PLOT_OPTIONS route with typed json values."""
+        timecourse_plot_options = {
+            "color": "purple",
+            "linewidth": 2,
+            "opacity": 0.5,
+            "visible": True
+        }
+        
+        response = client.post(
+            Routes.UPDATE_TIMECOURSE_PLOT_OPTIONS.value,
+            json={
+                "label": "1",
+                "timecourse_plot_options": timecourse_plot_options,
+                "context_id": "main"
+            }
+        )
+        
+        assert response.status_code == 204
+        # json values (and labels) are passed through as sent
+        mock_data_manager_ctx.update_timecourse_plot_options.assert_called_once_with(
+            "1", timecourse_plot_options
+        )
+    
     def test_update_timecourse_shift(self, client, mock_data_manager_ctx, form_content_type):
         """Test UPDATE_TIMECOURSE_SHIFT route."""
         # Make the request with context_id
@@ -592,8 +669,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_timecourse_shift.assert_called_once_with(
             "voxel_1", "timecourse", "scale", "increase"
         )
@@ -618,8 +695,8 @@ class TestPlotRoutes:
         )
         
         # Check the response
-        assert response.status_code == 200
-        assert json.loads(response.data) == {"status": "success"}
+        assert response.status_code == 204
+        assert response.data == b""
         mock_data_manager_ctx.update_time_marker_plot_options.assert_called_once_with(
             timemarker_plot_options
         )
@@ -82,15 +82,20 @@ def test_nifti_upload_browser_func_only(mock_read_nii, mock_nifti_4d):
 @patch('findviz.viz.io.nifti.read_nii')
 def test_nifti_upload_cli_all_files(mock_read_nii, mock_nifti_4d, mock_nifti_3d, mock_nifti_mask):
     """Test successful CLI upload with all files"""
-    # Configure mock to return different values for different calls
-    mock_read_nii.side_effect = [mock_nifti_4d, mock_nifti_3d, mock_nifti_mask]
-    
     uploader = NiftiUpload(method='cli')
     cli_files = {
         'nii_func': '/path/to/func.nii.gz',
         'nii_anat': '/path/to/anat.nii.gz',
         'nii_mask': '/path/to/mask.nii.gz'
     }
+    # Configure mock to return a different image for each file; anat and
+    # mask are read in background threads, so call order is not fixed
+    images = {
+        cli_files['nii_func']: mock_nifti_4d,
+        cli_files['nii_anat']: mock_nifti_3d,
+        cli_files['nii_mask']: mock_nifti_mask
+    }
+    mock_read_nii.side_effect = lambda file, method: images[file]
     
     result = uploader.upload(fmri_files=cli_files)
     
@@ -285,6 +290,8 @@ def test_read_nii_cli(tmp_path):
     result = read_nii(filepath, method='cli')
     assert isinstance(result, nib.Nifti1Image)
     assert result.shape == (5, 5, 5)
+    # file handle is kept open for repeated data object reads
+    assert result.dataobj._keep_file_open
 
 
 def test_read_nii_cli_error():
@@ -60,6 +60,8 @@ def mock_nifti_image():
     mock_img = MagicMock(spec=nib.Nifti1Image)
     # Make get_fdata return a numpy array with proper dimensions (3D+time)
     mock_img.get_fdata.return_value = np.zeros((10, 10, 10, 4))
+    mock_img.dataobj = np.zeros((10, 10, 10, 4))
+    mock_img.shape = (10, 10, 10, 4)
     # Set header and affine properties
     mock_img.header = MagicMock(spec=nib.Nifti1Header)
     mock_img.affine = np.eye(4)
@@ -444,6 +446,37 @@ def test_serialize_to_bytes_gifti(mock_gifti_context):
         assert state['file_type'] == 'gifti'
         assert state['tr'] == 2.0
 
+def test_serialize_to_file_nifti(mock_nifti_context, tmp_path):
+    """Test serializing NIFTI state directly into a file object."""
+    mock_nifti_context._state.nifti_data = {
+        'func_img': MagicMock(spec=nib.Nifti1Image)
+    }
+    mock_nifti_context._state.nifti_data['func_img'].to_bytes = MagicMock(return_value=b'mock_bytes')
+    
+    state_path = tmp_path / 'scene.fvstate'
+    with open(state_path, 'wb') as f:
+        StateFile.serialize_to_file(mock_nifti_context, f)
+    
+    # The file holds the same archive layout as serialize_to_bytes
+    with zipfile.ZipFile(state_path, 'r') as zipf:
+        file_list = zipf.namelist()
+        assert 'manifest.json' in file_list
+        assert 'state.json' in file_list
+        assert zipf.read('data/func_img.nii.gz') == b'mock_bytes'
+
+def test_serialize_state_json_compact(mock_gifti_context):
+    """Test that state.json is written without whitespace padding."""
+    mock_gifti_context._state.vertices_left = np.zeros((100, 3))
+    
+    state_bytes = StateFile.serialize_to_bytes(mock_gifti_context)
+    
+    with zipfile.ZipFile(io.BytesIO(state_bytes), 'r') as zipf:
+        state_json = zipf.read('state.json').decode('utf-8')
+    assert '\n' not in state_json
+    assert ', ' not in state_json
+    state = json.loads(state_json)
+    assert state['vertices_left']['values'] == [[0.0, 0.0, 0.0]] * 100
+
 @patch('zipfile.ZipFile')
 def test_serialize_to_bytes_with_error(mock_zipfile, mock_nifti_context):
     """Test error handling during serialization."""
@@ -128,6 +128,9 @@ def test_create_gifti_state(context, mock_gifti_func, mock_gifti_mesh):
     assert context._state.vertices_right is not None
     assert context._state.faces_left is not None
     assert context._state.faces_right is not None
+    # mesh data is kept as arrays for serialization
+    assert isinstance(context._state.vertices_left, np.ndarray)
+    assert isinstance(context._state.faces_left, np.ndarray)
     assert context._state.timepoints is not None
     assert len(context._state.timepoints) == len(mock_gifti_func.darrays)
 
@@ -207,6 +210,31 @@ def test_store_and_clear_fmri_preprocessed(nifti_context, mock_nifti_4d):
     nifti_context.clear_fmri_preprocessed()
     assert nifti_context._state.fmri_preprocessed is False
 
+def test_fmri_image_properties(nifti_context, gifti_context, mock_nifti_4d):
+    """Test that image properties match get_viewer_data and track preprocessing."""
+    viewer_data = nifti_context.get_viewer_data(
+        fmri_data=True, time_course_data=False, task_data=False
+    )
+    assert nifti_context.func_img is viewer_data['func_img']
+    assert nifti_context.anat_img is viewer_data['anat_img']
+    assert nifti_context.left_func_img is None
+
+    preprocessed_img = nib.Nifti1Image(
+        mock_nifti_4d.get_fdata(), mock_nifti_4d.affine
+    )
+    nifti_context.store_fmri_preprocessed({'func_img': preprocessed_img})
+    assert nifti_context.func_img is (
+        nifti_context._state.nifti_data_preprocessed['func_img']
+    )
+    assert nifti_context.func_img is not viewer_data['func_img']
+
+    viewer_data = gifti_context.get_viewer_data(
+        fmri_data=True, time_course_data=False, task_data=False
+    )
+    assert gifti_context.left_func_img is viewer_data['left_func_img']
+    assert gifti_context.right_func_img is viewer_data['right_func_img']
+    assert gifti_context.func_img is None
+
 def test_store_and_clear_ts_preprocessed(ts_context):
     """Test storing and clearing preprocessed timecourse data."""
     # Store preprocessed data
@@ -397,6 +425,21 @@ def test_update_task_design_plot_options(task_context):
     # cond2 should be unchanged
     assert options['cond2']['opacity'] == 1.0
 
+
+def test_update_all_task_design_plot_options(task_context):
+    """Test updating task design plot options of all conditions."""
+    task_context.update_all_task_design_plot_options({'convolution': 'block'})
+
+    options = task_context.get_task_design_plot_options()
+    assert options['cond1']['convolution'] == 'block'
+    assert options['cond2']['convolution'] == 'block'
+
+    # colors are specific to a condition
+    with pytest.raises(ValueError):
+        task_context.update_all_task_design_plot_options(
+            {'color': TimeCourseColor.RED}
+        )
+
 # Location and timepoint tests
 def test_update_location_nifti(nifti_context):
     """
@@ -717,6 +760,37 @@ def test_get_time_points(nifti_context):
     assert timepoints is not None
     assert len(timepoints) == nifti_context._state.nifti_data['func_img'].shape[3]
 
+def test_get_timepoints_range(nifti_context):
+    """Test that the timepoint range matches the full list of timepoints."""
+    n_timepoints = nifti_context._state.nifti_data['func_img'].shape[3]
+    assert nifti_context.get_timepoints_range() == {
+        'n_timepoints': n_timepoints, 'start': 0, 'step': 1
+    }
+
+    nifti_context._state.tr = 2.0
+    nifti_context._state.fmri_plot_options.tr_convert_on = True
+    nifti_context.convert_timepoints()
+    timepoints_range = nifti_context.get_timepoints_range()
+    assert timepoints_range['step'] == 2.0
+    assert [
+        timepoints_range['start'] + i * timepoints_range['step']
+        for i in range(timepoints_range['n_timepoints'])
+    ] == nifti_context.get_timepoints()
+
+def test_get_timepoints_range_set_timepoints(nifti_context):
+    """Test that the timepoint range follows timepoints set by set_timepoints."""
+    n_timepoints = nifti_context._state.nifti_data['func_img'].shape[3]
+    # evenly spaced lags, as set by the correlation context
+    lags = list(range(-(n_timepoints // 2), n_timepoints - n_timepoints // 2))
+    nifti_context.set_timepoints(lags)
+    assert nifti_context.get_timepoints_range() == {
+        'n_timepoints': n_timepoints, 'start': lags[0], 'step': 1
+    }
+
+    # timepoints that are not evenly spaced have no range
+    nifti_context.set_timepoints([i ** 2 for i in range(n_timepoints)])
+    assert nifti_context.get_timepoints_range() is None
+
 def test_get_time_point(nifti_context):
     """Test getting current time point."""
     # Set a specific timepoint
@@ -865,6 +939,31 @@ def test_get_world_coords(nifti_context):
     assert coords[1] == 6
     assert coords[2] == 7
 
+def test_get_world_coords_dict(nifti_context):
+    """Test getting memoized world coordinates dictionary."""
+    nifti_context._state.func_affine = np.eye(4)
+    nifti_context._state.ortho_slice_idx = {'x': 5, 'y': 6, 'z': 7}
+
+    coords = nifti_context.get_world_coords_dict()
+    assert coords == {'x': 5, 'y': 6, 'z': 7}
+    # unchanged location returns the memoized object
+    assert nifti_context.get_world_coords_dict() is coords
+
+    # changed location rebuilds the dictionary
+    nifti_context._state.ortho_slice_idx = {'x': 1, 'y': 2, 'z': 3}
+    assert nifti_context.get_world_coords_dict() == {'x': 1, 'y': 2, 'z': 3}
+
+def test_get_world_coords_dict_gifti(gifti_context):
+    """Test world coordinates dictionary is None for GIFTI data."""
+    assert gifti_context.get_world_coords_dict() is None
+
+def test_get_coord_labels_dict(gifti_context):
+    """Test getting memoized GIFTI coordinate labels dictionary."""
+    labels = gifti_context.get_coord_labels_dict()
+    assert labels['left_coord_labels'] is gifti_context._state.left_coord_labels
+    assert labels['right_coord_labels'] is gifti_context._state.right_coord_labels
+    assert gifti_context.get_coord_labels_dict() is labels
+
 def test_get_viewer_metadata_nifti(nifti_context):
     """Test getting viewer metadata for NIFTI data."""
     metadata = nifti_context.get_viewer_metadata()
@@ -1,5 +1,7 @@
 """Tests for the DataManager singleton class."""
 
+import io
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -141,4 +143,15 @@ def test_save(mock_serialize):
     # Verify the context was serialized
     mock_serialize.assert_called_once()
     assert mock_serialize.call_args[0][0] is dm._contexts["main"]
-    assert result == b"serialized_data"
\ No newline at end of file
+    assert result == b"serialized_data"
+
+@patch.object(StateFile, 'serialize_to_file')
+def test_save_to_file(mock_serialize):
+    """Test saving a state file into a file object."""
+    dm = DataManager()
+    file = io.BytesIO()
+    
+    dm.save_to_file(file, "test.fvstate")
+    
+    # Verify the context was serialized into the file
+    mock_serialize.assert_called_once_with(dm._contexts["main"], file)
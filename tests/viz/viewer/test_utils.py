@@ -110,6 +110,19 @@ def test_package_nii_metadata_4d(mock_nifti_4d):
     assert all(k in metadata['slice_len'] for k in ['x', 'y', 'z'])
     assert all(metadata['slice_len'][k] == 10 for k in ['x', 'y', 'z'])
 
+def test_package_nii_metadata_float32():
+    """Test NIFTI metadata of float32 data read in its stored dtype"""
+    data = np.arange(4 * 5 * 6 * 3, dtype=np.float32).reshape(4, 5, 6, 3) - 10
+    img = nib.Nifti1Image(data, np.eye(4))
+
+    metadata = package_nii_metadata(img)
+
+    assert metadata['global_min'] == -10.0
+    assert metadata['global_max'] == float(data.max())
+    assert isinstance(metadata['global_min'], float)
+    assert metadata['slice_len'] == {'x': 4, 'y': 5, 'z': 6}
+    assert metadata['timepoints'] == [0, 1, 2]
+
 def test_apply_mask_nifti(mock_nifti_4d):
     """Test applying mask to 4D NIFTI image"""
     # Create mask
@@ -123,6 +136,7 @@ def test_apply_mask_nifti(mock_nifti_4d):
     # Verify output
     assert isinstance(masked_img, nib.Nifti1Image)
     assert masked_img.shape == mock_nifti_4d.shape
+    assert masked_img.dataobj.dtype == np.float32
     
     # Check masking for each timepoint
     masked_data = masked_img.get_fdata()
@@ -174,6 +188,18 @@ def test_get_coord_labels_nifti(mock_nifti_3d):
     assert labels[0, 0, 0] == "Voxel: 0, 0, 0"
     assert labels[1, 2, 3] == "Voxel: 1, 2, 3"
 
+
+def test_get_coord_labels_nifti_multi_digit():
+    """Test coordinate labels of indices with different numbers of digits"""
+    nii_img = nib.Nifti1Image(np.zeros((12, 3, 105), dtype=np.float32), np.eye(4))
+    labels = get_coord_labels_nifti(nii_img)
+
+    assert labels.shape == (12, 3, 105)
+    assert labels[11, 2, 104] == "Voxel: 11, 2, 104"
+    assert labels[9, 0, 5] == "Voxel: 9, 0, 5"
+    # labels are no wider than the longest label
+    assert labels.dtype == np.dtype('<U17')
+
 def test_get_precision():
     """Test precision calculation for slider step size"""
     assert get_precision(100) == 0